@@ -17,6 +17,7 @@
 import ast
 import logging
 import re
+import time
 from enum import Enum
 
 import pasta
@@ -24,11 +25,7 @@ from pasta.base import formatting as fmt
 
 from mindinsight.mindconverter.code_analysis import CodeAnalyzer
 from mindinsight.mindconverter.code_analysis import APIAnalysisSpec
-from mindinsight.mindconverter.config import ALL_MAPPING, F_LIST
-from mindinsight.mindconverter.config import NN_LIST
-from mindinsight.mindconverter.config import ALL_TORCH_APIS
-from mindinsight.mindconverter.config import ALL_2P_LIST
-from mindinsight.mindconverter.config import TENSOR_DOT_LIST
+from mindinsight.mindconverter import config
 from mindinsight.mindconverter.config import get_prompt_info
 from mindinsight.mindconverter.common.log import logger
 from mindinsight.mindconverter.common.exceptions import NodeTypeNotSupport
@@ -196,6 +193,7 @@ class AstEditVisitor(ast.NodeVisitor):
         self._forward_list = {}
         self._is_forward_function = False  # Used to allow access the visiting function forward attribute
         self._new_call_nodes = []  # Used to save new ast.call nodes
+        self._phase_time = {}  # key is phase name, value is elapsed time in seconds
 
     def process(self, ast_tree):
         """
@@ -206,20 +204,35 @@ class AstEditVisitor(ast.NodeVisitor):
         """
         self.__init__()
         self._tree = ast_tree
+        start = time.time()
+        # collect code analysis and forward call information in one traversal
+        forward_call = ForwardCall()
         self._code_analyzer = CodeAnalyzer()
-        self._code_analyzer.process(self._tree)
+        self._code_analyzer.process(self._tree, forward_call)
+        self._forward_list = forward_call.calls
+        self._phase_time['analyze'] = time.time() - start
 
-        self._forward_list = ForwardCall(self._tree).calls
+        start = time.time()
         # replace python function under nn.Module
         self._convert_api()
 
         # replace external reference statements
         self._convert_external_reference()
+        self._phase_time['convert'] = time.time() - start
 
     def get_logs(self):
         """Get conversion report."""
         return self._process_log.get_logs()
 
+    def get_phase_time(self):
+        """
+        Get elapsed time of each phase in conversion.
+
+        Returns:
+            dict, key is phase name, value is elapsed time in seconds.
+        """
+        return dict(self._phase_time)
+
     def _convert_cell(self, cell_scope):
         """
         Convert a PyTorch Module class into MindSpore Cell class.
@@ -529,7 +542,7 @@ class AstEditVisitor(ast.NodeVisitor):
             return False
 
         func_name = '.' + name_attributes[-1]
-        if func_name not in TENSOR_DOT_LIST:
+        if func_name not in config.TENSOR_DOT_LIST:
             return False
 
         extracted_api = []
@@ -551,7 +564,7 @@ class AstEditVisitor(ast.NodeVisitor):
                 if node_ref_name == ref_name:
                     real_ref = self._code_analyzer.external_references[ref_name]["external_ref_info"]
                     break
-            if real_ref and f"{real_ref.name}.{'.'.join(extracted_api)}" not in F_LIST:
+            if real_ref and f"{real_ref.name}.{'.'.join(extracted_api)}" not in config.F_LIST:
                 is_tensor_object = False
 
         return is_tensor_object
@@ -607,41 +620,16 @@ class AstEditVisitor(ast.NodeVisitor):
         if not is_tensor_obj_call:
             standard_api_call_name = self._get_api_whole_name(call_func_node, check_context)
 
-        if standard_api_call_name in ALL_TORCH_APIS:
+        if standard_api_call_name in config.ALL_TORCH_APIS:
             match_case = ApiMatchingEnum.API_FOUND
-            if (not is_forward and standard_api_call_name in NN_LIST) or \
-                    (is_forward and standard_api_call_name in ALL_2P_LIST):
+            if (not is_forward and standard_api_call_name in config.NN_LIST) or \
+                    (is_forward and standard_api_call_name in config.ALL_2P_LIST):
                 match_case = ApiMatchingEnum.API_MATCHED
         else:
             if standard_api_call_name and standard_api_call_name.startswith('torch.nn.init'):
                 match_case = ApiMatchingEnum.API_MATCHED
         return standard_api_call_name, match_case
 
-    @staticmethod
-    def _get_call_parameters_str(call_node):
-        """Get parameters string for a call node."""
-        if not isinstance(call_node, ast.Call):
-            raise NodeTypeNotSupport('It is not ast.Call node type.')
-        parameters_str = ''
-        call_str = pasta.dump(call_node)
-        call_name = pasta.dump(call_node.func)
-        last_parameter_str = ''
-
-        if call_node.args:
-            last_parameter_str = pasta.dump(call_node.args[-1])
-        if call_node.keywords:
-            last_parameter_str = pasta.dump(call_node.keywords[-1])
-        if last_parameter_str:
-            left_parenthesis_pos = call_str.find(call_name) + len(call_name)
-            # call is like abc.call(a, b,), last parameter is b,
-            # but parameters string must have last ',' character after the last parameter b.
-            last_parameter_pos = call_str.rfind(last_parameter_str) + len(last_parameter_str)
-            right_parenthesis_pos = call_str.find(')', last_parameter_pos)
-
-            # parameters start pos must skip '(' character for calling.
-            parameters_str = call_str[left_parenthesis_pos + 1:right_parenthesis_pos]
-        return parameters_str
-
     def _get_api_whole_name(self, call_func_node, check_context=True):
         """
         Get the whole name for the call node.
@@ -701,25 +689,22 @@ class AstEditVisitor(ast.NodeVisitor):
         code = pasta.dump(call_node)
         api_call_name = pasta.dump(call_node.func)
 
-        # find full api expected to be converted. eg:expr="nn.Conv2d(1,2,3)" args_str="(1,2,3)"
-        args_str = '(' + self._get_call_parameters_str(call_node) + ')'
-
         try:
             api_name, _ = self._infer_api_name(call_node.func, check_context)
             standard_api_call_name = api_call_name
             if api_name != api_call_name:
                 # api name .view inferred from out.view, split tensor object name is out
                 tensor_obj_name = api_call_name[:-len(api_name)]
-                map_helper = ALL_MAPPING[api_name]
-                new_code = map_helper.convert(tensor_obj_name, args_str)
+                map_helper = config.ALL_MAPPING[api_name]
+                new_code = map_helper.convert_call_node(tensor_obj_name, call_node)
             else:
                 # change to external ref name
                 # e.g., mm.ReLU will be changed to nn.ReLU if 'import torch.nn as mm' in script.
                 if check_context and not self._code_analyzer.is_standard_external_ref:
                     standard_api_call_name = self._mapping_standard_api_name(api_name)
 
-                map_helper = ALL_MAPPING[standard_api_call_name]
-                new_code = map_helper.convert(standard_api_call_name, args_str)
+                map_helper = config.ALL_MAPPING[standard_api_call_name]
+                new_code = map_helper.convert_call_node(standard_api_call_name, call_node)
         except KeyError:
             return code
 
@@ -752,7 +737,7 @@ class AstEditVisitor(ast.NodeVisitor):
         warning_info = get_prompt_info(matched_api_name)
         if warning_info is None:
             warning_info = ''
-        if matched_api_name in ALL_MAPPING:
+        if matched_api_name in config.ALL_MAPPING:
             logger.info("Line %3d start converting API: %s", node.lineno, api_name)
             new_code = self.mapping_api(node)
             if new_code != code:
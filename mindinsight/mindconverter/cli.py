@@ -22,7 +22,9 @@ from mindinsight.mindconverter.converter import main
 from mindinsight.mindconverter.graph_based_converter.common.utils import get_framework_type
 from mindinsight.mindconverter.graph_based_converter.constant import ARGUMENT_LENGTH_LIMIT, \
     ARGUMENT_NUM_LIMIT, ARGUMENT_LEN_LIMIT, FrameworkType
-from mindinsight.mindconverter.graph_based_converter.framework import main_graph_base_converter
+from mindinsight.mindconverter.graph_based_converter.framework import main_graph_base_converter, \
+    main_graph_base_converter_batch
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher import SearchBudget
 
 from mindinsight.mindconverter.common.log import logger as log, logger_console as log_console
 
@@ -169,10 +171,7 @@ class InFileAction(argparse.Action):
         if not os.path.exists(outfile_dir):
             parser_in.error(f'{option_string} {outfile_dir} not exists')
 
-        if not os.path.isfile(outfile_dir):
-            parser_in.error(f'{option_string} {outfile_dir} is not a file')
-
-        if not os.path.basename(outfile_dir).endswith("py"):
+        if os.path.isfile(outfile_dir) and not os.path.basename(outfile_dir).endswith("py"):
             parser_in.error(f'{option_string} {outfile_dir} is not a valid python file')
 
         setattr(namespace, self.dest, outfile_dir)
@@ -208,6 +207,73 @@ class ModelFileAction(argparse.Action):
         setattr(namespace, self.dest, outfile_dir)
 
 
+class ModelListAction(argparse.Action):
+    """Model list action class definition."""
+
+    def __call__(self, parser_in, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser_in (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (object): Argument values with type depending on argument definition.
+            option_string (str): Optional string for specific argument name. Default: None.
+        """
+        ArgsCheck.check_repeated(namespace, self.dest, self.default, option_string, parser_in)
+
+        outfile_dir = FileDirAction.check_path(parser_in, values, option_string)
+        if not os.path.exists(outfile_dir):
+            parser_in.error(f'{option_string} {outfile_dir} not exists')
+
+        if not os.path.isfile(outfile_dir):
+            parser_in.error(f'{option_string} {outfile_dir} is not a file')
+
+        setattr(namespace, self.dest, outfile_dir)
+
+
+class JobsAction(argparse.Action):
+    """Jobs action class definition."""
+
+    def __call__(self, parser_in, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser_in (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (int): Argument values with type depending on argument definition.
+            option_string (str): Optional string for specific argument name. Default: None.
+        """
+        ArgsCheck.check_repeated(namespace, self.dest, self.default, option_string, parser_in)
+
+        if values < 1:
+            parser_in.error(f"{option_string} {values} should be a positive integer.")
+
+        setattr(namespace, self.dest, values)
+
+
+class SearchBudgetAction(argparse.Action):
+    """Search budget action class definition."""
+
+    def __call__(self, parser_in, namespace, values, option_string=None):
+        """
+        Inherited __call__ method from argparse.Action.
+
+        Args:
+            parser_in (ArgumentParser): Passed-in argument parser.
+            namespace (Namespace): Namespace object to hold arguments.
+            values (Union[int, float]): Argument values with type depending on argument definition.
+            option_string (str): Optional string for specific argument name. Default: None.
+        """
+        ArgsCheck.check_repeated(namespace, self.dest, self.default, option_string, parser_in)
+
+        if values <= 0:
+            parser_in.error(f"{option_string} {values} should be a positive number.")
+
+        setattr(namespace, self.dest, values)
+
+
 class LogFileAction(argparse.Action):
     """Log file action class definition."""
 
@@ -316,8 +382,8 @@ parser.add_argument(
     required=False,
     default=None,
     help="""
-            Specify path for script file to use AST schema to 
-            do script conversation.
+            Specify path for script file or directory of script 
+            files to use AST schema to do script conversation.
         """)
 
 parser.add_argument(
@@ -332,6 +398,31 @@ parser.add_argument(
             use AST schema as default.
         """)
 
+parser.add_argument(
+    '--model_list',
+    type=str,
+    action=ModelListAction,
+    required=False,
+    default=None,
+    help="""
+            Optional, a json file which lists models to be converted 
+            in one process, each item declares `model_file`, `shape`, 
+            `input_nodes`, `output_nodes` and optional `output`, `report`. 
+            Usage: --model_list models.json
+        """)
+
+parser.add_argument(
+    '--jobs',
+    type=int,
+    action=JobsAction,
+    required=False,
+    default=1,
+    help="""
+            Optional, number of worker processes used to convert 
+            script files in `--in_file` or models in `--model_list`. 
+            Default is 1.
+        """)
+
 parser.add_argument(
     '--shape',
     type=str,
@@ -404,6 +495,65 @@ parser.add_argument(
             Usage: --project_path ~/script_file/
         """)
 
+parser.add_argument(
+    '--beam_width',
+    type=int,
+    action=SearchBudgetAction,
+    required=False,
+    default=None,
+    help="""
+            Optional, max number of patterns expanded on each 
+            path when searching sub-graphs in graph based schema. 
+            Default is no limit.
+        """)
+
+parser.add_argument(
+    '--max_search_depth',
+    type=int,
+    action=SearchBudgetAction,
+    required=False,
+    default=None,
+    help="""
+            Optional, max number of sub-graphs replaced on each 
+            path when searching sub-graphs. Default is 16 for 
+            multi-inputs models, otherwise 8.
+        """)
+
+parser.add_argument(
+    '--max_search_paths',
+    type=int,
+    action=SearchBudgetAction,
+    required=False,
+    default=None,
+    help="""
+            Optional, max number of paths expanded when searching 
+            sub-graphs, the best path found so far is used once 
+            exceeded. Default is no limit.
+        """)
+
+parser.add_argument(
+    '--search_time_limit',
+    type=float,
+    action=SearchBudgetAction,
+    required=False,
+    default=None,
+    help="""
+            Optional, wall-clock limit in seconds of searching 
+            sub-graphs, the best path found so far is used once 
+            exceeded. Default is no limit.
+        """)
+
+parser.add_argument(
+    '--no_format',
+    action='store_true',
+    required=False,
+    default=False,
+    help="""
+            Optional, skip formatting generated scripts with yapf 
+            in graph based schema, which saves conversion time of 
+            large models. Default is formatting.
+        """)
+
 
 def cli_entry():
     """Entry point for mindconverter CLI."""
@@ -422,14 +572,21 @@ def cli_entry():
     if args.report is None:
         args.report = args.output
     os.makedirs(args.report, mode=mode, exist_ok=True)
+    search_budget = SearchBudget(beam_width=args.beam_width,
+                                 max_depth=args.max_search_depth,
+                                 max_expanded_paths=args.max_search_paths,
+                                 time_limit=args.search_time_limit)
     _run(args.in_file, args.model_file,
          args.shape,
          args.input_nodes, args.output_nodes,
          args.output, args.report,
-         args.project_path)
+         args.project_path,
+         args.model_list, args.jobs,
+         search_budget, args.no_format)
 
 
-def _run(in_files, model_file, shape, input_nodes, output_nodes, out_dir, report, project_path):
+def _run(in_files, model_file, shape, input_nodes, output_nodes, out_dir, report, project_path,
+         model_list=None, jobs=1, search_budget=None, no_format=False):
     """
     Run converter command.
 
@@ -442,22 +599,29 @@ def _run(in_files, model_file, shape, input_nodes, output_nodes, out_dir, report
         out_dir (str): The output directory to save converted file.
         report (str): The report file path.
         project_path(str): Pytorch scripts project path.
+        model_list(str): The json file lists models to convert on graph based schema.
+        jobs(int): Number of worker processes used to convert script files or models in model list.
+        search_budget(SearchBudget): Budget of sub-graph search in graph based schema.
+        no_format(bool): Whether to skip formatting generated scripts in graph based schema.
     """
     if in_files:
         files_config = {
             'root_path': in_files,
             'in_files': [],
             'outfile_dir': out_dir,
-            'report_dir': report if report else out_dir
+            'report_dir': report if report else out_dir,
+            'jobs': jobs
         }
 
         if os.path.isfile(in_files):
             files_config['root_path'] = os.path.dirname(in_files)
             files_config['in_files'] = [in_files]
         else:
-            for root_dir, _, files in os.walk(in_files):
-                for file in files:
-                    files_config['in_files'].append(os.path.join(root_dir, file))
+            for root_dir, sub_dirs, files in os.walk(in_files):
+                sub_dirs.sort()
+                for file in sorted(files):
+                    if file.endswith(".py"):
+                        files_config['in_files'].append(os.path.join(root_dir, file))
         main(files_config)
         log_console.info("\n")
         log_console.info("MindConverter: conversion is completed.")
@@ -470,7 +634,9 @@ def _run(in_files, model_file, shape, input_nodes, output_nodes, out_dir, report
             'input_nodes': input_nodes,
             'output_nodes': output_nodes,
             'outfile_dir': out_dir,
-            'report_dir': report if report else out_dir
+            'report_dir': report if report else out_dir,
+            'search_budget': search_budget,
+            'no_format': no_format
         }
         if project_path:
             paths = sys.path
@@ -481,8 +647,26 @@ def _run(in_files, model_file, shape, input_nodes, output_nodes, out_dir, report
         log_console.info("\n")
         log_console.info("MindConverter: conversion is completed.")
         log_console.info("\n")
+
+    elif model_list:
+        batch_config = {
+            'model_list': model_list,
+            'jobs': jobs,
+            'outfile_dir': out_dir,
+            'report_dir': report if report else out_dir,
+            'search_budget': search_budget,
+            'no_format': no_format
+        }
+        if project_path:
+            paths = sys.path
+            if project_path not in paths:
+                sys.path.append(project_path)
+
+        main_graph_base_converter_batch(batch_config)
+        log_console.info("MindConverter: batch conversion is completed.")
+        log_console.info("\n")
     else:
-        error_msg = "`--in_file` and `--model_file` should be set at least one."
+        error_msg = "`--in_file`, `--model_file` and `--model_list` should be set at least one."
         error = FileNotFoundError(error_msg)
         log.error(str(error))
         log_console.error("\n")
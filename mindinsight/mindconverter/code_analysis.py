@@ -88,6 +88,10 @@ class CodeAnalyzer(ast.NodeVisitor):
 
     def __init__(self):
         self._stack = []  # Used to easily access the parent node
+        # Used to collect forward calls in the same traversal, type is ForwardCall
+        self._forward_call = None
+        # Whether visiting the sub nodes of a call.
+        self._is_in_call = False
         self._external_references = {}
         self._is_standard_external_ref = True
         self._root_scope = None
@@ -120,17 +124,22 @@ class CodeAnalyzer(ast.NodeVisitor):
         return {"functions": self._network_functions,
                 "cell": self._network_classes}
 
-    def process(self, ast_tree):
+    def process(self, ast_tree, forward_call=None):
         """
         Start to analyze the code.
 
         Args:
             ast_tree (AST): The root node of the source code.
+            forward_call (ForwardCall): If given, forward calls are also collected into it while analyzing,
+                instead of traversing the tree again. Default: None.
         """
         self.__init__()
+        self._forward_call = forward_call
         self._root_scope = scope.analyze(ast_tree)
         self._pre_process()
         self.visit(ast_tree)
+        if self._forward_call is not None:
+            self._forward_call.resolve()
         if not self._network_classes:
             msg = "model definition not be found."
             raise ScriptNotSupport(msg)
@@ -326,7 +335,12 @@ class CodeAnalyzer(ast.NodeVisitor):
             if self._is_ref_convertible_imports(base):
                 self._network_classes[self._root_scope.lookup_scope(node)] = []
 
-        self.generic_visit(node)
+        if self._forward_call is None:
+            self.generic_visit(node)
+        else:
+            self._forward_call.enter_class(node)
+            self.generic_visit(node)
+            self._forward_call.exit_class()
 
     def _update_external_when_visit(self, node):
         """Update external reference when visiting import and import from statements."""
@@ -350,8 +364,14 @@ class CodeAnalyzer(ast.NodeVisitor):
         if self._functions_stack and self._is_ref_convertible_imports(node.func):
             self._update_convertible_functions(self._functions_stack[-1])
             is_in_network_function = True
+        if self._forward_call is not None and not self._is_in_call:
+            # ForwardCall visits the outermost call and calls nested in it by itself,
+            # since sub calls in network functions are not visited here.
+            self._forward_call.visit(node)
         if not is_in_network_function:
+            self._is_in_call, is_in_call = True, self._is_in_call
             self.generic_visit(node)
+            self._is_in_call = is_in_call
 
     def visit_FunctionDef(self, node):
         """Callback function when visit AST tree"""
@@ -361,7 +381,12 @@ class CodeAnalyzer(ast.NodeVisitor):
             self._update_convertible_functions(node)
 
         self._functions_stack.append(node)
-        self.generic_visit(node)
+        if self._forward_call is None:
+            self.generic_visit(node)
+        else:
+            self._forward_call.enter_function(node)
+            self.generic_visit(node)
+            self._forward_call.exit_function()
         self._functions_stack.pop()
 
     def get_name(self, node):
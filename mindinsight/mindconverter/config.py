@@ -18,11 +18,12 @@ from collections import OrderedDict
 from importlib import import_module
 import json
 import os
+from functools import lru_cache
 
 import pasta
 
 from mindinsight.mindconverter.common.log import logger
-from mindinsight.mindconverter.common.exceptions import CodeSyntaxError
+from mindinsight.mindconverter.common.exceptions import CodeSyntaxError, NodeTypeNotSupport
 
 REQUIRED = 'REQUIRED'
 UNREQUIRED = 'UNREQUIRED'
@@ -81,11 +82,44 @@ class APIPt:
         except SyntaxError as parse_error:
             raise CodeSyntaxError("can't parse code:\n{}".format(args_str)) from parse_error
 
+        return self._parse_call_args(call_name, call_node, args_str[1:-1])
+
+    def parse_call_node(self, call_name: str, call_node: ast.Call):
+        """
+        Parse args from the ast.Call node of the call, without parsing the source code again.
+
+        Args:
+            call_name (str): str of the call function, etc.
+            call_node (ast.Call): The call node parsed from script.
+
+        Returns:
+            OrderedDict, all args parsed.
+
+        Raises:
+            NodeTypeNotSupport: If call_node is not type of ast.Call.
+            ValueError: If the args of call_node not valid.
+        """
+        if not isinstance(call_node, ast.Call):
+            raise NodeTypeNotSupport("It is not ast.Call node.")
+        return self._parse_call_args(call_name, call_node)
+
+    def _parse_call_args(self, call_name, call_node, args_str=None):
+        """
+        Parse args of call node.
+
+        Args:
+            call_name (str): str of the call function, etc.
+            call_node (ast.Call): The call node.
+            args_str (str): str of args without parentheses, dumped from call_node if not given. Default: None.
+
+        Returns:
+            OrderedDict, all args parsed.
+        """
         # regard all actual parameter as one parameter
         if len(self.params) == 1:
             k = list(self.params.keys())[0]
             if k.startswith('*'):
-                value = args_str[1:-1]
+                value = args_str if args_str is not None else get_call_parameters_str(call_node)
                 return OrderedDict([(k, value), ("call_name", call_name)])
 
         args = OrderedDict()
@@ -99,8 +133,7 @@ class APIPt:
                 logger.debug("Find *%s", arg.value.id)
                 args['*'] = arg.value.id
             else:
-                # remove \n
-                args[next(param_iter)] = pasta.dump(arg).strip()
+                args[next(param_iter)] = self._dump_arg(arg)
 
         # params which name is assigned
         for keyword in call_node.keywords:
@@ -108,12 +141,29 @@ class APIPt:
                 logger.info("Find **%s", keyword.value.id)
                 args['**'] = keyword.value.id
             else:
-                # remove \n
-                args[keyword.arg] = pasta.dump(keyword.value).strip()
+                args[keyword.arg] = self._dump_arg(keyword.value)
 
         args["call_name"] = call_name
         return args
 
+    @staticmethod
+    def _dump_arg(arg_node):
+        """
+        Dump source of the arg node in one line.
+
+        Args:
+            arg_node (ast.AST): The arg node.
+
+        Returns:
+            str, source of the arg.
+        """
+        # remove \n
+        arg_str = pasta.dump(arg_node).strip()
+        if "\n" in arg_str:
+            # arg written in multiple lines is formatted again.
+            arg_str = pasta.dump(ast.parse("(" + arg_str + "\n)", mode="eval").body).strip()
+        return arg_str
+
 
 class APIMs(APIPt):
     """API for MindSpore"""
@@ -234,7 +284,33 @@ class MappingHelper:
         """
         # all value for args_pt is str
         args_pt = self.pt_api.parse_args(call_name_pt, args_str_pt)
+        return self._convert_args(args_pt)
+
+    def convert_call_node(self, call_name_pt: str, call_node: ast.Call):
+        """
+        Convert the call node to MindSpore code sentence.
 
+        Args:
+            call_name_pt (str): str of the call function, etc.
+            call_node (ast.Call): The call node parsed from script.
+
+        Returns:
+            str, converted code sentence for MindSpore.
+        """
+        # all value for args_pt is str
+        args_pt = self.pt_api.parse_call_node(call_name_pt, call_node)
+        return self._convert_args(args_pt)
+
+    def _convert_args(self, args_pt):
+        """
+        Generate MindSpore code sentence from args parsed.
+
+        Args:
+            args_pt (OrderedDict): Args parsed from APIPt.
+
+        Returns:
+            str, converted code sentence for MindSpore.
+        """
         # all value for args_ms is str
         explicit_map = self.gen_explicit_map(self.pt_api.params, args_pt)
         args_ms = self.ms_api.create_args(self.pt_api.params, args_pt, self.ms2pt_mapping, explicit_map)
@@ -252,6 +328,39 @@ class MappingHelper:
         return expr_ms
 
 
+def get_call_parameters_str(call_node):
+    """
+    Get parameters string for a call node.
+
+    Args:
+        call_node (ast.Call): The call node.
+
+    Returns:
+        str, parameters string without parentheses.
+    """
+    if not isinstance(call_node, ast.Call):
+        raise NodeTypeNotSupport('It is not ast.Call node type.')
+    parameters_str = ''
+    call_str = pasta.dump(call_node)
+    call_name = pasta.dump(call_node.func)
+    last_parameter_str = ''
+
+    if call_node.args:
+        last_parameter_str = pasta.dump(call_node.args[-1])
+    if call_node.keywords:
+        last_parameter_str = pasta.dump(call_node.keywords[-1])
+    if last_parameter_str:
+        left_parenthesis_pos = call_str.find(call_name) + len(call_name)
+        # call is like abc.call(a, b,), last parameter is b,
+        # but parameters string must have last ',' character after the last parameter b.
+        last_parameter_pos = call_str.rfind(last_parameter_str) + len(last_parameter_str)
+        right_parenthesis_pos = call_str.find(')', last_parameter_pos)
+
+        # parameters start pos must skip '(' character for calling.
+        parameters_str = call_str[left_parenthesis_pos + 1:right_parenthesis_pos]
+    return parameters_str
+
+
 def get_ms_api(ms_api_info):
     """
     Get APIMs instance from ms_api_info.
@@ -342,7 +451,7 @@ def get_corresponding_ms_name(pt_name):
         ValueError， if get shortened form of MindSpore name not starts with `P` or 'nn', which means it is wrong in
         the mappings file.
     """
-    helper = ALL_MAPPING.get(pt_name)
+    helper = get_all_mapping().get(pt_name)
     if helper is None:
         return None
     ms_name = helper.ms_api.name
@@ -366,63 +475,210 @@ def get_prompt_info(pt_name):
     Returns:
         str, prompt info on the op, None if no prompt info for the op.
     """
-    prompt_dict = {**UNSUPPORTED_WARN_INFOS, **SUPPORTED_WARN_INFOS}
-    return prompt_dict.get(pt_name)
+    return _get_prompt_infos().get(pt_name)
+
+
+@lru_cache(maxsize=None)
+def _get_prompt_infos():
+    """Get prompt infos of both unsupported and supported apis."""
+    return {**UNSUPPORTED_WARN_INFOS, **SUPPORTED_WARN_INFOS}
 
 
 # ---------------------------- mappings ----------------------------
 NN_MAPPING_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'mappings/nn_mappings.json'))
-NN_MAPPING = get_mapping_from_file(NN_MAPPING_PATH)
-# update to add key with full api_name, which starts with 'torch.nn.'
-NN_MAPPING.update({"torch." + k: v for k, v in NN_MAPPING.items()})
-
 F_MAPPING_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'mappings/f_mappings.json'))
-F_MAPPING = get_mapping_from_file(F_MAPPING_PATH)
-# update to add key starts with 'nn.functional.'
-NN_FUNCTIONAL_D = {"nn.functional." + k[len('F.'):]: v for k, v in F_MAPPING.items()}
-# update to add key starts with 'torch.nn.functional.'
-TORCH_NN_FUNCTIONAL_D = {"torch.nn.functional." + k[len('F.'):]: v for k, v in F_MAPPING.items()}
-F_MAPPING.update(NN_FUNCTIONAL_D)
-F_MAPPING.update(TORCH_NN_FUNCTIONAL_D)
-
 TORCH_DOT_MAPPING_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'mappings/torch_dot_mappings.json'))
-TORCH_DOT_MAPPING = get_mapping_from_file(TORCH_DOT_MAPPING_PATH)
-
 TENSOR_DOT_MAPPING_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'mappings/tensor_dot_mappings.json'))
-TENSOR_DOT_MAPPING = get_mapping_from_file(TENSOR_DOT_MAPPING_PATH)
-
-ALL_MAPPING = {**NN_MAPPING, **F_MAPPING, **TORCH_DOT_MAPPING, **TENSOR_DOT_MAPPING}
 
 # ---------------------------- api list support or not support ----------------------------
 NN_LIST_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'ops', 'nn_list.json'))
-NN_LIST = load_json_file(NN_LIST_PATH)
-NN_LIST += ["torch." + name for name in NN_LIST]
-NN_SUPPORTED = [x for x in NN_LIST if x in ALL_MAPPING]
-NN_UNSUPPORTED = [x for x in NN_LIST if x not in ALL_MAPPING]
-
 F_LIST_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'ops', 'f_list.json'))
-F_LIST = load_json_file(F_LIST_PATH)
-F_LIST += ["F." + name[len("torch.nn.functional."):] for name in F_LIST] + \
-          [name[len("torch."):] for name in F_LIST]
-F_SUPPORTED = [x for x in F_LIST if x in ALL_MAPPING]
-F_UNSUPPORTED = [x for x in F_LIST if x not in ALL_MAPPING]
-
 TORCH_DOT_LIST_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'ops', 'torch_dot_list.json'))
-TORCH_DOT_LIST = load_json_file(TORCH_DOT_LIST_PATH)
+TENSOR_DOT_LIST_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'ops', 'tensor_dot_list.json'))
 
-TORCH_DOT_SUPPORTED = [x for x in TORCH_DOT_LIST if x in ALL_MAPPING]
-TORCH_DOT_UNSUPPORTED = [x for x in TORCH_DOT_LIST if x not in ALL_MAPPING]
 
-TENSOR_DOT_LIST_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'ops', 'tensor_dot_list.json'))
-TENSOR_DOT_LIST = load_json_file(TENSOR_DOT_LIST_PATH)
+@lru_cache(maxsize=None)
+def get_nn_mapping():
+    """
+    Get mapping of torch.nn apis, which is loaded on first use.
+
+    Returns:
+        dict, key is op name, value is a relevant instance of MappingHelper.
+    """
+    nn_mapping = get_mapping_from_file(NN_MAPPING_PATH)
+    # update to add key with full api_name, which starts with 'torch.nn.'
+    nn_mapping.update({"torch." + k: v for k, v in nn_mapping.items()})
+    return nn_mapping
+
+
+@lru_cache(maxsize=None)
+def get_f_mapping():
+    """
+    Get mapping of torch.nn.functional apis, which is loaded on first use.
+
+    Returns:
+        dict, key is op name, value is a relevant instance of MappingHelper.
+    """
+    f_mapping = get_mapping_from_file(F_MAPPING_PATH)
+    # update to add key starts with 'nn.functional.'
+    nn_functional_d = {"nn.functional." + k[len('F.'):]: v for k, v in f_mapping.items()}
+    # update to add key starts with 'torch.nn.functional.'
+    torch_nn_functional_d = {"torch.nn.functional." + k[len('F.'):]: v for k, v in f_mapping.items()}
+    f_mapping.update(nn_functional_d)
+    f_mapping.update(torch_nn_functional_d)
+    return f_mapping
+
+
+@lru_cache(maxsize=None)
+def get_torch_dot_mapping():
+    """
+    Get mapping of torch.xxx apis, which is loaded on first use.
+
+    Returns:
+        dict, key is op name, value is a relevant instance of MappingHelper.
+    """
+    return get_mapping_from_file(TORCH_DOT_MAPPING_PATH)
+
+
+@lru_cache(maxsize=None)
+def get_tensor_dot_mapping():
+    """
+    Get mapping of tensor.xxx apis, which is loaded on first use.
+
+    Returns:
+        dict, key is op name, value is a relevant instance of MappingHelper.
+    """
+    return get_mapping_from_file(TENSOR_DOT_MAPPING_PATH)
+
+
+@lru_cache(maxsize=None)
+def get_all_mapping():
+    """
+    Get mapping of all supported apis.
+
+    Returns:
+        dict, key is op name, value is a relevant instance of MappingHelper.
+    """
+    return {**get_nn_mapping(), **get_f_mapping(), **get_torch_dot_mapping(), **get_tensor_dot_mapping()}
+
+
+@lru_cache(maxsize=None)
+def get_nn_list():
+    """
+    Get names of torch.nn apis, which is loaded on first use.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    nn_list = load_json_file(NN_LIST_PATH)
+    return frozenset(nn_list + ["torch." + name for name in nn_list])
+
+
+@lru_cache(maxsize=None)
+def get_f_list():
+    """
+    Get names of torch.nn.functional apis, which is loaded on first use.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    f_list = load_json_file(F_LIST_PATH)
+    return frozenset(f_list +
+                     ["F." + name[len("torch.nn.functional."):] for name in f_list] +
+                     [name[len("torch."):] for name in f_list])
+
+
+@lru_cache(maxsize=None)
+def get_torch_dot_list():
+    """
+    Get names of torch.xxx apis, which is loaded on first use.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    return frozenset(load_json_file(TORCH_DOT_LIST_PATH))
+
+
+@lru_cache(maxsize=None)
+def get_tensor_dot_list():
+    """
+    Get names of tensor.xxx apis, which is loaded on first use.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    return frozenset(load_json_file(TENSOR_DOT_LIST_PATH))
+
+
+@lru_cache(maxsize=None)
+def get_all_2p_list():
+    """
+    Get names of apis which could be called in forward.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    return get_f_list() | get_torch_dot_list() | get_tensor_dot_list()
+
+
+@lru_cache(maxsize=None)
+def get_all_torch_apis():
+    """
+    Get names of all torch apis.
+
+    Returns:
+        frozenset[str], api names.
+    """
+    return get_nn_list() | get_all_2p_list()
+
+
+def _supported(api_list):
+    """Get apis in the given list which have mapping."""
+    all_mapping = get_all_mapping()
+    return frozenset(x for x in api_list if x in all_mapping)
+
+
+def _unsupported(api_list):
+    """Get apis in the given list which have no mapping."""
+    all_mapping = get_all_mapping()
+    return frozenset(x for x in api_list if x not in all_mapping)
+
+
+# Module attributes which are evaluated on first access, to avoid loading json files when importing.
+_LAZY_ATTRIBUTES = {
+    "NN_MAPPING": get_nn_mapping,
+    "F_MAPPING": get_f_mapping,
+    "TORCH_DOT_MAPPING": get_torch_dot_mapping,
+    "TENSOR_DOT_MAPPING": get_tensor_dot_mapping,
+    "ALL_MAPPING": get_all_mapping,
+    "NN_LIST": get_nn_list,
+    "NN_SUPPORTED": lambda: _supported(get_nn_list()),
+    "NN_UNSUPPORTED": lambda: _unsupported(get_nn_list()),
+    "F_LIST": get_f_list,
+    "F_SUPPORTED": lambda: _supported(get_f_list()),
+    "F_UNSUPPORTED": lambda: _unsupported(get_f_list()),
+    "TORCH_DOT_LIST": get_torch_dot_list,
+    "TORCH_DOT_SUPPORTED": lambda: _supported(get_torch_dot_list()),
+    "TORCH_DOT_UNSUPPORTED": lambda: _unsupported(get_torch_dot_list()),
+    "TENSOR_DOT_LIST": get_tensor_dot_list,
+    "TENSOR_DOT_SUPPORTED": lambda: _supported(get_tensor_dot_list()),
+    "TENSOR_DOT_UNSUPPORTED": lambda: _unsupported(get_tensor_dot_list()),
+    "ALL_2P_LIST": get_all_2p_list,
+    "ALL_TORCH_APIS": get_all_torch_apis,
+    "ALL_SUPPORTED": lambda: _supported(get_all_torch_apis()),
+    "ALL_UNSUPPORTED": lambda: _unsupported(get_all_torch_apis()),
+}
+
 
-TENSOR_DOT_SUPPORTED = [x for x in TENSOR_DOT_LIST if x in ALL_MAPPING]
-TENSOR_DOT_UNSUPPORTED = [x for x in TENSOR_DOT_LIST if x not in ALL_MAPPING]
+def __getattr__(name):
+    """Load mappings and api lists on first access of the module attribute."""
+    loader = _LAZY_ATTRIBUTES.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = loader()
+    globals()[name] = value
+    return value
 
-ALL_2P_LIST = F_LIST + TORCH_DOT_LIST + TENSOR_DOT_LIST
-ALL_TORCH_APIS = NN_LIST + F_LIST + TORCH_DOT_LIST + TENSOR_DOT_LIST
-ALL_SUPPORTED = NN_SUPPORTED + F_SUPPORTED + TORCH_DOT_SUPPORTED + TENSOR_DOT_SUPPORTED
-ALL_UNSUPPORTED = NN_UNSUPPORTED + F_UNSUPPORTED + TORCH_DOT_UNSUPPORTED + TENSOR_DOT_UNSUPPORTED
 
 UNSUPPORTED_WARN_INFOS = {
     "nn.AdaptiveAvgPool2d": "Maybe could convert to mindspore.ops.operations.ReduceMean.",
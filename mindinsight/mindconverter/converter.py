@@ -13,15 +13,24 @@
 # limitations under the License.
 # ============================================================================
 """converter module"""
+import hashlib
+import json
 import os
 import stat
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pasta
 
 from mindinsight.mindconverter.common.exceptions import ScriptNotSupport
-from mindinsight.mindconverter.common.log import logger
+from mindinsight.mindconverter.common.log import logger, logger_console as log_console
 from mindinsight.mindconverter.ast_edits import AstEditVisitor
 
+# Records source hash of each converted file in output dir, to skip unchanged files in next conversion.
+MANIFEST_FILE = ".mindconverter_manifest.json"
+# Reports of all files converted at once, merged in order of input files.
+MERGED_REPORT_FILE = "conversion_report.txt"
+
 
 class Converter:
     """Convert class"""
@@ -51,8 +60,10 @@ class Converter:
         with open(infile, 'r') as file:
             content = ''.join(file.readlines())
 
+        start = time.time()
         self._infile = infile
         self._tree = pasta.parse(content)
+        phase_time = {'parse': time.time() - start}
         self._report.clear()
         try:
             logger.info("Script file is %s", infile)
@@ -60,12 +71,17 @@ class Converter:
             self._report.append('[Start Convert]')
             self._ast_editor = AstEditVisitor()
             self._ast_editor.process(self._tree)
+            phase_time.update(self._ast_editor.get_phase_time())
             self._report.extend(self._ast_editor.get_logs())
+
+            start = time.time()
+            script = pasta.dump(self._tree)
+            script = adjust_mindspore_import_position(script)
+            phase_time['dump'] = time.time() - start
+            self._report.append(_format_phase_time(phase_time))
             self._report.append('[Convert Over]')
             dest_file = os.path.join(output_dir, os.path.basename(infile))
             with os.fdopen(os.open(dest_file, self.flags, self.modes), 'w') as file:
-                script = pasta.dump(self._tree)
-                script = adjust_mindspore_import_position(script)
                 file.write(script)
             logger.info("Convert success. Result is wrote to %s.", dest_file)
         except ScriptNotSupport as error:
@@ -77,7 +93,7 @@ class Converter:
             raise error
         finally:
             if self._report:
-                dest_report_file = os.path.join(report_dir, f"report_of_{os.path.basename(infile).split('.')[0]}.txt")
+                dest_report_file = _get_report_file(infile, report_dir)
                 with os.fdopen(os.open(dest_report_file, self.flags, self.modes), 'a') as file:
                     file.write('\n'.join(self._report))
                 logger.info("Convert report is saved in %s", dest_report_file)
@@ -187,14 +203,230 @@ def _path_split(file):
     return [name]
 
 
+def _format_phase_time(phase_time):
+    """
+    Format elapsed time of conversion phases as a line of report.
+
+    Args:
+        phase_time (dict): Key is phase name, value is elapsed time in seconds.
+
+    Returns:
+        str, the report line.
+    """
+    phases = ', '.join(f"{phase}: {cost:.3f}s" for phase, cost in phase_time.items())
+    return f"[Timing] {phases}, total: {sum(phase_time.values()):.3f}s."
+
+
+def _get_report_file(infile, report_dir):
+    """
+    Get path of the report file of a script.
+
+    Args:
+        infile (str): The script to convert.
+        report_dir (str): The path to save report file.
+
+    Returns:
+        str, path of the report file.
+    """
+    return os.path.join(report_dir, f"report_of_{os.path.basename(infile).split('.')[0]}.txt")
+
+
+def _get_source_hash(infile):
+    """
+    Get hash of script content.
+
+    Args:
+        infile (str): The script file.
+
+    Returns:
+        str, sha256 of the content.
+    """
+    with open(infile, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _load_manifest(manifest_file):
+    """
+    Load source hashes of converted files.
+
+    Args:
+        manifest_file (str): The manifest file path.
+
+    Returns:
+        dict, key is path of converted file relative to root path, value is source hash.
+    """
+    if not os.path.isfile(manifest_file):
+        return dict()
+    try:
+        with open(manifest_file, 'r') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        logger.warning("Manifest %s can not be loaded, all files will be converted.", manifest_file)
+        return dict()
+    return manifest if isinstance(manifest, dict) else dict()
+
+
+def _replace_file(file_path, write_func):
+    """
+    Write a temporary file, then replace the file with it.
+
+    Args:
+        file_path (str): The file path.
+        write_func (Callable): Function to write content into given file object.
+    """
+    tmp_file = f"{file_path}.{os.getpid()}.tmp"
+    with os.fdopen(os.open(tmp_file, Converter.flags, Converter.modes), 'w') as file:
+        write_func(file)
+    os.replace(tmp_file, file_path)
+
+
+def _save_manifest(manifest_file, manifest):
+    """
+    Save source hashes of converted files.
+
+    Args:
+        manifest_file (str): The manifest file path.
+        manifest (dict): Key is path of converted file relative to root path, value is source hash.
+    """
+    _replace_file(manifest_file, lambda file: json.dump(manifest, file, indent=2, sort_keys=True))
+
+
+def _save_merged_report(merged_report_file, reports):
+    """
+    Merge reports of script files into one report.
+
+    Args:
+        merged_report_file (str): The merged report file path.
+        reports (list[tuple[str, str, str]]): Relative path, status and report file of each script file,
+            in order of input files.
+    """
+    lines = []
+    for rel_path, status, report_file in reports:
+        lines.append(f"[{status}] {rel_path}")
+        if os.path.isfile(report_file):
+            with open(report_file, 'r') as file:
+                lines.append(file.read())
+        lines.append('')
+    _replace_file(merged_report_file, lambda file: file.write('\n'.join(lines)))
+
+
+def _convert_file(infile, output_dir, report_dir, converted_hash=None):
+    """
+    Convert one script file, which runs in a worker process when files are converted in parallel.
+
+    Args:
+        infile (str): The script to convert.
+        output_dir (str): The path to save converted file.
+        report_dir (str): The path to save report file.
+        converted_hash (str): Source hash of the file converted last time. Default: None.
+
+    Returns:
+        tuple[str, str, str, float], script file, status, source hash and elapsed time.
+    """
+    start = time.time()
+    source_hash = _get_source_hash(infile)
+    dest_file = os.path.join(output_dir, os.path.basename(infile))
+    if source_hash == converted_hash and os.path.isfile(dest_file):
+        logger.info("%s is unchanged since last conversion, skip it.", infile)
+        return infile, "SKIPPED", source_hash, time.time() - start
+
+    if converted_hash is not None:
+        # Remove outputs converted from the previous version of the script.
+        for stale_file in (dest_file, _get_report_file(infile, report_dir)):
+            if os.path.isfile(stale_file):
+                os.remove(stale_file)
+    Converter().convert(infile, output_dir, report_dir)
+    return infile, "SUCCESS", source_hash, time.time() - start
+
+
+def _print_summary(results, rel_paths, elapsed):
+    """
+    Print timing and status of each script file.
+
+    Args:
+        results (list[tuple[str, str, str, float]]): Script file, status, source hash and elapsed time.
+        rel_paths (list[str]): Path of each script file relative to root path.
+        elapsed (float): Total elapsed time.
+    """
+    name_width = max([len("Script")] + [len(rel_path) for rel_path in rel_paths])
+    log_console.info("\n")
+    log_console.info("MindConverter: script conversion summary.")
+    log_console.info("%s  %-7s  %10s", "Script".ljust(name_width), "Status", "Time(s)")
+    for rel_path, (_, status, _, cost) in zip(rel_paths, results):
+        log_console.info("%s  %-7s  %10.2f", rel_path.ljust(name_width), status, cost)
+    status_num = {status: sum(1 for _, s, _, _ in results if s == status)
+                  for status in ("SUCCESS", "SKIPPED", "FAILED")}
+    log_console.info("Total: %d, succeeded: %d, skipped: %d, failed: %d, elapsed: %.2fs.",
+                     len(results), status_num["SUCCESS"], status_num["SKIPPED"], status_num["FAILED"], elapsed)
+
+
 def main(files_config):
     """
-    The entrance for converter, script files will be converted.
+    The entrance for converter, script files will be converted in one process or a process pool.
+
+    Converted files and reports keep their paths relative to `root_path` under output dir and report dir.
+    Files not changed since last conversion into the same output dir are skipped, and reports of all
+    files are merged into one report in order of input files.
 
     Args:
-        files_config (dict): The config of files which to convert.
+        files_config (dict): The config of files which to convert, contains `in_files`, `outfile_dir`,
+            `report_dir`, optional `root_path` and optional `jobs`.
+
+    Returns:
+        list[tuple[str, str, str, float]], script file, status, source hash and elapsed time of each file.
     """
-    convert_ins = Converter()
     in_files = files_config['in_files']
-    for in_file in in_files:
-        convert_ins.convert(in_file, files_config['outfile_dir'], files_config['report_dir'])
+    output_dir = files_config['outfile_dir']
+    report_dir = files_config['report_dir']
+    root_path = files_config.get('root_path')
+    jobs = min(files_config.get('jobs') or 1, len(in_files))
+
+    rel_paths = [os.path.relpath(in_file, root_path) if root_path else os.path.basename(in_file)
+                 for in_file in in_files]
+    manifest_file = os.path.join(output_dir, MANIFEST_FILE)
+    manifest = _load_manifest(manifest_file)
+    tasks = []
+    for in_file, rel_path in zip(in_files, rel_paths):
+        file_output_dir = os.path.join(output_dir, os.path.dirname(rel_path))
+        file_report_dir = os.path.join(report_dir, os.path.dirname(rel_path))
+        os.makedirs(file_output_dir, mode=stat.S_IRWXU, exist_ok=True)
+        os.makedirs(file_report_dir, mode=stat.S_IRWXU, exist_ok=True)
+        tasks.append((in_file, file_output_dir, file_report_dir, manifest.get(rel_path)))
+
+    start = time.time()
+    results = []
+    error = None
+    if jobs <= 1:
+        for task in tasks:
+            task_start = time.time()
+            try:
+                results.append(_convert_file(*task))
+            except Exception as e:  # pylint: disable=broad-except
+                # Convert the rest files, the first error is raised after all files done.
+                error = error or e
+                results.append((task[0], "FAILED", None, time.time() - task_start))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_convert_file, *task) for task in tasks]
+            # Collect results in order of input files, thus the summary, manifest and report are deterministic.
+            for task, future in zip(tasks, futures):
+                if future.exception() is None:
+                    results.append(future.result())
+                else:
+                    error = error or future.exception()
+                    results.append((task[0], "FAILED", None, 0.0))
+
+    for rel_path, (_, status, source_hash, _) in zip(rel_paths, results):
+        if status == "FAILED":
+            manifest.pop(rel_path, None)
+        else:
+            manifest[rel_path] = source_hash
+    _save_manifest(manifest_file, manifest)
+    _save_merged_report(os.path.join(report_dir, MERGED_REPORT_FILE),
+                        [(rel_path, status, _get_report_file(infile, task[2]))
+                         for rel_path, task, (infile, status, _, _) in zip(rel_paths, tasks, results)])
+
+    _print_summary(results, rel_paths, time.time() - start)
+    if error is not None:
+        raise error
+    return results
@@ -23,24 +23,45 @@ class ForwardCall(ast.NodeVisitor):
     AST visitor that processes forward calls.
 
     Find the sub functions called by the forward function in the script file.
+
+    Functions and calls are recorded in one traversal, either by visiting the tree here or by another visitor
+    calling `enter_class`, `exit_class`, `enter_function`, `exit_function` and `add_call` in the same order,
+    and then `resolve` finds out the forward calls from the records.
     """
 
-    def __init__(self, ast_tree):
+    def __init__(self, ast_tree=None):
         self._tree = ast_tree
         self._name_stack = []
-        self._forward_stack = []
+        # Records in order of traversal, item is tuple of event type, function or call name and node.
+        self._records = []
         self.calls = {}  # key is function name, value is forward function ast node.
         self._function_list = {}  # key is function name, value is function ast node.
-        self.process()
+        if ast_tree is not None:
+            self.process()
 
     def process(self):
         """visit ast tree to find the forward functions."""
         self.visit(self._tree)
-        # first visit to find out all functions, so restores all variables except _function_list
-        self._name_stack.clear()
-        self._forward_stack.clear()
+        self.resolve()
+
+    def resolve(self):
+        """Find out the forward functions from the functions and calls recorded."""
         self.calls.clear()
-        self.visit(self._tree)
+        # Functions are only known after the whole tree is visited, thus calls are resolved afterwards.
+        function_list = dict(self._function_list)
+        forward_stack = []
+        for event, name, node in self._records:
+            if event == "enter":
+                is_in_chain = name in self.calls or node.name == 'forward'
+                forward_stack.append(is_in_chain)
+                if node.name == 'forward':
+                    self.calls.update({name: node})
+                function_list.update({name: node})
+            elif event == "exit":
+                forward_stack.pop()
+            elif any(forward_stack):
+                self.calls.update({name: function_list.get(name)})
+        self._records.clear()
 
     def get_current_namespace(self):
         """Get the namespace when visit the AST node"""
@@ -55,32 +76,60 @@ class ForwardCall(ast.NodeVisitor):
 
         return pasta.dump(node.func)
 
-    def visit_ClassDef(self, node):
-        """Callback function when visit AST tree"""
+    def enter_class(self, node):
+        """
+        Record entering a class definition.
+
+        Args:
+            node (ast.ClassDef): The class definition node.
+        """
         self._name_stack.append(node.name)
-        self.generic_visit(node)
+
+    def exit_class(self):
+        """Record exiting the current class definition."""
         self._name_stack.pop()
 
-    def visit_FunctionDef(self, node):
-        """Callback function when visit AST tree"""
-        namespace = self.get_current_namespace()
-        if namespace:
-            func_name = f'{namespace}.{node.name}'
-        else:
-            func_name = node.name
+    def enter_function(self, node):
+        """
+        Record entering a function definition.
+
+        Args:
+            node (ast.FunctionDef): The function definition node.
+        """
         func_name = f'{self.get_current_namespace()}.{node.name}'
-        is_in_chain = func_name in self.calls or node.name == 'forward'
-        if is_in_chain:
-            self._forward_stack.append(func_name)
+        self._function_list.update({func_name: node})
+        self._records.append(("enter", func_name, node))
 
-        if node.name == 'forward':
-            self.calls.update({func_name: node})
+    def exit_function(self):
+        """Record exiting the current function definition."""
+        self._records.append(("exit", None, None))
 
-        self._function_list.update({func_name: node})
+    def add_call(self, node):
+        """
+        Record a call, which should be added after calls in its arguments.
+
+        Args:
+            node (ast.Call): The call node.
+        """
+        func_name = self.get_call_name(node)
+        if isinstance(node.func, ast.Name):
+            if func_name in ['super', 'str', 'repr']:
+                return
+        elif func_name.startswith('self.'):
+            func_name = f'{self.get_current_namespace()}.{func_name.split(".")[-1]}'
+        self._records.append(("call", func_name, node))
+
+    def visit_ClassDef(self, node):
+        """Callback function when visit AST tree"""
+        self.enter_class(node)
         self.generic_visit(node)
+        self.exit_class()
 
-        if is_in_chain:
-            self._forward_stack.pop()
+    def visit_FunctionDef(self, node):
+        """Callback function when visit AST tree"""
+        self.enter_function(node)
+        self.generic_visit(node)
+        self.exit_function()
 
     def visit_Call(self, node):
         """Callback function when visit AST tree"""
@@ -88,17 +137,5 @@ class ForwardCall(ast.NodeVisitor):
             self.visit(arg)
         for keyword in node.keywords:
             self.visit(keyword.value)
-        func_name = self.get_call_name(node)
-        if isinstance(node.func, ast.Name):
-            if func_name not in ['super', 'str', 'repr']:
-                if self._forward_stack:
-                    self.calls.update({func_name: self._function_list.get(func_name)})
-                self.visit(node.func)
-        else:
-            if self._forward_stack:
-                if func_name.startswith('self.'):
-                    whole_name = f'{self.get_current_namespace()}.{func_name.split(".")[-1]}'
-                    self.calls.update({whole_name: self._function_list.get(whole_name)})
-                else:
-                    self.calls.update({func_name: self._function_list.get(func_name)})
-                self.visit(node.func)
+        self.add_call(node)
+        self.visit(node.func)
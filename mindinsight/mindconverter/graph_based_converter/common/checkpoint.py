@@ -0,0 +1,152 @@
+# Copyright 2020-2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Define checkpoint writer which serializes parameters one at a time."""
+import os
+import stat
+
+import numpy as np
+
+# Key is numpy data type name, value is MindSpore tensor type name.
+MS_DATA_TYPE = {
+    "bool": "Bool",
+    "int8": "Int8",
+    "int16": "Int16",
+    "int32": "Int32",
+    "int64": "Int64",
+    "uint8": "UInt8",
+    "uint16": "UInt16",
+    "uint32": "UInt32",
+    "uint64": "UInt64",
+    "float16": "Float16",
+    "float32": "Float32",
+    "float64": "Float64",
+}
+
+# Wire types of protobuf.
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_LENGTH_DELIMITED = 2
+
+
+def get_ms_data_type(data: np.ndarray):
+    """
+    Get MindSpore tensor type name of data.
+
+    Args:
+        data (numpy.ndarray): Parameter data.
+
+    Returns:
+        str, tensor type name, such as Float32.
+    """
+    data_type = MS_DATA_TYPE.get(data.dtype.name)
+    if data_type is None:
+        raise TypeError(f"Data type {data.dtype} is not supported by checkpoint.")
+    return data_type
+
+
+def _encode_varint(value: int):
+    """Encode non-negative integer as protobuf varint."""
+    encoded = bytearray()
+    while True:
+        bits = value & 0x7f
+        value >>= 7
+        if value:
+            encoded.append(bits | 0x80)
+            continue
+        encoded.append(bits)
+        return bytes(encoded)
+
+
+def _encode_key(field_number: int, wire_type: int):
+    """Encode protobuf field key."""
+    return _encode_varint(field_number << 3 | wire_type)
+
+
+def _encode_bytes(field_number: int, value: bytes):
+    """Encode length delimited protobuf field."""
+    return _encode_key(field_number, WIRE_TYPE_LENGTH_DELIMITED) + _encode_varint(len(value)) + value
+
+
+class CheckpointWriter:
+    """
+    Write parameters into MindSpore checkpoint file one by one.
+
+    MindSpore checkpoint is a `Checkpoint` proto with a repeated `value` field,
+    each value holds parameter name as `tag` and a `TensorProto` of dims, tensor
+    type and tensor content. As concatenated values of a repeated field make up
+    the same message, each parameter is serialized and written once it comes,
+    and only the content of current parameter is copied.
+
+    Args:
+        file_path (str): Checkpoint file path, which must not exist.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        self._file = os.fdopen(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                                       stat.S_IRUSR | stat.S_IWUSR), "wb")
+
+    def write(self, name: str, data):
+        """
+        Serialize a parameter into checkpoint.
+
+        Args:
+            name (str): Parameter name.
+            data (numpy.ndarray): Parameter data.
+        """
+        data = np.asarray(data)
+        tensor_header = bytearray()
+        # Scalar is saved with dims of [0].
+        for dim in data.shape or (0,):
+            tensor_header += _encode_key(1, WIRE_TYPE_VARINT) + _encode_varint(dim)
+        tensor_header += _encode_bytes(2, get_ms_data_type(data).encode())
+        content = data.tobytes()
+        tensor_header += _encode_key(3, WIRE_TYPE_LENGTH_DELIMITED) + _encode_varint(len(content))
+
+        value_header = _encode_bytes(1, name.encode())
+        tensor_len = len(tensor_header) + len(content)
+        value_header += _encode_key(2, WIRE_TYPE_LENGTH_DELIMITED) + _encode_varint(tensor_len)
+        value_len = len(value_header) + tensor_len
+
+        self._file.write(_encode_key(1, WIRE_TYPE_LENGTH_DELIMITED) + _encode_varint(value_len))
+        self._file.write(value_header)
+        self._file.write(tensor_header)
+        self._file.write(content)
+
+    def close(self):
+        """Close checkpoint file and make it read only."""
+        self._file.close()
+        os.chmod(self._file_path, stat.S_IRUSR)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_type is not None:
+            # Remove incomplete checkpoint.
+            os.remove(self._file_path)
+
+
+def save_checkpoint(parameters, file_path: str):
+    """
+    Save parameters into checkpoint file one by one.
+
+    Args:
+        parameters (Iterable[dict]): Parameters with `name` and `data`.
+        file_path (str): Checkpoint file path.
+    """
+    with CheckpointWriter(file_path) as writer:
+        for parameter in parameters:
+            writer.write(parameter["name"], parameter["data"])
@@ -13,23 +13,37 @@
 # limitations under the License.
 # ==============================================================================
 """Define GlobalContext class to save required resources during whole conversion procedure."""
+import threading
 from collections import OrderedDict
 from mindinsight.mindconverter.graph_based_converter.common.outputs import OutputStorage
 
 
 class Singleton(type):
-    """Metaclass to make the globalcontext single instance."""
-    _instances = {}
+    """
+    Metaclass to make the globalcontext single instance in each thread.
+
+    Conversions running in different threads hold their own instance,
+    thus they do not share any state.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def _instances(mcs):
+        """Return singleton objects of current thread."""
+        if not hasattr(mcs._local, "instances"):
+            mcs._local.instances = {}
+        return mcs._local.instances
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instances = Singleton._instances()
+        if cls not in instances:
+            instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return instances[cls]
 
     @classmethod
     def release(mcs):
-        """Clear singleton object."""
-        mcs._instances.clear()
+        """Clear singleton object of current thread."""
+        mcs._instances().clear()
 
 
 class GlobalContext(metaclass=Singleton):
@@ -87,6 +101,11 @@ class GlobalContext(metaclass=Singleton):
         # Define Module Struct Build Status
         self.build_struct_finished = False
 
+        # Manage variable name of different modules.
+        self.global_var_namespace = set()
+        # Manage variable name of different type.
+        self.global_op_namespace = dict()
+
     def get_onnx_node_from_identifier(self, identifier):
         """Return an OnnxUtils defined node by its identifier."""
         onnx_node_name = self.node_struct_to_onnx_node_map.get(identifier)
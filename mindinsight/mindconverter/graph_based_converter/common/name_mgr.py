@@ -15,6 +15,8 @@
 """Name manager."""
 import abc
 
+from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
+
 
 class NameMgr(abc.ABC):
     """Module name manager."""
@@ -53,19 +55,20 @@ class ModuleNameMgr(NameMgr):
     """Module name manager."""
 
 
-# Manage variable name of different modules.
-global_var_namespace = set()
-# Manage variable name of different type.
-global_op_namespace = dict()
 START_IDX = 0
 
 
 class GlobalVarNameMgr:
-    """Global variable name mgr."""
+    """
+    Global variable name mgr.
+
+    Namespaces are kept in GlobalContext, thus they are shared by the
+    managers of the same conversion only.
+    """
 
     def __init__(self):
-        global_op_namespace.clear()
-        global_var_namespace.clear()
+        GlobalContext().global_op_namespace.clear()
+        GlobalContext().global_var_namespace.clear()
 
     @staticmethod
     def _get_name(name):
@@ -89,6 +92,9 @@ class GlobalVarNameMgr:
             str, module name.
         """
 
+        global_op_namespace = GlobalContext().global_op_namespace
+        global_var_namespace = GlobalContext().global_var_namespace
+
         def _gen(t):
             t = t.lower()
             if t not in global_op_namespace:
@@ -16,6 +16,10 @@
 import json
 import os
 import stat
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib import import_module
 from importlib.util import find_spec
 from typing import List, Tuple, Mapping
@@ -25,6 +29,7 @@ import numpy as np
 from mindinsight.mindconverter.common.exceptions import ScriptGenerationError, ReportGenerationError, \
     UnknownModelError, CheckPointGenerationError, WeightMapGenerationError
 from mindinsight.mindconverter.common.log import logger as log
+from mindinsight.mindconverter.graph_based_converter.common.checkpoint import save_checkpoint
 from mindinsight.mindconverter.graph_based_converter.constant import SEPARATOR_IN_ONNX_OP, BINARY_HEADER_PYTORCH_BITS, \
     FrameworkType, BINARY_HEADER_PYTORCH_FILE, TENSORFLOW_MODEL_SUFFIX, THIRD_PART_VERSION
 
@@ -61,6 +66,91 @@ def _add_outputs_of_onnx_model(model, output_nodes: List[str]):
     return model
 
 
+def _build_inference_session(model, output_nodes: List[str]):
+    """
+    Build onnxruntime session which is able to fetch given nodes output.
+
+    Notes:
+        Outputs added for building the session are removed afterwards,
+        thus the model is kept unchanged.
+
+    Args:
+        model (ModelProto): ONNX model.
+        output_nodes (list[str]): Output nodes list.
+
+    Returns:
+        InferenceSession, onnxruntime session.
+    """
+    existed_outputs = {opt.name for opt in model.graph.output}
+    added_outputs = list(OrderedDict.fromkeys(opt for opt in output_nodes if opt not in existed_outputs))
+    output_num = len(model.graph.output)
+    edit_model = _add_outputs_of_onnx_model(model, added_outputs)
+    try:
+        serialized_model = bytes(edit_model.SerializeToString())
+    finally:
+        del model.graph.output[output_num:]
+
+    ort = import_module("onnxruntime")
+    return ort.InferenceSession(path_or_bytes=serialized_model)
+
+
+class InferenceSessionCache:
+    """
+    Cache onnxruntime sessions of one model to avoid building sessions repeatedly.
+
+    Sessions are keyed on the identity of the model and the output names it is able to fetch,
+    a cached session serves any request whose outputs are a subset of its outputs.
+    Only sessions of the latest requested model are kept. The model is not hashed on each
+    request, thus `release` must be called once the model is edited in place.
+    """
+
+    def __init__(self):
+        self._model = None
+        self._reserved_outputs = list()
+        self._sessions = list()
+        self.built_count = 0
+
+    def reserve_outputs(self, output_nodes: List[str]):
+        """
+        Reserve outputs to be fetched later, sessions built afterwards are able to fetch them too.
+
+        Args:
+            output_nodes (list[str]): Output nodes list.
+        """
+        self._reserved_outputs = list(OrderedDict.fromkeys(self._reserved_outputs + list(output_nodes)))
+
+    def get_session(self, model, output_nodes: List[str]):
+        """
+        Get a session of the model which is able to fetch the outputs.
+
+        Args:
+            model (ModelProto): ONNX model.
+            output_nodes (list[str]): Output nodes list.
+
+        Returns:
+            InferenceSession, onnxruntime session.
+        """
+        if self._model is not model:
+            self.release()
+            self._model = model
+
+        required_outputs = set(output_nodes)
+        for fetchable_outputs, sess in self._sessions:
+            if required_outputs <= fetchable_outputs:
+                return sess
+
+        fetchable_outputs = list(OrderedDict.fromkeys(list(output_nodes) + self._reserved_outputs))
+        sess = _build_inference_session(model, fetchable_outputs)
+        self._sessions.append((set(fetchable_outputs), sess))
+        self.built_count += 1
+        return sess
+
+    def release(self):
+        """Release all cached sessions."""
+        self._model = None
+        self._sessions.clear()
+
+
 def check_dependency_integrity(*packages):
     """Check dependency package integrity."""
     try:
@@ -85,7 +175,8 @@ def build_feed_dict(onnx_model, input_nodes: dict):
     return feed_dict
 
 
-def fetch_output_from_onnx_model(model, feed_dict: dict, output_nodes: List[str]):
+def fetch_output_from_onnx_model(model, feed_dict: dict, output_nodes: List[str],
+                                 session_cache: InferenceSessionCache = None):
     """
     Fetch specific nodes output from onnx model.
 
@@ -96,6 +187,7 @@ def fetch_output_from_onnx_model(model, feed_dict: dict, output_nodes: List[str]
         model (ModelProto): ONNX model.
         feed_dict (dict): Feed forward inputs.
         output_nodes (list[str]): Output nodes list.
+        session_cache (InferenceSessionCache): Cache to reuse sessions built before. Default: None.
 
     Returns:
         dict, nodes' output value.
@@ -104,10 +196,10 @@ def fetch_output_from_onnx_model(model, feed_dict: dict, output_nodes: List[str]
         raise TypeError("`feed_dict` should be type of dict, and `output_nodes` "
                         "should be type of List[str].")
 
-    edit_model = _add_outputs_of_onnx_model(model, output_nodes)
-
-    ort = import_module("onnxruntime")
-    sess = ort.InferenceSession(path_or_bytes=bytes(edit_model.SerializeToString()))
+    if session_cache is None:
+        sess = _build_inference_session(model, output_nodes)
+    else:
+        sess = session_cache.get_session(model, output_nodes)
     fetched_res = sess.run(output_names=output_nodes, input_feed=feed_dict)
     run_result = dict()
     for idx, opt in enumerate(output_nodes):
@@ -115,18 +207,68 @@ def fetch_output_from_onnx_model(model, feed_dict: dict, output_nodes: List[str]
     return run_result
 
 
+def _write_text(content: str, mode: int):
+    """
+    Create a function writing text into file.
+
+    Args:
+        content (str): Text to be written.
+        mode (int): Permission of the file.
+
+    Returns:
+        Callable, function writing text into given file path.
+    """
+    def _write(file_path):
+        with os.fdopen(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode), 'w') as file:
+            file.write(content)
+
+    return _write
+
+
+def _write_artifact(file_path: str, write_func, error_type, artifact_name: str):
+    """
+    Write artifact into a temporary file, then link it to the file path.
+
+    Args:
+        file_path (str): Artifact file path.
+        write_func (Callable): Function to write artifact into given path.
+        error_type (type): Exception type raised when failed.
+        artifact_name (str): Artifact name in messages.
+
+    Returns:
+        float, time cost of writing in seconds.
+    """
+    start = time.perf_counter()
+    tmp_file_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        write_func(tmp_file_path)
+        # Unlike renaming, linking fails instead of overwriting a file created meanwhile.
+        os.link(tmp_file_path, file_path)
+    except FileExistsError:
+        raise error_type(f"{artifact_name} with the same name already exists.")
+    except (IOError, TypeError) as error:
+        raise error_type(str(error))
+    finally:
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+    return time.perf_counter() - start
+
+
 def save_code_file_and_report(model_name: str, code_lines: Mapping[str, Tuple],
                               out_folder: str, report_folder: str):
     """
     Save code file and report.
 
+    Note:
+        Code, report, checkpoint and weight map are written concurrently once none of
+        them exists, each of them is written into a temporary file and linked once finished.
+
     Args:
         model_name (str): Model name.
         code_lines (dict): Code lines.
         out_folder (str): Output folder.
         report_folder (str): Report output folder.
     """
-    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
     modes = stat.S_IRUSR | stat.S_IWUSR
     modes_usr = stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
 
@@ -145,40 +287,25 @@ def save_code_file_and_report(model_name: str, code_lines: Mapping[str, Tuple],
         code, report, trainable_weights, weight_map = code_lines[file_name]
         code_file_path = os.path.realpath(os.path.join(out_folder, f"{model_name}.py"))
         report_file_path = os.path.realpath(os.path.join(report_folder, f"report_of_{model_name}.txt"))
-        try:
-            if os.path.exists(code_file_path):
-                raise ScriptGenerationError("Code file with the same name already exists.")
-            with os.fdopen(os.open(code_file_path, flags, modes), 'w') as file:
-                file.write(code)
-        except (IOError, FileExistsError) as error:
-            raise ScriptGenerationError(str(error))
-
-        try:
-            if os.path.exists(report_file_path):
-                raise ReportGenerationError("Report file with the same name already exists.")
-            with os.fdopen(os.open(report_file_path, flags, stat.S_IRUSR), "w") as rpt_f:
-                rpt_f.write(report)
-        except (IOError, FileExistsError) as error:
-            raise ReportGenerationError(str(error))
-
-        save_checkpoint = getattr(import_module("mindspore.train.serialization"), "save_checkpoint")
         ckpt_file_path = os.path.realpath(os.path.join(out_folder, f"{model_name}.ckpt"))
-        try:
-            if os.path.exists(ckpt_file_path):
-                raise CheckPointGenerationError("Checkpoint file with the same name already exists.")
-            save_checkpoint(trainable_weights, ckpt_file_path)
-        except TypeError as error:
-            raise CheckPointGenerationError(str(error))
-
         weight_map_path = os.path.realpath(os.path.join(out_folder, f"weight_map_of_{model_name}.json"))
-        try:
-            if os.path.exists(weight_map_path):
-                raise WeightMapGenerationError("Weight map file with the same name already exists.")
-            with os.fdopen(os.open(weight_map_path, flags, stat.S_IRUSR), 'w') as map_f:
-                weight_map_json = {f"{model_name}": weight_map}
-                json.dump(weight_map_json, map_f)
-        except (IOError, FileExistsError) as error:
-            raise WeightMapGenerationError(str(error))
+        weight_map_json = json.dumps({f"{model_name}": weight_map})
+        artifacts = [
+            (code_file_path, _write_text(code, modes), ScriptGenerationError, "Code file"),
+            (report_file_path, _write_text(report, stat.S_IRUSR), ReportGenerationError, "Report file"),
+            (ckpt_file_path, partial(save_checkpoint, trainable_weights), CheckPointGenerationError,
+             "Checkpoint file"),
+            (weight_map_path, _write_text(weight_map_json, stat.S_IRUSR), WeightMapGenerationError,
+             "Weight map file"),
+        ]
+        for file_path, _, error_type, artifact_name in artifacts:
+            if os.path.exists(file_path):
+                raise error_type(f"{artifact_name} with the same name already exists.")
+        with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+            futures = [executor.submit(_write_artifact, *artifact) for artifact in artifacts]
+        # Raise the error of the first failed artifact in order.
+        for (file_path, _, _, artifact_name), future in zip(artifacts, futures):
+            log.info("%s %s is written in %.3fs.", artifact_name, file_path, future.result())
 
 
 def onnx_satisfied():
@@ -13,14 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 """Graph based scripts converter workflow."""
+import json
 import multiprocessing as mp
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 from importlib import import_module
 from importlib.util import find_spec
-from functools import partial
+from functools import partial, lru_cache
 from google.protobuf.internal import api_implementation
 from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
 from mindinsight.mindconverter.graph_based_converter.common.utils import lib_version_satisfied, onnx_satisfied, \
@@ -29,10 +32,11 @@ from mindinsight.mindconverter.graph_based_converter.constant import FrameworkTy
     ONNX_MIN_VER, TF2ONNX_MIN_VER, ONNXRUNTIME_MIN_VER, ONNXOPTIMIZER_MIN_VER, TORCH_MIN_VER
 from mindinsight.mindconverter.graph_based_converter.generator import batch_add_nodes
 from mindinsight.mindconverter.graph_based_converter.mapper import ONNXToMindSporeMapper
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher import SearchBudget
 from mindinsight.mindconverter.common.log import logger as log, logger_console as log_console
 from mindinsight.mindconverter.common.exceptions import GraphInitError, TreeCreationError, SourceFilesSaveError, \
     BaseConverterError, UnknownModelError, GeneratorError, TfRuntimeError, RuntimeIntegrityError, ParamMissingError, \
-    BadParamError
+    BadParamError, MindConverterException
 from mindinsight.mindconverter.graph_based_converter.third_party_graph import GraphFactory
 
 check_common_dependency_integrity = partial(check_dependency_integrity,
@@ -72,6 +76,26 @@ def torch_version_satisfied(output_queue):
     output_queue.put(satisfied)
 
 
+@lru_cache(maxsize=1)
+def _validate_torch_version():
+    """
+    Check Torch version in a sub-process.
+
+    Notes:
+        The result is cached, thus the sub-process is only launched once
+        in the current process (and processes forked from it).
+
+    Returns:
+        bool, true or false.
+    """
+    output_queue = mp.Queue()
+    process = mp.Process(target=torch_version_satisfied, args=(output_queue,))
+    process.start()
+    satisfied = output_queue.get()
+    process.join()
+    return satisfied
+
+
 def torch_installation_validation(func):
     """
     Validate args of func.
@@ -84,7 +108,8 @@ def torch_installation_validation(func):
     """
 
     def _f(graph_path: str, input_nodes: dict, output_nodes: List[str],
-           output_folder: str, report_folder: str = None):
+           output_folder: str, report_folder: str = None, search_budget: SearchBudget = None,
+           no_format: bool = False):
         # Check whether pytorch is installed.
         error_info = None
         torch_version_validation = False
@@ -100,11 +125,7 @@ def torch_installation_validation(func):
                     f"be consisted with model generation runtime."
 
             if not error_info:
-                output_queue = mp.Queue()
-                process = mp.Process(target=torch_version_satisfied, args=(output_queue,))
-                process.start()
-                torch_version_validation = output_queue.get()
-                process.join()
+                torch_version_validation = _validate_torch_version()
 
         if error_info:
             _print_error(RuntimeIntegrityError(error_info))
@@ -123,7 +144,8 @@ def torch_installation_validation(func):
 
         func(graph_path=graph_path,
              input_nodes=input_nodes, output_nodes=output_nodes,
-             output_folder=output_folder, report_folder=report_folder)
+             output_folder=output_folder, report_folder=report_folder,
+             search_budget=search_budget, no_format=no_format)
 
     return _f
 
@@ -150,7 +172,8 @@ def tf_installation_validation(func):
     """
 
     def _f(graph_path: str, input_nodes: dict, output_nodes: List[str],
-           output_folder: str, report_folder: str):
+           output_folder: str, report_folder: str, search_budget: SearchBudget = None,
+           no_format: bool = False):
         not_integral_error = RuntimeIntegrityError(
             f"TensorFlow, "
             f"{get_third_part_lib_validation_error_info(['tf2onnx', 'onnx', 'onnxruntime', 'onnxoptimizer'])} "
@@ -175,7 +198,8 @@ def tf_installation_validation(func):
 
         func(graph_path=graph_path,
              input_nodes=input_nodes, output_nodes=output_nodes,
-             output_folder=output_folder, report_folder=report_folder)
+             output_folder=output_folder, report_folder=report_folder,
+             search_budget=search_budget, no_format=no_format)
 
     return _f
 
@@ -203,7 +227,8 @@ def _extract_model_name(model_path):
 @GeneratorError.uniform_catcher()
 def graph_based_converter_pytorch_to_ms(graph_path: str,
                                         input_nodes: dict, output_nodes: List[str],
-                                        output_folder: str, report_folder: str = None):
+                                        output_folder: str, report_folder: str = None,
+                                        search_budget: SearchBudget = None, no_format: bool = False):
     """
     PyTorch to MindSpore based on Graph.
 
@@ -213,11 +238,16 @@ def graph_based_converter_pytorch_to_ms(graph_path: str,
         output_nodes (list[str]): Output node(s) of the model.
         output_folder (str): Output folder.
         report_folder (str): Report output folder path.
+        search_budget (SearchBudget): Budget of sub-graph search. Default: None, no limit.
+        no_format (bool): Whether to skip formatting generated code. Default: False.
     """
-    graph_obj = GraphFactory.init(graph_path, input_nodes=input_nodes, output_nodes=output_nodes)
+    # The result of torch version check is cached, once it succeeded, model could be exported in current process.
+    export_in_process = not graph_path.endswith('.onnx') and _validate_torch_version()
+    graph_obj = GraphFactory.init(graph_path, input_nodes=input_nodes, output_nodes=output_nodes,
+                                  export_in_process=export_in_process, search_budget=search_budget)
     generator_inst = batch_add_nodes(graph_obj, ONNXToMindSporeMapper)
     model_name = _extract_model_name(graph_path)
-    code_fragments = generator_inst.generate()
+    code_fragments = generator_inst.generate(format_code=not no_format)
     save_code_file_and_report(model_name, code_fragments, output_folder, report_folder)
     # Release global context.
     GlobalContext.release()
@@ -231,7 +261,8 @@ def graph_based_converter_pytorch_to_ms(graph_path: str,
 @GeneratorError.uniform_catcher()
 def graph_based_converter_tf_to_ms(graph_path: str,
                                    input_nodes: dict, output_nodes: List[str],
-                                   output_folder: str, report_folder: str = None):
+                                   output_folder: str, report_folder: str = None,
+                                   search_budget: SearchBudget = None, no_format: bool = False):
     """
     Tensorflow to MindSpore based on Graph.
 
@@ -241,19 +272,30 @@ def graph_based_converter_tf_to_ms(graph_path: str,
         output_nodes (list[str]): Output node(s) of the model.
         output_folder (str): Output folder.
         report_folder (str): Report output folder path.
+        search_budget (SearchBudget): Budget of sub-graph search. Default: None, no limit.
+        no_format (bool): Whether to skip formatting generated code. Default: False.
     """
     # Close unnecessary log.
     os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 
-    graph_obj = GraphFactory.init(graph_path, input_nodes=input_nodes, output_nodes=output_nodes)
+    graph_obj = GraphFactory.init(graph_path, input_nodes=input_nodes, output_nodes=output_nodes,
+                                  search_budget=search_budget)
     generator_inst = batch_add_nodes(graph_obj, ONNXToMindSporeMapper)
     model_name = _extract_model_name(graph_path)
-    code_fragments = generator_inst.generate()
+    code_fragments = generator_inst.generate(format_code=not no_format)
     save_code_file_and_report(model_name, code_fragments, output_folder, report_folder)
     # Release global context.
     GlobalContext.release()
 
 
+def _check_protobuf_implementation():
+    """Warn users if protobuf is not implemented in cpp."""
+    if api_implementation.Type() != 'cpp' or os.getenv('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION') != 'cpp':
+        log_console.warning("Protobuf is currently implemented in \"Python\". "
+                            "The conversion process may take a long time. "
+                            "Please use `export PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=cpp` to enable cpp backend.")
+
+
 @BaseConverterError.uniform_catcher()
 def main_graph_base_converter(file_config):
     """
@@ -262,12 +304,17 @@ def main_graph_base_converter(file_config):
     Args:
         file_config (dict): The config of file which to convert.
     """
+    _check_protobuf_implementation()
+    _convert_with_file_config(file_config)
 
-    if api_implementation.Type() != 'cpp' or os.getenv('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION') != 'cpp':
-        log_console.warning("Protobuf is currently implemented in \"Python\". "
-                            "The conversion process may take a long time. "
-                            "Please use `export PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=cpp` to enable cpp backend.")
 
+def _convert_with_file_config(file_config):
+    """
+    Convert one model according to its file config.
+
+    Args:
+        file_config (dict): The config of file which to convert.
+    """
     graph_path = file_config['model_file']
     frame_type = get_framework_type(graph_path)
     if not file_config.get("shape"):
@@ -294,19 +341,25 @@ def main_graph_base_converter(file_config):
                                                 input_nodes=input_nodes,
                                                 output_nodes=file_config['output_nodes'],
                                                 output_folder=file_config['outfile_dir'],
-                                                report_folder=file_config['report_dir'])
+                                                report_folder=file_config['report_dir'],
+                                                search_budget=file_config.get('search_budget'),
+                                                no_format=file_config.get('no_format', False))
         else:
             graph_based_converter_pytorch_to_ms(graph_path=graph_path,
                                                 input_nodes=input_nodes,
                                                 output_nodes=[],
                                                 output_folder=file_config['outfile_dir'],
-                                                report_folder=file_config['report_dir'])
+                                                report_folder=file_config['report_dir'],
+                                                search_budget=file_config.get('search_budget'),
+                                                no_format=file_config.get('no_format', False))
     elif frame_type == FrameworkType.TENSORFLOW.value:
         graph_based_converter_tf_to_ms(graph_path=graph_path,
                                        input_nodes=input_nodes,
                                        output_nodes=file_config['output_nodes'],
                                        output_folder=file_config['outfile_dir'],
-                                       report_folder=file_config['report_dir'])
+                                       report_folder=file_config['report_dir'],
+                                       search_budget=file_config.get('search_budget'),
+                                       no_format=file_config.get('no_format', False))
     else:
         error_msg = "Get UNSUPPORTED model."
         error = UnknownModelError(error_msg)
@@ -322,3 +375,166 @@ def check_params_exist(params: list, config):
 
     if miss_param_list:
         raise ParamMissingError(f"Param(s) missing, {miss_param_list} is(are) required when using graph mode.")
+
+
+def _normalize_shape(shape):
+    """
+    Normalize shape declared in model list.
+
+    Args:
+        shape (Union[str, list[int]]): Shape like "1,3,224,224" or [1, 3, 224, 224].
+
+    Returns:
+        list[int], shape.
+    """
+    if isinstance(shape, str):
+        shape = shape.split(',')
+    if not isinstance(shape, list):
+        raise BadParamError(f"Shape {shape} in `--model_list` should be list of integers.")
+    try:
+        return [int(num_shape) for num_shape in shape]
+    except (TypeError, ValueError):
+        raise BadParamError(f"Shape {shape} in `--model_list` should be list of integers.")
+
+
+def load_model_list(model_list_path, output_folder, report_folder=None):
+    """
+    Load model list file into file configs.
+
+    The model list is a json file which contains an array of models, e.g.
+    [{"model_file": "resnet50.pth", "shape": ["1,3,224,224"], "input_nodes": ["input.1"],
+      "output_nodes": ["output"], "output": "output/resnet50", "report": "report/resnet50"}].
+    `output` and `report` are optional, relative paths are relative to the model list file.
+
+    Args:
+        model_list_path (str): Path of model list file.
+        output_folder (str): Default output folder.
+        report_folder (str): Default report folder.
+
+    Returns:
+        list[dict], file config of each model.
+    """
+    try:
+        with open(model_list_path, 'r') as f:
+            model_list = json.load(f)
+    except (IOError, ValueError) as error:
+        raise BadParamError(f"Cannot load `--model_list`, {str(error)}")
+    if not isinstance(model_list, list) or not model_list:
+        raise BadParamError("`--model_list` should be a non-empty array of models.")
+
+    base_dir = os.path.dirname(os.path.realpath(model_list_path))
+
+    def _abspath(path):
+        return os.path.realpath(os.path.join(base_dir, os.path.expanduser(path)))
+
+    file_configs = []
+    for model in model_list:
+        if not isinstance(model, dict) or not model.get('model_file'):
+            raise ParamMissingError("`model_file` is required for each model in `--model_list`.")
+        model_file = _abspath(model['model_file'])
+        if not os.path.isfile(model_file):
+            raise BadParamError(f"Model file {model_file} in `--model_list` not exists.")
+        if get_framework_type(model_file) == FrameworkType.UNKNOWN.value:
+            raise UnknownModelError(f"Model file {model_file} in `--model_list` should be an valid "
+                                    f"TensorFlow pb or PyTorch pth model file.")
+        outfile_dir = _abspath(model['output']) if model.get('output') else output_folder
+        file_configs.append({
+            'model_file': model_file,
+            'shape': [_normalize_shape(shape) for shape in model.get('shape') or []],
+            'input_nodes': model.get('input_nodes'),
+            'output_nodes': model.get('output_nodes'),
+            'outfile_dir': outfile_dir,
+            'report_dir': _abspath(model['report']) if model.get('report') else (report_folder or outfile_dir)
+        })
+    return file_configs
+
+
+def _convert_model_in_batch(file_config):
+    """
+    Convert one model of the model list.
+
+    Args:
+        file_config (dict): The config of file which to convert.
+
+    Returns:
+        tuple[str, bool, float], model file, whether succeeded and elapsed time.
+    """
+    start = time.time()
+    succeeded = True
+    try:
+        _convert_with_file_config(file_config)
+    except SystemExit:
+        # Errors have been recorded and printed by exception catchers.
+        succeeded = False
+    except Exception as e:  # pylint: disable=broad-except
+        # Error of one model should not break conversion of the others.
+        succeeded = False
+        detail_info = str(e)
+        if not isinstance(e, MindConverterException):
+            detail_info = BaseConverterError.normalize_error_msg(detail_info)
+        log_console.error("\n")
+        log_console.error("Failed to convert %s. %s", file_config['model_file'], detail_info)
+        log_console.error("\n")
+        log.exception(e)
+    finally:
+        # Release states of current conversion before converting next model.
+        GlobalContext.release()
+    return file_config['model_file'], succeeded, time.time() - start
+
+
+def _print_batch_summary(results, elapsed):
+    """
+    Print timing and status of each model in batch conversion.
+
+    Args:
+        results (list[tuple[str, bool, float]]): Model file, whether succeeded and elapsed time.
+        elapsed (float): Total elapsed time.
+    """
+    name_width = max(len("Model"), *[len(os.path.basename(model_file)) for model_file, _, _ in results])
+    log_console.info("\n")
+    log_console.info("MindConverter: batch conversion summary.")
+    log_console.info("%s  %-7s  %10s", "Model".ljust(name_width), "Status", "Time(s)")
+    for model_file, succeeded, cost in results:
+        log_console.info("%s  %-7s  %10.2f", os.path.basename(model_file).ljust(name_width),
+                         "SUCCESS" if succeeded else "FAILED", cost)
+    succeeded_num = sum(1 for _, succeeded, _ in results if succeeded)
+    log_console.info("Total: %d, succeeded: %d, failed: %d, elapsed: %.2fs.",
+                     len(results), succeeded_num, len(results) - succeeded_num, elapsed)
+    log_console.info("\n")
+
+
+@BaseConverterError.uniform_catcher()
+def main_graph_base_converter_batch(batch_config):
+    """
+    The entrance for batch converter, models in model list will be converted in one process or a process pool.
+
+    Args:
+        batch_config (dict): The config of batch conversion, contains `model_list`, `jobs`,
+            `outfile_dir`, `report_dir` and optional `search_budget`, `no_format` applied to each model.
+
+    Returns:
+        list[tuple[str, bool, float]], model file, whether succeeded and elapsed time of each model.
+    """
+    _check_protobuf_implementation()
+    file_configs = load_model_list(batch_config['model_list'],
+                                   batch_config['outfile_dir'],
+                                   batch_config.get('report_dir'))
+    for file_config in file_configs:
+        file_config['search_budget'] = batch_config.get('search_budget')
+        file_config['no_format'] = batch_config.get('no_format', False)
+    jobs = min(batch_config.get('jobs') or 1, len(file_configs))
+
+    # Check torch version once, forked workers inherit the result.
+    if find_spec("torch") and any(not cfg['model_file'].endswith('.onnx')
+                                  and get_framework_type(cfg['model_file']) == FrameworkType.PYTORCH.value
+                                  for cfg in file_configs):
+        _validate_torch_version()
+
+    start = time.time()
+    if jobs <= 1:
+        results = [_convert_model_in_batch(cfg) for cfg in file_configs]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_convert_model_in_batch, file_configs))
+    _print_batch_summary(results, time.time() - start)
+    return results
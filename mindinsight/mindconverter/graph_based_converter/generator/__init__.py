@@ -16,7 +16,6 @@
 __all__ = ["batch_add_nodes"]
 
 import re
-import copy
 
 from mindinsight.mindconverter.graph_based_converter.constant import ExchangeMessageKeywords
 from mindinsight.mindconverter.graph_based_converter.common.code_fragment import NewFragment
@@ -102,6 +101,29 @@ def _supply_graph_info(node, external_inputs):
     }
 
 
+def _copy_params(params):
+    """
+    Copy node params on write.
+
+    Lists and dicts of params are copied, which are small and may be modified
+    by mappers, while tensors and other attributes are shared by reference.
+
+    Args:
+        params (dict): Node params.
+
+    Returns:
+        dict, copied params.
+    """
+    def _copy(value):
+        if isinstance(value, list):
+            return [_copy(item) for item in value]
+        if isinstance(value, dict):
+            return {key: _copy(item) for key, item in value.items()}
+        return value
+
+    return _copy(params)
+
+
 def _convert_params(node, mapper, external_inputs):
     """
     Call mapper to convert node's params from ONNX to MindSpore.
@@ -115,7 +137,7 @@ def _convert_params(node, mapper, external_inputs):
         tuple[str, dict, dict, dict], op name in MindSpore, MindSpore parameters,
         MindSpore settings and weights of the node.
     """
-    params = copy.deepcopy(node.node_params)
+    params = _copy_params(node.node_params)
     params.update({"input_shape": node.input_shape,
                    "output_shape": node.output_shape})
 
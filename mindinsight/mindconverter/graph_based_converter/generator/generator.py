@@ -13,9 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 """Main Generator module."""
-import copy
 from collections import OrderedDict
-from importlib import import_module
+from functools import lru_cache
 
 import numpy as np
 from yapf.yapflib.yapf_api import FormatCode
@@ -25,6 +24,7 @@ from mindinsight.mindconverter.graph_based_converter.generator.scope_utils impor
 from mindinsight.mindconverter.graph_based_converter.generator.node_struct import NodeStruct
 from mindinsight.mindconverter.graph_based_converter.generator.module_struct import ModuleStruct
 from mindinsight.mindconverter.graph_based_converter.generator.args_translator import ArgsTranslationHelper
+from mindinsight.mindconverter.graph_based_converter.common.checkpoint import get_ms_data_type
 from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
 from mindinsight.mindconverter.graph_based_converter.common.outputs import BaseOutput, ModuleOutputManager
 from mindinsight.mindconverter.graph_based_converter.common.yapf_config import mindspore_yapf_config
@@ -37,6 +37,21 @@ from mindinsight.mindconverter.graph_based_converter.generator.matcher import Ma
 from mindinsight.mindconverter.graph_based_converter.generator.shared_weights import SharedWeightHelper
 
 
+@lru_cache(maxsize=1024)
+def _format_code(code):
+    """
+    Format code with yapf, formatted results of identical code are reused.
+
+    Args:
+        code (str): Code of a class or import statements.
+
+    Returns:
+        str, formatted code.
+    """
+    formatted_code, _ = FormatCode(code, style_config=mindspore_yapf_config())
+    return formatted_code
+
+
 class CodeStruct:
     """
     Define the Code template for each module generated in the final output.
@@ -169,6 +184,10 @@ class Generator:
 
         # define intermediate var. during conversion
         self._module_map = OrderedDict()
+        # Parsed scope path of each submodule in module map.
+        self._module_paths = OrderedDict()
+        # Key is module num at the last level of scope path, value is list of scope path string.
+        self._module_num_index = dict()
         self._global_context = GlobalContext()
         self._global_context.node_struct_collections = self._node_struct_collections
         self._repeated_submodules = set()
@@ -206,6 +225,17 @@ class Generator:
         # Form bottom modules' ModuleStruct
         for scope_path_str, nd_struct_list in self._module_map.items():
             self._module_struct_collections[scope_path_str] = ModuleStruct(nd_struct_list)
+        self._index_module_map()
+
+    def _index_module_map(self):
+        """Parse scope path of each submodule once, and index submodules by module num."""
+        self._module_paths = OrderedDict()
+        self._module_num_index = dict()
+        for scope_path_str in self._module_map:
+            path = Scope.path_str_to_list(scope_path_str)
+            self._module_paths[scope_path_str] = path
+            if path:
+                self._module_num_index.setdefault(path[-1][0], []).append(scope_path_str)
 
     def _list_repeated_submodules(self) -> OrderedDict:
         """
@@ -217,15 +247,11 @@ class Generator:
         """
         ret = OrderedDict()
         for depth_control in range(self._module_depth_max, 0, -1):
-            repeated_submodules_at_this_depth = set()
-            for scope_path in self._module_map.keys():
-                path = Scope.path_str_to_list(scope_path)
-                if len(path) < depth_control:
-                    continue
-                # depth control within path length.
-                module_num = path[depth_control - 1][0]
-                repeated_submodules_at_this_depth.add(module_num)
-            ret[depth_control] = repeated_submodules_at_this_depth
+            ret[depth_control] = set()
+        for path in self._module_paths.values():
+            # depth control within path length.
+            for depth_control, (module_num, _) in enumerate(path[:self._module_depth_max], start=1):
+                ret[depth_control].add(module_num)
 
         self._repeated_submodules = ret
         return ret
@@ -399,37 +425,34 @@ class Generator:
 
     def _add_submodule_to_parent(self):
         """
-        Recursively add all submodule to its parent module until Main module.
+        Add all submodules to their parent modules from bottom to top until Main module.
 
         Note:
-            This function deepcopy the first node of the submodule, and reset its params as parent module.
-        """
-        depth = self._module_depth_max
-        while depth > 0:
-            for (scope_path_str, md_struct) in self.module_structs.copy().items():
-                if scope_path_str == '[]':
-                    continue  # is main module, skip
-                if md_struct.scope_depth != depth:
-                    continue  # skip all submodules not at current depth
-                md_struct_scope = copy.deepcopy(md_struct.identifier)
-                md_struct_scope.pop()
-                parent_scope = md_struct_scope
+            Modules are visited by depth in a single pass, a parent module created from
+            the first node of the submodule is appended to the worklist of its depth.
+        """
+        worklist = dict()
+        for (scope_path_str, md_struct) in self.module_structs.items():
+            if scope_path_str == '[]':
+                continue  # is main module, skip
+            worklist.setdefault(md_struct.scope_depth, []).append((scope_path_str, md_struct))
+
+        for depth in range(self._module_depth_max, 0, -1):
+            for (scope_path_str, md_struct) in worklist.get(depth, []):
+                parent_scope = str(md_struct.identifier[:-1])
                 # 1. check if this module has parent module
-                parent_md_struct = self.module_structs.get(str(parent_scope))
-                if parent_md_struct is not None:
-                    # 1A. has parent, directly add md_struct to its parent ModuleStruct.
-                    parent_md_struct.add_submodule(md_struct)
-                    self.module_structs[str(parent_scope)] = parent_md_struct
-                else:
+                parent_md_struct = self.module_structs.get(parent_scope)
+                if parent_md_struct is None:
                     # 1B. not has parent, generate a new ModuleStruct
                     # use this submodule to create a parent module
                     parent_md_struct = ModuleStruct(None, init_as_parent=True, parent_base=md_struct)
-                    # rewrite parent md struct
-                    parent_md_struct.add_submodule(md_struct)
-                    self.module_structs[str(parent_scope)] = parent_md_struct
+                    self.module_structs[parent_scope] = parent_md_struct
+                    if depth > 1:
+                        worklist.setdefault(depth - 1, []).append((parent_scope, parent_md_struct))
+                # 1A. add md_struct to its parent ModuleStruct.
+                parent_md_struct.add_submodule(md_struct)
                 sub = self.module_structs.pop(scope_path_str)  # remove this submodule from collections
                 self._global_context.add_module_struct(sub.pattern_id, sub)
-            depth -= 1
 
     @GeneratorError.check_except("Generator occurs an error when building modules.")
     def _recursive_form_module(self):
@@ -446,15 +469,7 @@ class Generator:
             module_struct.update_args_translation_list(formal_args)
 
         # 4. Form parent modules
-        md_collection_len = len(self.module_structs.keys())
-        len_changes = True
-        while len_changes:
-            self._add_submodule_to_parent()
-            new_len = len(self.module_structs.keys())
-            if md_collection_len != new_len:
-                md_collection_len = new_len
-            else:
-                len_changes = False
+        self._add_submodule_to_parent()
         GlobalContext().build_struct_finished = True
         # 5. Update all translated args from module map
         self._update_all_modules_args_translator()
@@ -488,9 +503,8 @@ class Generator:
         done_submodule = set()
         for depth in range(self._module_depth_max, 0, -1):
             # check modules from bottom to top
-            repeated_submodules = copy.deepcopy(self._repeated_submodules)
-            repeated_modules = repeated_submodules.get(depth)
-            if depth is None:
+            repeated_modules = self._repeated_submodules.get(depth)
+            if repeated_modules is None:
                 continue
             for pattern_id in repeated_modules:
                 if pattern_id in done_submodule:
@@ -595,9 +609,16 @@ class Generator:
         return weight_scope_name.lower()
 
     def generate_checkpoint(self):
-        """Generate checkpoint."""
+        """
+        Generate checkpoint.
 
-        mindspore = import_module('mindspore')
+        Note:
+            Parameter data is kept as numpy array without copying, which is serialized
+            one by one when saving the checkpoint.
+
+        Returns:
+            tuple[list, list], parameters with name and data, and weight map.
+        """
         trainable_weights_dict = dict()
         weight_map = list()
         for node_name, node_inst in self.node_structs.items():
@@ -607,13 +628,11 @@ class Generator:
                 for idx, (weight_key, weight_value_object) in \
                         enumerate(node_inst.fragment.exchange_msg['var_0']['trainable_params'].items()):
                     value_type = weight_value_object.get('type', WeightType.COMMON.value)
-                    value_data = weight_value_object['data']
+                    value_data = np.asarray(weight_value_object['data'])
                     if value_type == WeightType.PARAMETER.value:
                         weight_name = SEPARATOR_BTW_NAME_AND_ID.join((weights_scope_name, weight_key))
                     else:
                         weight_name = LINK_IN_WEIGHT_NAME.join((weights_scope_name, weight_key))
-                    weight_shape = mindspore.Tensor(value_data).shape
-                    data_type = mindspore.Tensor(value_data).dtype
                     trainable_weights_dict[weight_name] = value_data
 
                     onnx_weight_name = onnx_weight_inst[idx].name
@@ -624,8 +643,8 @@ class Generator:
                         {
                             'converted_weight': {
                                 'name': weight_name,
-                                'shape': weight_shape,
-                                'data_type': str(data_type)
+                                'shape': value_data.shape,
+                                'data_type': get_ms_data_type(value_data)
                             },
                             'source_weight': {
                                 'name': onnx_weight_name,
@@ -639,17 +658,20 @@ class Generator:
         for weight_name, weight_value in trainable_weights_dict.items():
             obj = {
                 'name': weight_name,
-                'data': mindspore.Tensor(weight_value)
+                'data': weight_value
             }
             save_obj.append(obj)
 
         return save_obj, weight_map
 
     @GeneratorError.check_except("Generator occurs an error when generating code statements.")
-    def generate(self):
+    def generate(self, format_code=True):
         """
         Generate the final script file.
 
+        Args:
+            format_code (bool): Whether to format the generated code with yapf. Default: True.
+
         Returns:
             list, a list of each line in script file.
         """
@@ -664,11 +686,13 @@ class Generator:
         outputs = [get_imported_module()]
 
         for code_struct in self._global_context.code_structs.values():
-            for line in code_struct.code_line_list:
-                outputs.append(line)
+            outputs.append("\n".join(code_struct.code_line_list))
 
-        formatted_code, _ = FormatCode("\n".join(outputs),
-                                       style_config=mindspore_yapf_config())
+        if format_code:
+            # Each class is formatted independently, which is the same as formatting the whole file.
+            formatted_code = "\n\n".join(_format_code(output) for output in outputs)
+        else:
+            formatted_code = "\n".join(outputs)
 
         report_generator = ReportGenerator()
         report = report_generator.gen_report(formatted_code)
@@ -734,8 +758,12 @@ class Generator:
             list, list of NodeStruct list of each submodule.
         """
         ret = list()
-        for scope_path, nd_struct_list in self._module_map.items():
-            path = Scope.path_str_to_list(scope_path)
+        if module_num is not None:
+            scope_paths = self._module_num_index.get(module_num, [])
+        else:
+            scope_paths = self._module_paths.keys()
+        for scope_path in scope_paths:
+            path = self._module_paths[scope_path]
             if not path:  # skip main
                 continue
 
@@ -747,10 +775,10 @@ class Generator:
             (m_num, m_uid) = scope_at_depth
             if uid is not None:
                 if m_num == module_num and m_uid == uid:
-                    ret.append(nd_struct_list)
+                    ret.append(self._module_map[scope_path])
             else:
                 if m_num == module_num:
-                    ret.append(nd_struct_list)
+                    ret.append(self._module_map[scope_path])
         return ret
 
     def build_outputs_connection(self):
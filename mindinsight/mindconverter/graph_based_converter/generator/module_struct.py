@@ -14,7 +14,6 @@
 # ==============================================================================
 """Define a struct for module converted and save all required information here."""
 
-import copy
 from collections import OrderedDict
 
 from mindinsight.mindconverter.graph_based_converter.generator.node_struct import NodeStruct
@@ -110,8 +109,8 @@ class ModuleStruct:
         Note:
             This function must be called only if the new ModuleStruct is a parent of parent_base.
         """
-        self.identifier = copy.deepcopy(parent_base.identifier)[:-1]
-        self.scope_depth = copy.deepcopy(parent_base.scope_depth) - 1
+        self.identifier = parent_base.identifier[:-1]
+        self.scope_depth = parent_base.scope_depth - 1
         self.module_name = Scope.scope_to_module_name(self.identifier)
         self.head_nd_struct = parent_base.head_nd_struct
         self.head_nd_struct_index = parent_base.head_nd_struct_index
@@ -14,6 +14,23 @@
 # ==============================================================================
 """Define a scope class processing all operations related to scope and scope name."""
 import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_scope_path(scope_path_str: str):
+    """
+    Parse the scope path string, which is memoized as the same strings are parsed repeatedly.
+
+    Args:
+        scope_path_str (str): The scope path string like "[(5, 0), (3, 0)]".
+
+    Returns:
+        tuple, the scope path like ((5, 0), (3, 0)).
+    """
+    tmp = scope_path_str.strip('[').strip(']')
+    regex = r"\((?P<num>\d+), (?P<uid>\d+)\)"
+    return tuple((int(num), int(uid)) for (num, uid) in re.findall(regex, tmp))
 
 
 class Scope():
@@ -125,14 +142,7 @@ class Scope():
         Returns:
             list, a list of the scope path like [(5, 0), (3, 0)].
         """
-        ret = []
-        tmp = scope_path_str.strip('[').strip(']')
-        regex = r"\((?P<num>\d+), (?P<uid>\d+)\)"
-        s_all = re.findall(regex, tmp)
-        for (num, uid) in s_all:
-            ret.append((int(num), int(uid)))
-
-        return ret
+        return list(_parse_scope_path(scope_path_str))
 
     @staticmethod
     def get_parent_module_num_and_uid(path):
@@ -17,6 +17,7 @@ import abc
 import importlib
 import json
 import os
+from functools import lru_cache
 from typing import Dict
 from mindinsight.mindconverter.common.log import logger as log
 from mindinsight.mindconverter.graph_based_converter.constant import ExchangeMessageKeywords, TemplateKeywords
@@ -39,6 +40,25 @@ GET_OP_WEIGHTS = "_convert_trained_weights"
 GET_OP_SETTINGS = "_convert_settings"
 GET_OP_TEMPLATE = "_generate_snippet_template"
 
+# Key is module path of mapper, value is converter functions of the mapper.
+CONVERTER_CACHE = dict()
+
+
+@lru_cache(maxsize=1024)
+def _init_template(variable_slot, op, arg_names):
+    """
+    Generate init template of operation, which is reused by nodes with the same args.
+
+    Args:
+        variable_slot (str): Variable slot.
+        op (str): Operation name in MindSpore.
+        arg_names (tuple[str]): Names of converted params.
+
+    Returns:
+        str, init template.
+    """
+    return f"self.{{{variable_slot}}} = {op}({', '.join(['%s={%s}' % (p, p) for p in arg_names])})"
+
 
 class Mapper(metaclass=abc.ABCMeta):
     """Mapper between third-party-operation and MindSpore."""
@@ -85,20 +105,14 @@ class ONNXToMindSporeMapper(Mapper, abc.ABC):
         Returns:
             Tuple[str, dict, dict], operation name and params and settings.
         """
-        global TABLE
         module_name = TABLE.get(op_name)
 
         if not module_name:
             return None, dict(), None, dict()
 
-        pos = module_name.rfind(".")
         try:
-            converter = getattr(importlib.import_module(module_name[:pos]),
-                                module_name[pos + 1:])
-            op_name_converter = getattr(converter, GET_OP_NAME)
-            params_converter = getattr(converter, GET_OP_PARAMS)
-            weights_converter = getattr(converter, GET_OP_WEIGHTS)
-            template_generator = getattr(converter, GET_OP_TEMPLATE)
+            op_name_converter, params_converter, weights_converter, template_generator = \
+                cls._resolve_converter(module_name)
         except (ModuleNotFoundError,) as e:
             # If mapper can not be found, then skip it.
             err_msg = f"Converting {op_name} failed, see {str(e)}"
@@ -134,6 +148,27 @@ class ONNXToMindSporeMapper(Mapper, abc.ABC):
 
         return code_template, exchange_msg, outputs_list, outputs_mapping
 
+    @staticmethod
+    def _resolve_converter(module_name):
+        """
+        Resolve converter functions of mapper, which is imported only once per process.
+
+        Args:
+            module_name (str): Module path of mapper class.
+
+        Returns:
+            tuple, functions to convert op name, params, weights and to generate template.
+        """
+        converter_funcs = CONVERTER_CACHE.get(module_name)
+        if converter_funcs is None:
+            pos = module_name.rfind(".")
+            converter = getattr(importlib.import_module(module_name[:pos]),
+                                module_name[pos + 1:])
+            converter_funcs = tuple(getattr(converter, func_name)
+                                    for func_name in (GET_OP_NAME, GET_OP_PARAMS, GET_OP_WEIGHTS, GET_OP_TEMPLATE))
+            CONVERTER_CACHE[module_name] = converter_funcs
+        return converter_funcs
+
     @staticmethod
     def _operation_name_in_ms(*args, **kwargs):
         raise NotImplementedError
@@ -155,7 +190,7 @@ class ONNXToMindSporeMapper(Mapper, abc.ABC):
         if not op:
             raise ValueError("Can not get MindSpore operation name.")
         variable_slot = "var_0"
-        init_template = f"self.{{{variable_slot}}} = {op}({', '.join(['%s={%s}' % (p, p) for p in args])})"
+        init_template = _init_template(variable_slot, op, tuple(args))
         construct_template = f"opt_{{{variable_slot}}} = self.{{{variable_slot}}}" \
                              f"({{{ExchangeMessageKeywords.VariableScope.value.INPUTS.value}}})"
         template = {
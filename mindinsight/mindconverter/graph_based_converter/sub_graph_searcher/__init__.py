@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 """Searcher of scope name."""
-__all__ = ["generate_scope_name"]
+__all__ = ["generate_scope_name", "SearchBudget"]
 
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import SearchBudget
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.searcher import generate_scope_name
@@ -15,9 +15,10 @@
 """Introduce some standard pattern into MindConverter."""
 
 __all__ = ["BUILT_IN_PATTERN", "register_pattern", "is_built_in_pattern",
-           "USER_DEFINED_PATTERN", "user_defined_pattern"]
+           "find_built_in_pattern_occurrences", "USER_DEFINED_PATTERN", "user_defined_pattern"]
 
 from collections import OrderedDict
+from typing import Dict, List
 
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.known_module_name import register_module_name
 
@@ -27,6 +28,42 @@ from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern
 BUILT_IN_PATTERN = dict()
 USER_DEFINED_PATTERN = OrderedDict()
 
+# Key is op types tuple of the pattern, value is built-in pattern names.
+BUILT_IN_PATTERN_ITEMS_INDEX = dict()
+# Key is leading op type of the pattern, value is lengths of built-in patterns.
+BUILT_IN_PATTERN_HEAD_INDEX = dict()
+# Key is pattern length and hash of op types, value is built-in pattern names.
+BUILT_IN_PATTERN_HASH_INDEX = dict()
+
+_HASH_BASE = 1000003
+_HASH_MOD = (1 << 61) - 1
+# Key is op type, value is the id used in hashing. Op types not in any pattern have id 0.
+_OP_TYPE_ID = dict()
+_HASH_POWERS = [1]
+
+
+def _hash_op_types(op_types):
+    """Calculate polynomial hash of op types."""
+    hash_val = 0
+    for op_type in op_types:
+        hash_val = (hash_val * _HASH_BASE + _OP_TYPE_ID.get(op_type, 0)) % _HASH_MOD
+    return hash_val
+
+
+def _index_pattern(ptn_name, pattern: Pattern):
+    """Add built-in pattern into indexes."""
+    for op_type in pattern.ptn_items:
+        _OP_TYPE_ID.setdefault(op_type, len(_OP_TYPE_ID) + 1)
+    while len(_HASH_POWERS) <= pattern.ptn_length:
+        _HASH_POWERS.append(_HASH_POWERS[-1] * _HASH_BASE % _HASH_MOD)
+
+    BUILT_IN_PATTERN_ITEMS_INDEX.setdefault(tuple(pattern.ptn_items), []).append(ptn_name)
+    head_index = BUILT_IN_PATTERN_HEAD_INDEX.setdefault(pattern.ptn_items[0], [])
+    if pattern.ptn_length not in head_index:
+        head_index.append(pattern.ptn_length)
+    hash_key = (pattern.ptn_length, _hash_op_types(pattern.ptn_items))
+    BUILT_IN_PATTERN_HASH_INDEX.setdefault(hash_key, []).append(ptn_name)
+
 
 def is_built_in_pattern(pattern: Pattern):
     """
@@ -38,15 +75,44 @@ def is_built_in_pattern(pattern: Pattern):
     Returns:
         bool, true or false.
     """
-    for ptn in BUILT_IN_PATTERN:
+    for ptn in BUILT_IN_PATTERN_ITEMS_INDEX.get(tuple(pattern.ptn_items), []):
         if BUILT_IN_PATTERN[ptn].ptn_length == pattern.ptn_length and \
                 BUILT_IN_PATTERN[ptn].in_degree == pattern.in_degree and \
-                BUILT_IN_PATTERN[ptn].out_degree == pattern.out_degree and \
-                BUILT_IN_PATTERN[ptn].ptn_items == pattern.ptn_items:
+                BUILT_IN_PATTERN[ptn].out_degree == pattern.out_degree:
             return True
     return False
 
 
+def find_built_in_pattern_occurrences(op_types: List[str]) -> Dict[str, List[int]]:
+    """
+    Find where built-in patterns occur in the op types sequence in one pass.
+
+    Prefix hashes of the sequence make hash of any window available in O(1),
+    which is looked up in the index of patterns led by the op type at each position.
+
+    Args:
+        op_types (list[str]): Op types in topological order.
+
+    Returns:
+        dict[str, list[int]], start indexes in ascending order of each found pattern.
+    """
+    total_len = len(op_types)
+    prefix_hash = [0]
+    for op_type in op_types:
+        prefix_hash.append((prefix_hash[-1] * _HASH_BASE + _OP_TYPE_ID.get(op_type, 0)) % _HASH_MOD)
+
+    occurrences = dict()
+    for idx, op_type in enumerate(op_types):
+        for ptn_len in BUILT_IN_PATTERN_HEAD_INDEX.get(op_type, []):
+            if idx + ptn_len > total_len:
+                continue
+            hash_val = (prefix_hash[idx + ptn_len] - prefix_hash[idx] * _HASH_POWERS[ptn_len]) % _HASH_MOD
+            for ptn_name in BUILT_IN_PATTERN_HASH_INDEX.get((ptn_len, hash_val), []):
+                if BUILT_IN_PATTERN[ptn_name].ptn_items == op_types[idx:idx + ptn_len]:
+                    occurrences.setdefault(ptn_name, []).append(idx)
+    return occurrences
+
+
 def register_pattern(ptn_name, in_degree, out_degree):
     """
     Register pattern to MindConverter.
@@ -74,6 +140,7 @@ def register_pattern(ptn_name, in_degree, out_degree):
                                              ptn_items=result)
         BUILT_IN_PATTERN[ptn_name].additional_score = cal_matching_score(BUILT_IN_PATTERN[ptn_name].ptn_length)
         BUILT_IN_PATTERN[ptn_name].ptn_name = ptn_name
+        _index_pattern(ptn_name, BUILT_IN_PATTERN[ptn_name])
         return pattern
 
     return _reg
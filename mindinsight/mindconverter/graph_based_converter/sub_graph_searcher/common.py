@@ -14,7 +14,8 @@
 # ==============================================================================
 """Declare generic variable and functions."""
 
-__all__ = ["context",
+__all__ = ["AlgorithmContext",
+           "SearchBudget",
            "gen_hash_key",
            "DagGraph",
            "MAX_DEGREE",
@@ -26,9 +27,10 @@ __all__ = ["context",
            "MAX_ITERATION_DEPTH_OF_SINGLE_IPT"]
 
 import math
-import copy
 import functools
+import time
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from typing import List
 
 from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import BaseNode
@@ -92,44 +94,203 @@ def gen_hash_key(sequence: List[BaseNode], separator="-", without_module: bool =
     return separator.join(seq)
 
 
+class CopyOnWriteDict(MutableMapping):
+    """
+    Dict which shares unchanged entries with the dict it is copied from.
+
+    Entries are looked up in the changes of current dict first, then in the base
+    dict shared with its copies, which is never modified. Copying only clones the
+    changes, and the changes are merged into a new base once they grow too large.
+
+    Notes:
+        Values are shared between copies, thus values must be replaced rather
+        than modified in place.
+
+    Args:
+        base (dict): Base dict, which must not be modified after being wrapped.
+    """
+    _DELETED = object()
+    # Merge changes into a new base once they exceed this ratio of the base.
+    MERGE_RATIO = 0.25
+
+    def __init__(self, base=None):
+        self._base = base if base is not None else dict()
+        self._delta = dict()
+        self._len = len(self._base)
+
+    def __getitem__(self, key):
+        if key in self._delta:
+            value = self._delta[key]
+            if value is self._DELETED:
+                raise KeyError(key)
+            return value
+        return self._base[key]
+
+    def get(self, key, default=None):
+        value = self._delta[key] if key in self._delta else self._base.get(key, default)
+        return default if value is self._DELETED else value
+
+    def __contains__(self, key):
+        if key in self._delta:
+            return self._delta[key] is not self._DELETED
+        return key in self._base
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._len += 1
+        self._delta[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._len -= 1
+        if key in self._base:
+            self._delta[key] = self._DELETED
+        else:
+            del self._delta[key]
+
+    def __iter__(self):
+        for key in self._base:
+            if self._delta.get(key) is not self._DELETED:
+                yield key
+        for key, value in self._delta.items():
+            if key not in self._base and value is not self._DELETED:
+                yield key
+
+    def __len__(self):
+        return self._len
+
+    def _merge(self):
+        """Merge changes into a new base, the former base is kept unchanged for its copies."""
+        base = dict()
+        for key in self:
+            base[key] = self[key]
+        self._base = base
+        self._delta = dict()
+
+    def copy(self):
+        """
+        Copy the dict, unchanged entries are shared.
+
+        Returns:
+            CopyOnWriteDict, new instance.
+        """
+        if len(self._delta) > self.MERGE_RATIO * len(self._base):
+            self._merge()
+        new_obj = self.__class__(self._base)
+        new_obj._delta = self._delta.copy()
+        new_obj._len = self._len
+        return new_obj
+
+    __copy__ = copy
+
+
 class DagGraph:
     """Define dag graph."""
 
     def __init__(self, nodes, precursor: dict, successor: dict):
-        self.node_collection = nodes
-        self.precursor_table = precursor
-        self.successor_table = successor
+        self.node_collection = nodes if isinstance(nodes, CopyOnWriteDict) else CopyOnWriteDict(nodes)
+        self.precursor_table = precursor if isinstance(precursor, CopyOnWriteDict) else CopyOnWriteDict(precursor)
+        self.successor_table = successor if isinstance(successor, CopyOnWriteDict) else CopyOnWriteDict(successor)
 
     def __copy__(self):
         """
         Override `copy` function.
 
         Notes:
-            Be careful about `copy` method. It's safe to use deepcopy,
-            but struck in its poor performance.
+            Nodes and tables are copy-on-write, copying only clones the entries changed
+            since the last merge. Entries in tables must be replaced rather than modified
+            in place.
 
         Returns:
             DagGraph, new instance.
         """
         cls = self.__class__
-        new_obj = cls(copy.copy(self.node_collection),
-                      copy.deepcopy(self.precursor_table),
-                      copy.deepcopy(self.successor_table))
+        new_obj = cls(self.node_collection.copy(),
+                      self.precursor_table.copy(),
+                      self.successor_table.copy())
         return new_obj
 
 
+class SearchBudget:
+    """
+    Define budget of sub-graph search, search stops and returns the best path found so far once exhausted.
+
+    Args:
+        beam_width (int): Max number of patterns expanded on each search path, None means no limit.
+            Built-in patterns are always expanded. Default: None.
+        max_depth (int): Max number of sub-graphs replaced on each search path, None means
+            `MAX_ITERATION_DEPTH_OF_MULTI_IPT` for multi-inputs models, otherwise
+            `MAX_ITERATION_DEPTH_OF_SINGLE_IPT`. Default: None.
+        max_expanded_paths (int): Max number of search paths to expand, None means no limit. Default: None.
+        time_limit (float): Wall-clock limit of search in seconds, None means no limit. Default: None.
+    """
+
+    def __init__(self, beam_width=None, max_depth=None, max_expanded_paths=None, time_limit=None):
+        self.beam_width = beam_width
+        self.max_depth = max_depth
+        self.max_expanded_paths = max_expanded_paths
+        self.time_limit = time_limit
+
+    def __repr__(self):
+        """Override `repr()` method."""
+        return f"SearchBudget(beam_width={self.beam_width}, max_depth={self.max_depth}, " \
+               f"max_expanded_paths={self.max_expanded_paths}, time_limit={self.time_limit})"
+
+
 class AlgorithmContext:
-    """Define context of sub-graph search algorithm."""
-    found_pattern = {}
-    visited = set()
-    beam_width = 5
+    """
+    Define context of sub-graph search algorithm.
+
+    Each search owns its context, thus searches of different models
+    in the same process do not share any state.
+
+    Args:
+        budget (SearchBudget): Budget of current search. Default: None, no limit.
+    """
     MIN_FREQUENCY = 1
-    total_len = 0
-    node_collection = None
-    precursor_table = {}
-    successor_table = {}
-    outputs_table = {}
-    has_multi_inputs = False
+
+    def __init__(self, budget=None):
+        self.found_pattern = {}
+        self.visited = set()
+        self.budget = budget if budget is not None else SearchBudget()
+        self.beam_width = self.budget.beam_width
+        # Number of search paths expanded and when the search started.
+        self.expanded_paths = 0
+        self.start_time = time.time()
+        self.total_len = 0
+        self.node_collection = None
+        self.precursor_table = {}
+        self.successor_table = {}
+        self.outputs_table = {}
+        self.has_multi_inputs = False
+        # Key is generated module name, value is the pattern it comes from.
+        self.module_name_to_src = {}
+        # Key is pattern, value is times of the pattern matched with known module name.
+        self.used_module_name = dict()
+        self.scope_name_mapping = {}
+        self._module_idx = 0
+        self._node_idx = 0
+
+    def generate_module_name(self):
+        """Generate module name."""
+        name = f"Module{self._module_idx}"
+        self._module_idx += 1
+        return name
+
+    def generate_node_name(self, module_name):
+        """
+        Generate unique name of merged node.
+
+        Args:
+            module_name (str): Module name of the merged node.
+
+        Returns:
+            str, node name.
+        """
+        name = f"{module_name}_{self._node_idx}"
+        self._node_idx += 1
+        return name
 
     def set_init_node_collection(self, nd_col):
         """Init node_collection."""
@@ -147,6 +308,84 @@ class AlgorithmContext:
         """Set beam width."""
         self.beam_width = bw
 
+    def max_depth(self):
+        """Get max number of sub-graphs replaced on each search path."""
+        if self.budget.max_depth is not None:
+            return self.budget.max_depth
+        return MAX_ITERATION_DEPTH_OF_MULTI_IPT if self.has_multi_inputs else MAX_ITERATION_DEPTH_OF_SINGLE_IPT
+
+    def elapsed_time(self):
+        """Get elapsed time of current search in seconds."""
+        return time.time() - self.start_time
+
+    def is_budget_exhausted(self):
+        """
+        Whether the search budget is exhausted.
+
+        Returns:
+            bool, True or False.
+        """
+        if self.budget.max_expanded_paths is not None and self.expanded_paths >= self.budget.max_expanded_paths:
+            return True
+        return self.budget.time_limit is not None and self.elapsed_time() >= self.budget.time_limit
+
+    @staticmethod
+    def _index_candidates(pattern_arr):
+        """
+        Index candidates of sub-pattern test, each index is sorted by pattern length in descending order.
+
+        Args:
+            pattern_arr (list[tuple[str, Pattern]]): Sorted patterns.
+
+        Returns:
+            tuple[dict, list], candidates grouped by count and candidates have additional score.
+        """
+        same_count_candidates = dict()
+        scored_candidates = []
+        for j, (_, candidate) in enumerate(pattern_arr):
+            item = (candidate.ptn_length, j, candidate)
+            same_count_candidates.setdefault(candidate.count, []).append(item)
+            if candidate.additional_score != 0:
+                scored_candidates.append(item)
+        for items in same_count_candidates.values():
+            items.sort(key=lambda x: x[0], reverse=True)
+        scored_candidates.sort(key=lambda x: x[0], reverse=True)
+        return same_count_candidates, scored_candidates
+
+    @staticmethod
+    def _is_covered(i, ptn, same_count_candidates, scored_candidates):
+        """
+        Whether the pattern should be rejected because of other candidates.
+
+        Args:
+            i (int): Index of the pattern in sorted patterns.
+            ptn (Pattern): Pattern to be tested.
+            same_count_candidates (list): Candidates have the same count as `ptn`.
+            scored_candidates (list): Candidates have additional score.
+
+        Returns:
+            bool, True or False.
+        """
+        # If `ptn` is a sub-pattern of `candidate`, and `ptn` count equals to `candidate`,
+        # then reject the `ptn`.
+        for ptn_length, j, candidate in same_count_candidates:
+            if ptn_length < ptn.ptn_length:
+                break
+            if i != j and ptn.pattern in candidate.pattern:
+                return True
+        if ptn.additional_score != 0:
+            return False
+        # If `candidate` is sub-pattern of `ptn`, `candidate` has additional score,
+        # and `ptn` has no additional score, then calculate its replacement ratio.
+        for ptn_length, _, candidate in scored_candidates:
+            if ptn_length >= ptn.ptn_length:
+                continue
+            if ptn_length / ptn.ptn_length < PTN_COVERAGE_THRESHOLD:
+                break
+            if candidate.pattern in ptn.pattern:
+                return True
+        return False
+
     def sort_with_beam(self, pattern_arr):
         """
         Sort patterns according to its frequency and prune by beam width.
@@ -161,43 +400,24 @@ class AlgorithmContext:
         """
         pattern_arr = sorted(pattern_arr.items(), key=functools.cmp_to_key(_cmp),
                              reverse=True)
-        if len(pattern_arr) > AlgorithmContext.beam_width:
+        if self.beam_width is not None and len(pattern_arr) > self.beam_width:
             new_pattern_arr = pattern_arr[:self.beam_width]
             # Avoid dropping built-in pattern, because built-in patterns are much
             # more potential.
-            for i in range(self.beam_width):
+            for i in range(self.beam_width, len(pattern_arr)):
                 if pattern_arr[i][1].additional_score != 0:
                     new_pattern_arr.append(pattern_arr[i])
+            pattern_arr = new_pattern_arr
+        same_count_candidates, scored_candidates = self._index_candidates(pattern_arr)
         res = OrderedDict()
         for i, (key, ptn) in enumerate(pattern_arr):
-            if ptn.count <= AlgorithmContext.MIN_FREQUENCY:
+            if ptn.count <= self.MIN_FREQUENCY:
                 continue
             if ptn.additional_score > 0 and ptn.ptn_length > IGNORE_PTN_LEN:
                 res[key] = ptn
                 continue
-            skip = False
-            for j, (_, candidate) in enumerate(pattern_arr):
-                if i == j:
-                    continue
-                # If `ptn` is a sub-pattern of `candidate`, and `ptn` count equals to `candidate`,
-                # then reject the `ptn`.
-                if candidate.ptn_length >= ptn.ptn_length and ptn.count == candidate.count \
-                        and ptn.pattern in candidate.pattern:
-                    skip = True
-                    break
-                # If `candidate` is sub-pattern of `ptn`, `candidate` has additional score,
-                # and `ptn` has no additional score, then calculate its replacement ratio.
-                if candidate.ptn_length < ptn.ptn_length and candidate.additional_score != 0 \
-                        and ptn.additional_score == 0 and candidate.pattern in ptn.pattern:
-                    ratio = candidate.ptn_length / ptn.ptn_length
-                    if ratio >= PTN_COVERAGE_THRESHOLD:
-                        skip = True
-                        break
-
-            if not skip:
-                res[key] = ptn
+            if self._is_covered(i, ptn, same_count_candidates[ptn.count], scored_candidates):
+                continue
+            res[key] = ptn
 
         return res
-
-
-context = AlgorithmContext()
@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 """Define pattern to search."""
-scope_name_mapping = {}
 
 
 class Pattern:
@@ -61,7 +60,7 @@ class Pattern:
     def __repr__(self):
         """Override `repr()` method."""
         return f"Ptn: {self.pattern}[" \
-               f"{scope_name_mapping.get(self.pattern, 'Not init')}], " \
+               f"{self.module_name if self.module_name else 'Not init'}], " \
                f"count={self.count}"
 
     def __hash__(self):
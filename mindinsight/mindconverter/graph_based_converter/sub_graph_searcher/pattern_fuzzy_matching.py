@@ -13,16 +13,15 @@
 # limitations under the License.
 # ==============================================================================
 """Whether two pattern are fuzzy matched."""
-from typing import List
-
-import numpy as np
+from functools import lru_cache
+from typing import List, Tuple
 
 MIN_PATTERN_LEN = 3
 MATCHED_THRESHOLD = .8
 COMPLETELY_MATCHED = 1.
 
 
-def _levenshtein_distance(pattern_a, pattern_b):
+def _levenshtein_distance(pattern_a, pattern_b, threshold=None):
     """
     Calculate Levenshtein distance, aka minimum edit distance.
 
@@ -36,31 +35,49 @@ def _levenshtein_distance(pattern_a, pattern_b):
         norm    4    3    2    2    2
          add    5    4    3    3    2
 
+    Only two rows are kept during calculation. As values in a row never
+    decrease in the next row, calculation stops once the minimum of a row
+    exceeds `threshold`.
+
     Args:
-        pattern_a (list[str]): Pattern to be inspected.
-        pattern_b (list[str]): Pattern to be matched.
+        pattern_a (Sequence[str]): Pattern to be inspected.
+        pattern_b (Sequence[str]): Pattern to be matched.
+        threshold (int): Max acceptable distance. Default: None, no early exit.
 
     Returns:
-        int, minimum edit distance.
+        int, minimum edit distance, or a lower bound of it which exceeds `threshold`.
     """
-    row_count = len(pattern_a) + 1
-    col_count = len(pattern_b) + 1
-    dp = np.zeros(shape=[row_count, col_count], dtype=np.int)
-    for i in range(max(col_count, row_count)):
-        if i < col_count:
-            dp[0][i] = i
-        if i < row_count:
-            dp[i][0] = i
-    for i in range(1, row_count):
-        for j in range(1, col_count):
-            flag = 0 if pattern_a[i - 1] == pattern_b[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j - 1] + flag,
-                dp[i - 1][j] + 1,
-                dp[i][j - 1] + 1
-            )
-
-    return dp[row_count - 1][col_count - 1]
+    prev_row = list(range(len(pattern_b) + 1))
+    for i, op_a in enumerate(pattern_a, 1):
+        cur_row = [i]
+        for j, op_b in enumerate(pattern_b, 1):
+            cur_row.append(min(
+                prev_row[j - 1] + (op_a != op_b),
+                prev_row[j] + 1,
+                cur_row[j - 1] + 1
+            ))
+        if threshold is not None and min(cur_row) > threshold:
+            return min(cur_row)
+        prev_row = cur_row
+
+    return prev_row[-1]
+
+
+@lru_cache(maxsize=4096)
+def _cached_levenshtein_distance(pattern_a: Tuple[str], pattern_b: Tuple[str], threshold=None):
+    """Calculate Levenshtein distance of op-type tuples with cache."""
+    return _levenshtein_distance(pattern_a, pattern_b, threshold)
+
+
+def _max_edit_count(target_len):
+    """Max edit count with which the matching score is still acceptable."""
+    if target_len <= MIN_PATTERN_LEN:
+        return 0
+    target_len = float(target_len)
+    edit_count = 0
+    while (target_len - edit_count - 1) / target_len >= MATCHED_THRESHOLD:
+        edit_count += 1
+    return edit_count
 
 
 def pattern_fuzzy_matching(query: List[str], target: List[str]):
@@ -74,7 +91,7 @@ def pattern_fuzzy_matching(query: List[str], target: List[str]):
     Returns:
         Tuple[bool, float], true or false and matching score.
     """
-    edit_count = _levenshtein_distance(query, target)
+    edit_count = _cached_levenshtein_distance(tuple(query), tuple(target), _max_edit_count(len(target)))
     target_len = float(len(target))
     score = (target_len - edit_count) / target_len
     if target_len <= MIN_PATTERN_LEN:
@@ -14,23 +14,18 @@
 # ==============================================================================
 """Declare search path related."""
 import copy
-import uuid
 from collections import OrderedDict
-from typing import Dict, List, Callable, Union
+from typing import Dict, List, Union
 
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.built_in_pattern import BUILT_IN_PATTERN, \
-    is_built_in_pattern
-from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import context, gen_hash_key, DagGraph, \
-    MAX_DEGREE, cal_matching_score
+    is_built_in_pattern, find_built_in_pattern_occurrences
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import AlgorithmContext, gen_hash_key, \
+    DagGraph, MAX_DEGREE, cal_matching_score
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.known_module_name import BUILT_IN_MODULE_NAME
-from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern import Pattern, scope_name_mapping
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern import Pattern
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern_fuzzy_matching import \
     pattern_fuzzy_matching
-from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import OnnxNode, BaseNode
-
-module_name_to_src = {}
-used_module_name = dict()
-global_idx = 0
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import BaseNode
 
 
 class OptimizeRules:
@@ -92,12 +87,13 @@ def _is_valid_pattern(pattern, dag):
     return True
 
 
-def match_known_module_name(pattern):
+def match_known_module_name(pattern, context: AlgorithmContext):
     """
     Matching with know module name.
 
     Args:
         pattern (Pattern): To be replaced pattern.
+        context (AlgorithmContext): Context of current search.
 
     Returns:
         str, matched module name, return None if not matched.
@@ -112,28 +108,15 @@ def match_known_module_name(pattern):
     if matched_result:
         module_name = (matched_result if len(matched_result) == 1 else
                        sorted(matched_result, key=lambda x: x[1], reverse=True))[0][0]
-        if pattern.pattern not in used_module_name:
-            used_module_name[pattern.pattern] = 1
+        if pattern.pattern not in context.used_module_name:
+            context.used_module_name[pattern.pattern] = 1
         else:
-            module_name = f"{module_name}{used_module_name[pattern.pattern]}"
-            used_module_name[pattern.pattern] += 1
+            module_name = f"{module_name}{context.used_module_name[pattern.pattern]}"
+            context.used_module_name[pattern.pattern] += 1
         return module_name
     return None
 
 
-def generate_module_name():
-    """Generate module name."""
-    global global_idx
-    name = f"Module{global_idx}"
-    global_idx += 1
-    return name
-
-
-def random_name(module_name):
-    """Generate node name."""
-    return f"{module_name}_{str(uuid.uuid4()).split('-')[0]}"
-
-
 class MergedONNXNode(BaseNode):
     """Define merged onnx node."""
 
@@ -151,52 +134,15 @@ class MergedONNXNode(BaseNode):
         return self.op_type
 
 
-def _find_idx(sequence: List[BaseNode], target: str, equal_func: Callable,
-              start_idx: int = 0, end_idx=None) -> int:
-    """
-    Find matched result according to `equal_func` in [`start_idx`, `end_idx`).
-
-    Args:
-        sequence (list): Raw topo sequence.
-        target (str): Target node name.
-        equal_func (Callable): Function to judge whether matched.
-        start_idx (int): Start index.
-        end_idx (int): End index.
-
-    Returns:
-        int, index.
-    """
-    not_found = -1
-    if not sequence:
-        msg = "Empty sequence is not supported."
-        raise ValueError(msg)
-
-    end_idx = end_idx if end_idx else len(sequence)
-    for i in range(start_idx, end_idx):
-        if equal_func(sequence[i], target):
-            return i
-    return not_found
-
-
-def _match(x: OnnxNode, y: str):
-    """
-    Match func.
-
-    Args:
-        x (OnnxNode): Node instance.
-        y (int): To be compared value.
-    """
-    return x.name == y
-
-
 def _get_pattern_degree(sequence: Union[OrderedDict, dict, list],
-                        dag: DagGraph):
+                        dag: DagGraph, context: AlgorithmContext):
     """
     Get degree of the pattern.
 
     Args:
         sequence (Union[OrderedDict, dict, list]): Pattern to calculate.
         dag (DagGraph): Graph instance.
+        context (AlgorithmContext): Context of current search.
 
     Returns:
         tuple[int, int, set, set], in degree, out degree, precursors and successors.
@@ -225,12 +171,12 @@ def _get_pattern_degree(sequence: Union[OrderedDict, dict, list],
     return in_degree, out_degree, in_node - node_in_seq, out_node
 
 
-def _find_pattern_tail(sequence: List[BaseNode], pattern: Dict[str, str], tail_idx: int, dag: DagGraph):
+def _find_pattern_tail(node_index: Dict[str, int], pattern: Dict[str, str], tail_idx: int, dag: DagGraph):
     """
     Supply tail of the pattern sequence.
 
     Args:
-        sequence (list): Raw sequence.
+        node_index (dict[str, int]): Position of each node name in raw sequence.
         pattern (dict[str, str]): Pattern to be supplied.
         tail_idx (int): The position where pattern ends.
         dag (DagGraph): Graph object.
@@ -249,13 +195,15 @@ def _find_pattern_tail(sequence: List[BaseNode], pattern: Dict[str, str], tail_i
             continue
         for nd_name in dag.successor_table[node_name]:
             if nd_name not in pattern:
-                fd_idx = _find_idx(sequence=sequence, target=nd_name,
-                                   equal_func=_match, start_idx=tail_idx)
+                fd_idx = node_index.get(nd_name, -1)
+                if fd_idx < tail_idx:
+                    fd_idx = -1
                 tail_append_idx = max(fd_idx, tail_append_idx)
     return tail_append_idx
 
 
-def _supply_sequence(sequence: List[BaseNode], pattern: Dict[str, str], offset: int, dag: DagGraph):
+def _supply_sequence(sequence: List[BaseNode], pattern: Dict[str, str], offset: int, dag: DagGraph,
+                     node_index: Dict[str, int]):
     """
     Supply sequence from front to end.
 
@@ -264,6 +212,7 @@ def _supply_sequence(sequence: List[BaseNode], pattern: Dict[str, str], offset:
         pattern (dict[str, str]): Pattern to be supplied.
         offset (int): The position where pattern ends.
         dag (DagGraph): Graph object.
+        node_index (dict[str, int]): Position of each node name in raw sequence.
 
     Returns:
         tuple[dict, tuple[int, int]], found pattern and corresponding position.
@@ -272,7 +221,7 @@ def _supply_sequence(sequence: List[BaseNode], pattern: Dict[str, str], offset:
     tail_idx = offset
     ori_seq_len = len(found_sequence)
     while True:
-        tail_idx = _find_pattern_tail(sequence=sequence, pattern=found_sequence,
+        tail_idx = _find_pattern_tail(node_index=node_index, pattern=found_sequence,
                                       tail_idx=tail_idx, dag=dag)
         if tail_idx == -1:
             break
@@ -297,38 +246,31 @@ def _supply_sequence(sequence: List[BaseNode], pattern: Dict[str, str], offset:
                             offset + len(found_sequence) - ori_seq_len)
 
 
-def find_built_in_pattern(topo_order: List[BaseNode], dag: DagGraph) -> Dict[str, Pattern]:
+def find_built_in_pattern(topo_order: List[BaseNode], dag: DagGraph,
+                          context: AlgorithmContext) -> Dict[str, Pattern]:
     """
     Find built-in pattern.
 
     Args:
         dag (DagGraph): Graph object.
         topo_order (list): Topo sequence.
+        context (AlgorithmContext): Context of current search.
 
     Returns:
         dict[str, Pattern], found pattern.
     """
     pattern = dict()
-    cur_idx, total_len = 0, len(topo_order)
+    occurrences = find_built_in_pattern_occurrences([node.op_type for node in topo_order])
     for k in BUILT_IN_PATTERN:
+        if k not in occurrences:
+            continue
         ptn_len = BUILT_IN_PATTERN[k].ptn_length
-        cur_idx = 0
-        while cur_idx < total_len:
-            matched = True
+        for cur_idx in occurrences[k]:
             init_pattern = OrderedDict()
-            if cur_idx + ptn_len > total_len:
-                break
             for i in range(ptn_len):
                 init_pattern[topo_order[cur_idx + i].name] = topo_order[cur_idx + i].op_type
-                if topo_order[cur_idx + i].op_type != BUILT_IN_PATTERN[k].ptn_items[i]:
-                    matched = False
-                    break
-            if not matched:
-                cur_idx += 1
-                continue
-            in_degree, out_degree, _, _ = _get_pattern_degree(init_pattern, dag)
+            in_degree, out_degree, _, _ = _get_pattern_degree(init_pattern, dag, context)
             if in_degree != BUILT_IN_PATTERN[k].in_degree or out_degree != BUILT_IN_PATTERN[k].out_degree:
-                cur_idx += 1
                 continue
             ptn_key = f"{BUILT_IN_PATTERN[k].pattern}" \
                       f"[{BUILT_IN_PATTERN[k].in_degree}, {BUILT_IN_PATTERN[k].out_degree}]"
@@ -336,74 +278,156 @@ def find_built_in_pattern(topo_order: List[BaseNode], dag: DagGraph) -> Dict[str
                 pattern[ptn_key] = copy.deepcopy(BUILT_IN_PATTERN[k])
 
             pattern[ptn_key].insert(cur_idx, ptn_len)
-            cur_idx = cur_idx + 1
     return pattern
 
 
-def generate_pattern(topo_order: List[BaseNode], dag: DagGraph,
-                     sub_graph_size: int = 2) -> Dict[str, Pattern]:
+class PatternWindow:
+    """
+    Result of matching a sliding window.
+
+    Args:
+        nodes (list[BaseNode]): Nodes read in topological order, starts from the window head.
+        matched (tuple): Matched pattern, length, in degree and out degree, None if not matched.
+    """
+    __slots__ = ("names", "matched")
+
+    def __init__(self, nodes, matched):
+        self.names = tuple(node.name for node in nodes)
+        self.matched = matched
+
+
+class PatternWindows:
+    """
+    Sliding windows matched on a sequence, key is the tail node name of each window.
+
+    A window is reused by sequences derived from the sequence by replacing sub-graphs,
+    unless any node it read is replaced or relinked. Windows must be matched with
+    the same sub-graph size.
+
+    Args:
+        prev (PatternWindows): Windows of the sequence current sequence is derived from.
+        changed_nodes (set[str]): Nodes replaced or relinked since `prev` sequence.
+    """
+
+    def __init__(self, prev=None, changed_nodes=None):
+        self.windows = dict()
+        self._prev = prev
+        self._changed_nodes = changed_nodes if changed_nodes is not None else set()
+
+    def get(self, name):
+        """
+        Get window ends with the node.
+
+        Args:
+            name (str): Tail node name.
+
+        Returns:
+            PatternWindow, the window, None if not matched yet.
+        """
+        window = self.windows.get(name)
+        if window is None and self._prev is not None:
+            window = self._prev.get(name)
+            if window is not None and not self._changed_nodes.isdisjoint(window.names):
+                window = None
+        return window
+
+
+def _match_window(topo_order: List[BaseNode], cur_idx: int, dag: DagGraph, context: AlgorithmContext,
+                  sub_graph_size: int, node_index: Dict[str, int]) -> PatternWindow:
+    """
+    Match the sliding window ends at `cur_idx`.
+
+    Args:
+        topo_order (list): Topo sequence.
+        cur_idx (int): Position where the window ends.
+        dag (DagGraph): Graph object.
+        context (AlgorithmContext): Context of current search.
+        sub_graph_size (int): Mini sub-graph size.
+        node_index (dict[str, int]): Position of each node name in topo sequence.
+
+    Returns:
+        PatternWindow, matched window.
+    """
+    start = cur_idx - sub_graph_size + 1
+    cur_node = topo_order[cur_idx]
+    init_pattern = OrderedDict()
+    prev_node = None
+    jump_step = 0
+    for j in range(sub_graph_size - 1, 0, -1):
+        node_obj = dag.node_collection.get(topo_order[cur_idx - j].name)
+        # If current node is not child of `prev_node`,
+        # then break it. The topo order got from ONNX has a
+        # good feature, nodes belonging to one scope would be together.
+        # Thus, we can do linear scan on topo order.
+        if j != sub_graph_size - 1 and prev_node not in dag.precursor_table.get(topo_order[cur_idx - j].name):
+            jump_step = j + 1
+            break
+        init_pattern[node_obj.name] = node_obj.op_type
+        prev_node = topo_order[cur_idx - j].name
+
+    if jump_step == 0:
+        init_pattern[cur_node.name] = cur_node.op_type
+
+    if not _is_valid_pattern(init_pattern, dag):
+        # in OptimizeRules.CAN_NOT_BE_HEAD:
+        # If pattern starts with "ReLU", then pass it.
+        return PatternWindow(topo_order[start:cur_idx + 1], matched=None)
+
+    found_sequence, (_, found_end) = _supply_sequence(sequence=topo_order,
+                                                      pattern=init_pattern,
+                                                      offset=cur_idx - jump_step,
+                                                      dag=dag,
+                                                      node_index=node_index)
+    # The node next to `found_sequence` is read to link activation.
+    nodes = topo_order[start:max(cur_idx, found_end + 1) + 1]
+
+    in_degree, out_degree, _, _ = _get_pattern_degree(found_sequence, dag, context)
+    if out_degree > MAX_DEGREE or (not context.has_multi_inputs and in_degree > MAX_DEGREE):
+        return PatternWindow(nodes, matched=None)
+
+    ptn = '->'.join(found_sequence.values())
+    return PatternWindow(nodes, matched=(ptn, len(found_sequence), in_degree, out_degree))
+
+
+def generate_pattern(topo_order: List[BaseNode], dag: DagGraph, context: AlgorithmContext,
+                     sub_graph_size: int = 2, windows: PatternWindows = None) -> Dict[str, Pattern]:
     """
     Use self-adaptive sliding window to found sub-graph.
 
     Args:
         dag (DagGraph): Graph object.
         topo_order (list): Topo sequence.
+        context (AlgorithmContext): Context of current search.
         sub_graph_size (int): Mini sub-graph size.
+        windows (PatternWindows): Windows of the sequence, only windows not matched yet are
+            matched and recorded into it.
 
     Returns:
         dict[str, Pattern], found pattern.
     """
     pattern = {}
-    cur_idx, total_len = 0, len(topo_order)
-    while cur_idx < total_len:
-        if cur_idx < sub_graph_size - 1:
-            cur_idx += 1
+    windows = windows if windows is not None else PatternWindows()
+    node_index = None
+    for cur_idx in range(sub_graph_size - 1, len(topo_order)):
+        start = cur_idx - sub_graph_size + 1
+        window = windows.get(topo_order[cur_idx].name)
+        if window is None:
+            if node_index is None:
+                node_index = {node.name: idx for idx, node in enumerate(topo_order)}
+            window = _match_window(topo_order, cur_idx, dag, context, sub_graph_size, node_index)
+        windows.windows[topo_order[cur_idx].name] = window
+        if window.matched is None:
             continue
-        cur_node = topo_order[cur_idx]
-        init_pattern = OrderedDict()
-        prev_node = None
-        jump_step = 0
-        for j in range(sub_graph_size - 1, 0, -1):
-            node_obj = dag.node_collection.get(topo_order[cur_idx - j].name)
-            # If current node is not child of `prev_node`,
-            # then break it. The topo order got from ONNX has a
-            # good feature, nodes belonging to one scope would be together.
-            # Thus, we can do linear scan on topo order.
-            if j != sub_graph_size - 1 and prev_node not in dag.precursor_table.get(topo_order[cur_idx - j].name):
-                jump_step = j + 1
-                break
-            init_pattern[node_obj.name] = node_obj.op_type
-            prev_node = topo_order[cur_idx - j].name
-
-        if jump_step == 0:
-            init_pattern[cur_node.name] = cur_node.op_type
-
-        if not _is_valid_pattern(init_pattern, dag):
-            # in OptimizeRules.CAN_NOT_BE_HEAD:
-            # If pattern starts with "ReLU", then pass it.
-            cur_idx += 1
-            continue
-
-        found_sequence, _ = _supply_sequence(sequence=topo_order,
-                                             pattern=init_pattern,
-                                             offset=cur_idx - jump_step,
-                                             dag=dag)
 
-        in_degree, out_degree, _, _ = _get_pattern_degree(found_sequence, dag)
-        if out_degree > MAX_DEGREE or (not context.has_multi_inputs and in_degree > MAX_DEGREE):
-            cur_idx += 1
-            continue
-
-        ptn = '->'.join(found_sequence.values())
+        ptn, ptn_length, in_degree, out_degree = window.matched
         ptn_key = f"{ptn}[{in_degree}, {out_degree}]"
         if ptn_key not in pattern:
-            pattern[ptn_key] = Pattern(ptn, len(found_sequence),
+            pattern[ptn_key] = Pattern(ptn, ptn_length,
                                        in_degree=in_degree, out_degree=out_degree)
             if is_built_in_pattern(pattern[ptn_key]):
                 pattern[ptn_key].additional_score = cal_matching_score(pattern[ptn_key].ptn_length)
 
-        pattern[ptn_key].insert(cur_idx - sub_graph_size + 1, len(found_sequence))
-        cur_idx = cur_idx + 1
+        pattern[ptn_key].insert(start, ptn_length)
 
     pattern = _post_process_overlap(pattern)
     return pattern
@@ -445,21 +469,32 @@ class SearchPath(BasePath):
         prev_path (SearchPath): Previous search path instance.
         graph (DagGraph): Graph instance.
         sub_graph_size (int): Mini sub-graph size to search.
+        context (AlgorithmContext): Context of current search, inherited
+            from `prev_path` if not provided.
+        windows (PatternWindows): Windows matched on `sequence`, inherited
+            from `prev_path` if not provided.
 
     """
 
     def __init__(self, pattern, sequence: List[BaseNode], prev_path=None,
-                 graph=None, sub_graph_size: int = 2):
+                 graph=None, sub_graph_size: int = 2, context: AlgorithmContext = None,
+                 windows: PatternWindows = None):
         super(SearchPath, self).__init__(pattern, sequence, prev_path)
+        self.context = context if context is not None else prev_path.context
+        context = self.context
         self.graph = copy.copy(prev_path.graph) if prev_path is not None \
             else copy.copy(graph)
+        # Nodes replaced or relinked by current path.
+        self.changed_nodes = set()
         self.topo_order_aft_repl, self.inverted_index = self._create_new_order()
+        self.windows = PatternWindows(prev=windows if windows is not None else prev_path.windows,
+                                      changed_nodes=self.changed_nodes)
         self.node_collection = dict()
         self.hash_of_aft_repl = gen_hash_key(self.topo_order_aft_repl)
         if self.hash_of_aft_repl not in context.found_pattern:
-            built_in_ptn = find_built_in_pattern(self.topo_order_aft_repl, self.graph)
-            auto_search_ptn = generate_pattern(self.topo_order_aft_repl, dag=self.graph,
-                                               sub_graph_size=sub_graph_size)
+            built_in_ptn = find_built_in_pattern(self.topo_order_aft_repl, self.graph, context)
+            auto_search_ptn = generate_pattern(self.topo_order_aft_repl, dag=self.graph, context=context,
+                                               sub_graph_size=sub_graph_size, windows=self.windows)
             built_in_ptn.update(auto_search_ptn)
             context.found_pattern[self.hash_of_aft_repl] = context.sort_with_beam(
                 built_in_ptn
@@ -482,14 +517,15 @@ class SearchPath(BasePath):
             tuple[list, dict], topo sequence and inverted index
             to recover the sequence.
         """
-        if self.pattern.pattern not in scope_name_mapping:
-            module_name = generate_module_name()
-            known_module_name = match_known_module_name(self.pattern)
-            scope_name_mapping[self.pattern] = module_name
-            module_name_to_src[module_name] = self.pattern.pattern
+        context = self.context
+        if self.pattern.pattern not in context.scope_name_mapping:
+            module_name = context.generate_module_name()
+            known_module_name = match_known_module_name(self.pattern, context)
+            context.scope_name_mapping[self.pattern] = module_name
+            context.module_name_to_src[module_name] = self.pattern.pattern
         else:
-            module_name = scope_name_mapping[self.pattern.pattern]
-            known_module_name = module_name_to_src[module_name].known_module_name
+            module_name = context.scope_name_mapping[self.pattern.pattern]
+            known_module_name = context.module_name_to_src[module_name].known_module_name
         self.pattern.module_name = module_name
         self.pattern.known_module_name = known_module_name
         if known_module_name:
@@ -545,7 +581,7 @@ class SearchPath(BasePath):
                 path_length += 1
                 continue
 
-            in_degree, out_degree, inputs, outputs = _get_pattern_degree(visited_node, self.graph)
+            in_degree, out_degree, inputs, outputs = _get_pattern_degree(visited_node, self.graph, self.context)
             if in_degree != pattern.in_degree or out_degree != pattern.out_degree:
                 topo_order.extend(visited_node)
                 index += j + 1
@@ -553,7 +589,8 @@ class SearchPath(BasePath):
                 continue
 
             inverted_index[path_length] = [j + index for j in range(pattern_len)]
-            new_node = MergedONNXNode(name=random_name(pattern.module_name),
+            self.changed_nodes.update(node.name for node in visited_node)
+            new_node = MergedONNXNode(name=self.context.generate_node_name(pattern.module_name),
                                       module_name=pattern.module_name,
                                       ori_nodes=visited_node[:],
                                       inputs=inputs,
@@ -600,6 +637,7 @@ class SearchPath(BasePath):
         # Add current node to precursor table.
         self.graph.precursor_table[merged_node.name] = in_node
         # Link the precursor to current node.
+        self.changed_nodes.update(in_node)
         for p_nd in in_node:
             scsr_nodes = self.graph.successor_table[p_nd].copy()
             for i, nd_name in enumerate(scsr_nodes):
@@ -619,6 +657,7 @@ class SearchPath(BasePath):
         # Add current node to successor table.
         self.graph.successor_table[merged_node.name] = out_node
         # Link successor to current node.
+        self.changed_nodes.update(out_node)
         for s_nd in out_node:
             p_nodes = self.graph.precursor_table[s_nd].copy()
             for i, nd_name in enumerate(p_nodes):
@@ -644,7 +683,7 @@ class SearchPath(BasePath):
         """Calculate heuristic score of the path."""
         res = []
         for ptn in self.new_pattern.items():
-            res.append(ptn[1].count * self._cal_merged_module_length(ptn[1]) / context.get_sequence_length())
+            res.append(ptn[1].count * self._cal_merged_module_length(ptn[1]) / self.context.get_sequence_length())
         if not res:
             return 1.0
         return max(res)
@@ -658,7 +697,8 @@ class SearchPath(BasePath):
 
     def _repl_ratio(self):
         """Calculate replacement ratio of current path."""
-        return (context.get_sequence_length() - len(self.topo_order_aft_repl)) / context.get_sequence_length()
+        sequence_length = self.context.get_sequence_length()
+        return (sequence_length - len(self.topo_order_aft_repl)) / sequence_length
 
     def _actual_val(self):
         """Calculate ground-truth score of the path."""
@@ -682,9 +722,9 @@ class SearchPath(BasePath):
 
         def _dfs(module_name):
             chain = []
-            src = module_name_to_src[module_name]
+            src = self.context.module_name_to_src[module_name]
             for sub_module in src.split("->"):
-                if sub_module in module_name_to_src:
+                if sub_module in self.context.module_name_to_src:
                     chain.append(_dfs(sub_module))
                 else:
                     chain.append(sub_module)
@@ -707,15 +747,33 @@ class ReplacePath(BasePath):
         """
         Greedy matching.
 
+        Non-overlapping occurrences of pattern are replaced from left to right
+        by index ranges, thus an op type is never matched partially.
+
         Args:
             increment_idx (int): To deduplicate module name.
+
+        Returns:
+            str, module name, return None if pattern not found.
         """
-        src = ",".join(self.topo_order_bef_repl)
-        tgt = self.pattern.pattern
         md_name = f"Module{increment_idx}"
-        src_aft_repl = src.replace(tgt, md_name)
-        if src != src_aft_repl:
-            self.pattern.module_name = md_name
-            self.topo_order_aft_repl = src_aft_repl.split(",")
-            return md_name
-        return None
+        op_types = [item if isinstance(item, str) else item.op_type for item in self.topo_order_bef_repl]
+        ptn_items = self.pattern.ptn_items
+        ptn_len = len(ptn_items)
+        topo_order = []
+        start = 0
+        index = 0
+        while index <= len(op_types) - ptn_len:
+            if op_types[index] != ptn_items[0] or op_types[index:index + ptn_len] != ptn_items:
+                index += 1
+                continue
+            topo_order.extend(self.topo_order_bef_repl[start:index])
+            topo_order.append(md_name)
+            index += ptn_len
+            start = index
+        if not topo_order:
+            return None
+        topo_order.extend(self.topo_order_bef_repl[start:])
+        self.pattern.module_name = md_name
+        self.topo_order_aft_repl = topo_order
+        return md_name
@@ -19,15 +19,16 @@ from typing import Dict, List
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.built_in_pattern import USER_DEFINED_PATTERN
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern_fuzzy_matching import \
     pattern_fuzzy_matching
-from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import context, DagGraph, gen_hash_key, \
-    ACCEPTABLE_RESULT_COUNT, MAX_ITERATION_DEPTH_OF_SINGLE_IPT
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import AlgorithmContext, DagGraph, \
+    gen_hash_key, ACCEPTABLE_RESULT_COUNT, SearchBudget
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import MINI_FREQUENCY, \
-    MAX_ITERATION_DEPTH_OF_MULTI_IPT, SATISFIED_SCORE
+    SATISFIED_SCORE
 from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
 from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import BaseNode
 from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.search_path import SearchPath, Pattern, \
-    generate_pattern, find_built_in_pattern, ReplacePath
+    PatternWindows, generate_pattern, find_built_in_pattern, ReplacePath
 from mindinsight.mindconverter.common.exceptions import SubGraphSearchingError
+from mindinsight.mindconverter.common.log import logger as log
 
 
 def _is_satisfied(path):
@@ -40,9 +41,7 @@ def _is_satisfied(path):
     Returns:
         bool, True or False.
     """
-    recursion_depth = MAX_ITERATION_DEPTH_OF_MULTI_IPT if context.has_multi_inputs \
-        else MAX_ITERATION_DEPTH_OF_SINGLE_IPT
-    if len(path.recursion_path) > recursion_depth:
+    if len(path.recursion_path) > path.context.max_depth():
         return True
     candidate_eval = any([is_pattern_satisfied(p, path) for p in path.new_pattern.values()])
     if not path.new_pattern or not candidate_eval:
@@ -63,34 +62,43 @@ def is_pattern_satisfied(pattern, seq):
 
 
 def _search(init_pattern: Dict[str, Pattern], init_topo_order: List[BaseNode],
-            init_graph, sub_graph_size: int = 2) -> List[SearchPath]:
+            init_graph, context: AlgorithmContext, sub_graph_size: int = 2) -> List[SearchPath]:
     """
-    Search base on merged graph, until all frequency is 1.
+    Search base on merged graph, until all frequency is 1 or the search budget is exhausted.
 
     Args:
         init_pattern (dict): Init pattern to be replaced.
         init_topo_order (list): Init topo sequence.
         init_graph (DagGraph): Graph instance.
+        context (AlgorithmContext): Context of current search.
         sub_graph_size (int): Min sub-graph size.
 
     Returns:
-        list, available path.
+        list, available path, contains paths not finished if the search budget is exhausted.
     """
     # 1. Sort the pattern by frequency.
     sorted_pattern = context.sort_with_beam(init_pattern)
     # 2. Put pattern into queue.
     queue = PriorityQueue()
+    init_windows = PatternWindows()
+    generate_pattern(init_topo_order, dag=init_graph, context=context,
+                     sub_graph_size=sub_graph_size, windows=init_windows)
     for pattern_inst in sorted_pattern.values():
+        if context.is_budget_exhausted():
+            break
         queue.put(
             SearchPath(pattern=pattern_inst, sequence=init_topo_order,
                        graph=init_graph,
-                       sub_graph_size=sub_graph_size),
+                       sub_graph_size=sub_graph_size,
+                       context=context,
+                       windows=init_windows),
             block=False
         )
+        context.expanded_paths += 1
 
     available_path = []
     deduplicate_path = set()
-    while not queue.empty():
+    while not queue.empty() and not context.is_budget_exhausted():
         # a. replace pattern in current topo order.
         cur_path = queue.get(block=False)
         cur_topo_order = cur_path.topo_order_aft_repl
@@ -115,29 +123,42 @@ def _search(init_pattern: Dict[str, Pattern], init_topo_order: List[BaseNode],
                             gen_hash_key(cur_topo_order, without_module=True)])
             if key in context.visited:
                 continue
+            if context.is_budget_exhausted():
+                queue.put(cur_path, block=False)
+                break
             # c. create new SearchPath.
             new_path = SearchPath(pattern=cur_pattern, sequence=cur_topo_order, prev_path=cur_path,
                                   sub_graph_size=sub_graph_size)
             context.visited.add(key)
+            context.expanded_paths += 1
             # d. put it into heap to sort.
             queue.put(new_path, block=False)
 
+    budget_exhausted = context.is_budget_exhausted()
+    if budget_exhausted:
+        # Take paths not finished into account to return the best path found so far.
+        while not queue.empty():
+            cur_path = queue.get(block=False)
+            if cur_path.hash_of_aft_repl not in deduplicate_path:
+                available_path.append(cur_path)
+                deduplicate_path.add(cur_path.hash_of_aft_repl)
+    log.info("Sub-graph search expanded %d paths in %.2fs with %s, budget exhausted: %s.",
+             context.expanded_paths, context.elapsed_time(), context.budget, budget_exhausted)
     return available_path
 
 
-def _sub_graph_matching(init_dag, beam_width=5, sub_graph_size=4):
+def _sub_graph_matching(init_dag, context, sub_graph_size=4):
     """
     Sub-graph matching.
 
     Args:
         init_dag (DagGraph): Graph instance.
-        beam_width (int): Beam width used to prune search path.
+        context (AlgorithmContext): Context of current search.
         sub_graph_size (int): Mini sub-graph size to find.
 
     Returns:
         SearchPath, found path.
     """
-    context.set_beam_width(beam_width)
 
     def _get_top_1(available_path: list):
         if not available_path:
@@ -147,10 +168,10 @@ def _sub_graph_matching(init_dag, beam_width=5, sub_graph_size=4):
 
     topo_order = [node for _, (_, node) in enumerate(context.node_collection.items())]
     context.set_sequence_length(len(topo_order))
-    built_in_pattern = find_built_in_pattern(topo_order, init_dag)
-    pattern = generate_pattern(topo_order, dag=init_dag, sub_graph_size=sub_graph_size)
+    built_in_pattern = find_built_in_pattern(topo_order, init_dag, context)
+    pattern = generate_pattern(topo_order, dag=init_dag, context=context, sub_graph_size=sub_graph_size)
     pattern.update(built_in_pattern)
-    found_path = _search(pattern, topo_order, init_graph=init_dag, sub_graph_size=2)
+    found_path = _search(pattern, topo_order, init_graph=init_dag, context=context, sub_graph_size=2)
     return _get_top_1(found_path)
 
 
@@ -359,12 +380,13 @@ def _retrieve_operators(module_path, module_dict):
     return module_path.pattern.module_name, val
 
 
-def _build_connection(loader):
+def _build_connection(loader, context):
     """
     Build dag graph.
 
     Args:
         loader (OnnxDataLoader): Dataloader.
+        context (AlgorithmContext): Context of current search.
     """
     context.set_init_node_collection(loader.nodes_dict)
     # Output name is not same with node name
@@ -394,8 +416,13 @@ def flatten_graph(graph):
     return [f"Model/{node.op_type}" for node in graph.node_collection.values()]
 
 
-def validate_topo_order_succession():
-    """Validate whether topological order is successive."""
+def validate_topo_order_succession(context):
+    """
+    Validate whether topological order is successive.
+
+    Args:
+        context (AlgorithmContext): Context of current search.
+    """
     module_interval = dict()
     for idx, node_name in enumerate(context.node_collection.keys()):
         name_arr = node_name.split("/")
@@ -451,17 +478,19 @@ def greedy_match(topo_order, user_defined_ptn):
 
 
 @SubGraphSearchingError.check_except("Sub-Graph pattern searching fail.")
-def generate_scope_name(data_loader):
+def generate_scope_name(data_loader, search_budget: SearchBudget = None):
     """
     Generate scope name according to computation graph.
 
     Args:
         data_loader (OnnxDataLoader): Data loader instance.
+        search_budget (SearchBudget): Budget of sub-graph search. Default: None, no limit.
 
     Returns:
         list[str], generated scope name.
     """
-    init_dag = _build_connection(data_loader)
+    context = AlgorithmContext(search_budget)
+    init_dag = _build_connection(data_loader, context)
     try:
         if USER_DEFINED_PATTERN:
             topo_order = [node for _, node in context.node_collection.items()]
@@ -469,7 +498,7 @@ def generate_scope_name(data_loader):
             topo_order_with_scope_name_list = _retrieve_scope_name(repl_path) if repl_path else flatten_graph(init_dag)
             return topo_order_with_scope_name_list
 
-        result = _sub_graph_matching(init_dag, beam_width=5, sub_graph_size=6)
+        result = _sub_graph_matching(init_dag, context, sub_graph_size=6)
         topo_order_with_scope_name_list = _retrieve_scope_name(result) if result else flatten_graph(init_dag)
 
         if len(topo_order_with_scope_name_list) != len(data_loader.nodes_dict):
@@ -27,7 +27,8 @@ class GraphFactory:
 
     @classmethod
     def init(cls, graph_path: str,
-             input_nodes: dict = None, output_nodes: List[str] = None):
+             input_nodes: dict = None, output_nodes: List[str] = None,
+             export_in_process: bool = False, search_budget=None):
         """
         Init an instance of graph.
 
@@ -35,6 +36,8 @@ class GraphFactory:
             graph_path (str): Graph or model file path.
             input_nodes (dict): Input nodes.
             output_nodes (list[str]): Output nodes.
+            export_in_process (bool): Whether to export PyTorch model in current process. Default: False.
+            search_budget (SearchBudget): Budget of sub-graph search. Default: None, no limit.
 
         Returns:
             Graph, graph instance.
@@ -44,4 +47,5 @@ class GraphFactory:
         if not isinstance(output_nodes, list):
             raise TypeError("`output_nodes` must be type of list.")
         return OnnxGraph.load(model_path=graph_path, input_nodes=input_nodes,
-                              output_nodes=output_nodes)
+                              output_nodes=output_nodes, export_in_process=export_in_process,
+                              search_budget=search_budget)
@@ -95,6 +95,7 @@ class Graph(BaseGraph, abc.ABC):
         self.model = model
         self._raw_input_nodes = kwargs.get("input_nodes")
         self._raw_output_nodes = kwargs.get("output_nodes")
+        self._search_budget = kwargs.get("search_budget")
         self._nodes_collection = OrderedDict()
         self._nodes_record = dict()
         self._shape_dict = dict()
@@ -118,7 +118,7 @@ class OnnxGraph(Graph):
         model_data = OnnxDataLoader(self.model,
                                     input_nodes=self._raw_input_nodes,
                                     output_nodes=self._raw_output_nodes)
-        scope_name_list = generate_scope_name(model_data)
+        scope_name_list = generate_scope_name(model_data, search_budget=self._search_budget)
 
         self._shape_dict = model_data.node_output_shape_dict
         for ind, (node_name, node) in enumerate(model_data.nodes_dict.items()):
@@ -22,7 +22,8 @@ from collections import OrderedDict
 import numpy as np
 
 from mindinsight.mindconverter.common.log import logger as log
-from mindinsight.mindconverter.graph_based_converter.common.utils import fetch_output_from_onnx_model, build_feed_dict
+from mindinsight.mindconverter.graph_based_converter.common.utils import fetch_output_from_onnx_model, \
+    build_feed_dict, InferenceSessionCache
 from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
 from mindinsight.mindconverter.graph_based_converter.third_party_graph.optimizer import OnnxSimplify
 
@@ -269,6 +270,8 @@ class OnnxDataLoader:
         self._global_context = GlobalContext()
         # params parsed in init
         self.inferred_model = None
+        # Sessions of onnxruntime to be reused in shape and value inference.
+        self._session_cache = InferenceSessionCache()
 
         self._nodes_dict = OrderedDict()  # {node_name: OnnxNode} NO INPUT NODE
         self.tensors_dict = {}  # {tensor_name: OnnxTensor}
@@ -285,19 +288,36 @@ class OnnxDataLoader:
         # Define dynamic nodes to be evaluated with onnxruntime
         self.dynamic_resize_node = list()
         self.dynamic_reshape_node = list()
-        self.eliminated_nodes = list()
+        self._eliminated_nodes = set()
+        # Cache of nodes_dict, rebuilt only when nodes or eliminated nodes changed.
+        self._filtered_nodes_dict = None
 
         self.initialize()
 
     @property
     def nodes_dict(self):
         """Return a filtered nodes_dict."""
-        filtered_dict = dict()
-        for k, v in self._nodes_dict.items():
-            if k in self.eliminated_nodes:
-                continue
-            filtered_dict[k] = v
-        return filtered_dict
+        if self._filtered_nodes_dict is None:
+            self._filtered_nodes_dict = {k: v for k, v in self._nodes_dict.items()
+                                         if k not in self._eliminated_nodes}
+        return self._filtered_nodes_dict
+
+    @property
+    def eliminated_nodes(self):
+        """Return names of nodes eliminated from the graph."""
+        return frozenset(self._eliminated_nodes)
+
+    def add_eliminated_nodes(self, node_names):
+        """
+        Add nodes to be eliminated from the graph.
+
+        Args:
+            node_names (Iterable[str]): Names of nodes to be eliminated.
+        """
+        eliminated_num = len(self._eliminated_nodes)
+        self._eliminated_nodes.update(node_names)
+        if len(self._eliminated_nodes) != eliminated_num:
+            self._filtered_nodes_dict = None
 
     def _infer_model(self):
         """
@@ -389,7 +409,8 @@ class OnnxDataLoader:
 
         feed_dict = build_feed_dict(self.inferred_model, self.input_nodes)
 
-        outputs_infer = fetch_output_from_onnx_model(self.model, feed_dict, output_nodes_name)
+        outputs_infer = fetch_output_from_onnx_model(self.model, feed_dict, output_nodes_name,
+                                                     session_cache=self._session_cache)
         return outputs_infer
 
     def _parse_nodes(self):
@@ -426,6 +447,7 @@ class OnnxDataLoader:
                 continue
             self.repeated_weight[k] = record_tensors[k][:]
 
+        self._filtered_nodes_dict = None
         self._global_context.onnx_nodes_collection = self._nodes_dict
         self._global_context.onnx_nodes_topo_index = nodes_topo_idx
         # now only process shared weights for multi-inputs models
@@ -488,7 +510,7 @@ class OnnxDataLoader:
     def build_nodes_connection(self):
         """Find the previous and next nodes of each node."""
         for node_name, node in self._nodes_dict.items():
-            if node_name in self.eliminated_nodes:
+            if node_name in self._eliminated_nodes:
                 continue
             for input_name in node.input_name_list:
                 if self.output_name_to_node_name.get(input_name):
@@ -527,6 +549,8 @@ class OnnxDataLoader:
 
         # 3. parse value info (incl. node output shape)
         if self._is_infer_shape:
+            # Values of dynamic shapes are fetched later, thus one session serves both fetches.
+            self._session_cache.reserve_outputs(self._get_dynamic_shape_tensors())
             try:
                 self._infer_model()
                 self._parse_value_info()
@@ -545,39 +569,38 @@ class OnnxDataLoader:
         # 6. Run onnx model to fetch actual value of eliminated nodes.
         self._fetch_eliminated_nodes_value()
 
+    def _get_dynamic_shape_tensors(self):
+        """Get non-constant shape inputs of reshape nodes and size inputs of resize nodes."""
+        dynamic_shape_tensors = []
+        for nd_inst in self._nodes_dict.values():
+            if nd_inst.op_type == "Reshape" and nd_inst.input_name_list[1] not in self.tensors_dict:
+                dynamic_shape_tensors.append(nd_inst.input_name_list[1])
+            elif nd_inst.op_type == "Resize" and len(nd_inst.input_name_list) > 3 \
+                    and nd_inst.input_name_list[-1] not in self.tensors_dict:
+                dynamic_shape_tensors.append(nd_inst.input_name_list[3])
+        return [tensor for tensor in dynamic_shape_tensors if tensor in self.output_name_to_node_name]
+
     def _fetch_eliminated_nodes_value(self):
         """Fetch eliminated nodes values by running onnx inference."""
+        output_tensors = []
+        # Shape input of reshape nodes.
+        for node in self.dynamic_reshape_node:
+            output_tensors.append(self._nodes_dict[node].input_name_list[1])
+        # Size input of resize nodes.
+        for node in self.dynamic_resize_node:
+            output_tensors.append(self._nodes_dict[node].input_name_list[3])
+        if not output_tensors:
+            return
 
-        def _for_reshape():
-            """Do reshape nodes."""
-            nonlocal self
-            output_tensors = []
-            if not self.dynamic_reshape_node:
-                return
-            for node in self.dynamic_reshape_node:
-                shape_ref = self._nodes_dict[node].input_name_list[1]
-                output_tensors.append(shape_ref)
-            feed_dict = build_feed_dict(self.model, self.input_nodes)
-            fetch_dict = fetch_output_from_onnx_model(self.model, feed_dict=feed_dict, output_nodes=output_tensors)
-            for opt_tensor_name, value in fetch_dict.items():
-                self.tensors_dict[opt_tensor_name] = OnnxTensor(value, opt_tensor_name)
-
-        def _for_resize():
-            """Do resize nodes."""
-            nonlocal self
-            output_tensors = []
-            if not self.dynamic_resize_node:
-                return
-            for node in self.dynamic_resize_node:
-                shape_ref = self._nodes_dict[node].input_name_list[3]
-                output_tensors.append(shape_ref)
-            feed_dict = build_feed_dict(self.model, self.input_nodes)
-            fetch_dict = fetch_output_from_onnx_model(self.model, feed_dict=feed_dict, output_nodes=output_tensors)
-            for opt_tensor_name, value in fetch_dict.items():
-                self.tensors_dict[opt_tensor_name] = OnnxTensor(value, opt_tensor_name)
-
-        _for_reshape()
-        _for_resize()
+        # Fetch all values in one run.
+        output_tensors = list(OrderedDict.fromkeys(output_tensors))
+        feed_dict = build_feed_dict(self.model, self.input_nodes)
+        fetch_dict = fetch_output_from_onnx_model(self.model, feed_dict=feed_dict, output_nodes=output_tensors,
+                                                  session_cache=self._session_cache)
+        for opt_tensor_name, value in fetch_dict.items():
+            self.tensors_dict[opt_tensor_name] = OnnxTensor(value, opt_tensor_name)
+        # Sessions are no longer required after fetching.
+        self._session_cache.release()
 
     def _find_nodes_to_be_eliminated(self):
         """Call all PASS to optimize graph."""
@@ -615,7 +638,7 @@ class OnnxDataLoader:
 
             eliminated_nodes = _traceback_precursor_nodes_until_shape_op(to_shape)
             self.dynamic_reshape_node.append(nd_name)
-            self.eliminated_nodes += eliminated_nodes
+            self.add_eliminated_nodes(eliminated_nodes)
 
     def _pass_of_resize(self, nd_name, nd_inst):
         """Create a PASS to optimize resize operations in ONNX ir graph."""
@@ -641,7 +664,7 @@ class OnnxDataLoader:
 
             eliminated_nodes = _traceback_precursor_nodes_until_shape_op(to_shape)
             self.dynamic_resize_node.append(nd_name)
-            self.eliminated_nodes += eliminated_nodes
+            self.add_eliminated_nodes(eliminated_nodes)
 
 
 class NodeWeight:
@@ -13,20 +13,52 @@
 # limitations under the License.
 # ==============================================================================
 """Define ONNX optimizer operations."""
-import copy
+import logging
+import time
+from collections import OrderedDict
 from importlib import import_module
 
+from mindinsight.mindconverter.common.log import logger as log
 from mindinsight.mindconverter.common.exceptions import ModelLoadingError
 from mindinsight.mindconverter.graph_based_converter.common.utils import fetch_output_from_onnx_model, build_feed_dict
 
 
+# Passes of onnxoptimizer to be run before and after folding constant nodes.
+OPTIMIZER_PASSES = (
+    'eliminate_deadend',
+    'eliminate_nop_dropout',
+    'eliminate_nop_cast',
+    'eliminate_nop_monotone_argmax',
+    'eliminate_nop_pad',
+    'extract_constant_to_initializer',
+    'eliminate_unused_initializer',
+    'eliminate_nop_transpose',
+    'eliminate_identity',
+    'fuse_add_bias_into_conv',
+    'fuse_consecutive_concats',
+    'fuse_consecutive_log_softmax',
+    'fuse_consecutive_reduce_unsqueeze',
+    'fuse_consecutive_squeezes',
+    'fuse_consecutive_transposes',
+    'fuse_matmul_add_bias_into_gemm',
+    'fuse_pad_into_conv',
+    'fuse_transpose_into_gemm'
+)
+
+
 class OnnxSimplify:
-    """To simplify onnx model."""
+    """
+    To simplify onnx model.
 
-    def __init__(self):
+    Args:
+        optimizer_passes (Sequence[str]): Passes of onnxoptimizer to be run. Default: None, use `OPTIMIZER_PASSES`.
+    """
+
+    def __init__(self, optimizer_passes=None):
         self._onnx_model = None
-        self._constant_nodes = list()
+        self._constant_nodes = OrderedDict()
         self._outputs_infer = dict()
+        self._optimizer_passes = list(optimizer_passes if optimizer_passes is not None else OPTIMIZER_PASSES)
 
     def run_onnx_simplify(self, onnx_model, input_nodes):
         """
@@ -39,6 +71,11 @@ class OnnxSimplify:
         self._onnx_model = onnx_model
         self._optimizer()
         self._get_constant_nodes()
+        if not self._constant_nodes:
+            # Optimizer has reached the fixed point, running it again changes nothing.
+            log.debug("No constant node is found, skip folding constant nodes and the second optimization.")
+            return self._onnx_model
+
         self._onnx_infer(input_nodes)
         self._replace_constant_nodes()
         self._optimizer()
@@ -49,48 +86,59 @@ class OnnxSimplify:
         """Run optimizer from onnx to eliminate constant nodes."""
 
         onnxoptimizer = import_module('onnxoptimizer')
-        optimizers_list = [
-            'eliminate_deadend',
-            'eliminate_nop_dropout',
-            'eliminate_nop_cast',
-            'eliminate_nop_monotone_argmax',
-            'eliminate_nop_pad',
-            'extract_constant_to_initializer',
-            'eliminate_unused_initializer',
-            'eliminate_nop_transpose',
-            'eliminate_identity',
-            'fuse_add_bias_into_conv',
-            'fuse_consecutive_concats',
-            'fuse_consecutive_log_softmax',
-            'fuse_consecutive_reduce_unsqueeze',
-            'fuse_consecutive_squeezes',
-            'fuse_consecutive_transposes',
-            'fuse_matmul_add_bias_into_gemm',
-            'fuse_pad_into_conv',
-            'fuse_transpose_into_gemm'
-        ]
 
         input_num = len(self._onnx_model.graph.input)
-        onnx_model_optimized = onnxoptimizer.optimize(self._onnx_model, optimizers_list, fixed_point=True)
+        start = time.perf_counter()
+        if log.isEnabledFor(logging.DEBUG):
+            onnx_model_optimized = self._optimize_with_pass_timing(onnxoptimizer)
+        else:
+            onnx_model_optimized = onnxoptimizer.optimize(self._onnx_model, self._optimizer_passes, fixed_point=True)
+        log.debug("Optimizing onnx model with %d nodes costs %.4fs.",
+                  len(self._onnx_model.graph.node), time.perf_counter() - start)
 
         if self._onnx_model.ir_version > 3:
             del onnx_model_optimized.graph.input[input_num:]
         self._onnx_model = onnx_model_optimized
 
+    def _optimize_with_pass_timing(self, onnxoptimizer):
+        """
+        Run passes one by one on the evolving model, and log wall time of each pass.
+
+        Note:
+            Fixed point optimization reruns only passes reporting partial transforms, none of
+            `OPTIMIZER_PASSES` does, thus one round of passes gives the same model apart from names
+            of tensors created by passes. Each pass round-trips the whole model, so it is only used
+            in debug mode.
+
+        Args:
+            onnxoptimizer (module): The onnxoptimizer module.
+
+        Returns:
+            onnx.ModelProto, optimized model.
+        """
+        onnx_model = self._onnx_model
+        for opt_pass in self._optimizer_passes:
+            start = time.perf_counter()
+            onnx_model = onnxoptimizer.optimize(onnx_model, [opt_pass])
+            log.debug("Optimizer pass %s costs %.4fs.", opt_pass, time.perf_counter() - start)
+        return onnx_model
+
     def _get_constant_nodes(self):
-        """Get constant nodes."""
+        """Get constant nodes, which are indexed by their first output name."""
 
-        const_nodes = list()
-        const_tensors = [tensor_init.name for tensor_init in self._onnx_model.graph.initializer]
-        const_tensors.append([node.output[0]
-                              for node in self._onnx_model.graph.node if node.op_type == 'Constant'])
+        const_nodes = OrderedDict()
+        const_tensors = {tensor_init.name for tensor_init in self._onnx_model.graph.initializer}
+        const_tensors.update(node.output[0]
+                             for node in self._onnx_model.graph.node if node.op_type == 'Constant')
 
         for node in self._onnx_model.graph.node:
-            if node.op_type == 'Shape' or all([input_node in const_tensors for input_node in node.input]):
-                const_nodes.append(node)
-                const_tensors.extend(node.output)
+            if not node.output:
+                continue
+            if node.op_type == 'Shape' or all(input_node in const_tensors for input_node in node.input):
+                const_nodes[node.output[0]] = list(node.output)
+                const_tensors.update(node.output)
 
-        self._constant_nodes = copy.deepcopy(const_nodes)
+        self._constant_nodes = const_nodes
 
     @ModelLoadingError.check_except(
         "Error occurs when loading model with given params, please check `--shape`, "
@@ -105,18 +153,10 @@ class OnnxSimplify:
         """
         feed_dict = build_feed_dict(self._onnx_model, infer_inputs_shape)
         output_nodes_name = list()
-        for node in self._constant_nodes:
-            output_nodes_name.extend(node.output)
-        original_outputs = [nd.name for nd in self._onnx_model.graph.output]
+        for outputs in self._constant_nodes.values():
+            output_nodes_name.extend(outputs)
         self._outputs_infer = fetch_output_from_onnx_model(self._onnx_model,
                                                            feed_dict, output_nodes_name)
-        idx = 0
-        while idx < len(self._onnx_model.graph.output):
-            cur_opt = self._onnx_model.graph.output[idx]
-            if cur_opt.name not in original_outputs:
-                self._onnx_model.graph.output.remove(cur_opt)
-                continue
-            idx += 1
 
     def _replace_constant_nodes(self):
         """Replace constant nodes to nodes with op_type 'Constant'."""
@@ -124,29 +164,29 @@ class OnnxSimplify:
         onnx = import_module('onnx')
         np_helper = import_module('onnx.numpy_helper')
 
-        for i, node in enumerate(self._onnx_model.graph.node):
-            if node in self._constant_nodes:
-                for output in node.output:
-                    new_attr = onnx.helper.make_attribute(
-                        'value',
-                        np_helper.from_array(self._outputs_infer[output], name=output)
-                    )
-
-                    new_node = onnx.helper.make_node(
-                        op_type='Constant',
-                        inputs=list(),
-                        outputs=[output],
-                        name='_'.join(('node', output))
-                    )
-                    new_node.attribute.extend([new_attr])
-                    self._insert_node(self._onnx_model.graph.node, i + 1, new_node)
-                del self._onnx_model.graph.node[i]
-
-    @staticmethod
-    def _insert_node(repeated_container, index, node):
-        """Insert node into onnx model."""
-
-        repeated_container.extend([repeated_container[-1]])
-        for i in reversed(range(index + 1, len(repeated_container) - 1)):
-            repeated_container[i].CopyFrom(repeated_container[i - 1])
-        repeated_container[index].CopyFrom(node)
+        graph_nodes = self._onnx_model.graph.node
+        new_nodes = list()
+        for node in graph_nodes:
+            if not node.output or node.output[0] not in self._constant_nodes:
+                new_nodes.append(node)
+                continue
+            # Constant nodes of multi-outputs node are placed in reversed order as before.
+            for output in reversed(node.output):
+                new_attr = onnx.helper.make_attribute(
+                    'value',
+                    np_helper.from_array(self._outputs_infer[output], name=output)
+                )
+
+                new_node = onnx.helper.make_node(
+                    op_type='Constant',
+                    inputs=list(),
+                    outputs=[output],
+                    name='_'.join(('node', output))
+                )
+                new_node.attribute.extend([new_attr])
+                new_nodes.append(new_node)
+
+        # Rebuild the container once, original nodes are removed after being copied.
+        node_num = len(graph_nodes)
+        graph_nodes.extend(new_nodes)
+        del graph_nodes[:node_num]
@@ -15,6 +15,7 @@
 """Third party graph parser."""
 import multiprocessing as mp
 import os
+import tempfile
 from importlib import import_module
 
 from mindinsight.mindconverter.common.log import logger as log
@@ -36,6 +37,9 @@ class PyTorchGraphParser(GraphParser):
 
         Args:
             model_path (str): Model file path.
+            input_nodes (dict): Input nodes to generate onnx model.
+            export_in_process (bool): Whether to export onnx model in current process,
+                which is only safe after torch version check succeeded. Default: False.
 
         Returns:
             object, torch model.
@@ -48,7 +52,8 @@ class PyTorchGraphParser(GraphParser):
 
         try:
             onnx_model_sim = cls._convert_pytorch_graph_to_onnx(
-                model_path, kwargs['input_nodes'], opset_version=11)
+                model_path, kwargs['input_nodes'], opset_version=11,
+                in_process=kwargs.get('export_in_process', False))
             return onnx_model_sim
         except ModuleNotFoundError:
             error_msg = "Cannot find model scripts in system path, " \
@@ -57,7 +62,7 @@ class PyTorchGraphParser(GraphParser):
             raise error
 
     @staticmethod
-    def _convert_pytorch_graph_to_onnx(model_path, input_nodes, opset_version=None):
+    def _convert_pytorch_graph_to_onnx(model_path, input_nodes, opset_version=None, in_process=False):
         """
         Convert Pytorch model to ONNX model.
 
@@ -65,72 +70,117 @@ class PyTorchGraphParser(GraphParser):
             model_path (str): Path to the Pytorch model.
             input_nodes (dict): Input nodes to generate onnx model.
             opset_version (int): Op set version of onnx.
+            in_process (bool): Whether to export in current process. Default: False.
         """
-
-        output_queue = mp.Queue()
-        process = mp.Process(target=PyTorchGraphParser._pytorch_graph_to_proto,
-                             args=(output_queue, model_path, input_nodes, opset_version))
-        process.start()
-        proto = output_queue.get()
-        process.join()
-
         onnx = import_module('onnx')
-        onnx_model = onnx.load_model_from_string(proto)
+        if in_process:
+            try:
+                proto = PyTorchGraphParser._pytorch_graph_to_proto(model_path, input_nodes, opset_version)
+            except ModelLoadingError.raise_from() as e:
+                raise PyTorchGraphParser._wrap_export_error(e) from e
+            return onnx.load_model_from_string(proto)
+
+        # Exchange the proto through a temporary file rather than pickling it through a queue.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            proto_path = os.path.join(tmp_dir, "model.onnx")
+            output_queue = mp.Queue()
+            process = mp.Process(target=PyTorchGraphParser._export_pytorch_graph_to_file,
+                                 args=(output_queue, proto_path, model_path, input_nodes, opset_version))
+            process.start()
+            error = output_queue.get()
+            process.join()
+            if error is not None:
+                raise PyTorchGraphParser._wrap_export_error(error) from error
+            onnx_model = onnx.load_model(proto_path)
 
         return onnx_model
 
     @staticmethod
-    def _pytorch_graph_to_proto(output_queue, model_path, input_nodes, opset_version):
+    def _wrap_export_error(error):
         """
-        Convert pytorch graph to pytorch proto.
+        Wrap error raised in exporting, so that it is the same whether the export is isolated or not.
 
         Args:
-            output_queue (Queue): Output queue from multi-processing.
+            error (Exception): Error raised in exporting.
+
+        Returns:
+            Exception, the error to raise.
+        """
+        if isinstance(error, (ModuleNotFoundError, ModelLoadingError)):
+            # Missing model scripts are reported with hint of `--project_path` by parser.
+            return error
+        return ModelLoadingError(f"Error occurs when exporting onnx model, {str(error)}")
+
+    @staticmethod
+    def _export_pytorch_graph_to_file(output_queue, proto_path, model_path, input_nodes, opset_version):
+        """
+        Export pytorch graph to file in a sub-process.
+
+        Args:
+            output_queue (Queue): Output queue from multi-processing, receives None or the error raised.
+            proto_path (str): Path to save the onnx proto.
             model_path (str): Path to the Pytorch model.
             input_nodes (dict): Input nodes to generate onnx model.
             opset_version (int): Op set version of onnx.
         """
-
         try:
-            torch = import_module('torch')
-            has_cuda = torch.cuda.is_available()
-            dump_inputs = dict()
-            if has_cuda:
-                model = torch.load(f=model_path).cuda()
-                for node_name, node_shape in input_nodes.items():
-                    dump_inputs[node_name] = torch.randn(*node_shape, device='cuda')
-            else:
-                model = torch.load(f=model_path, map_location="cpu")
-                for node_name, node_shape in input_nodes.items():
-                    dump_inputs[node_name] = torch.randn(*node_shape, device='cpu')
-
-            if isinstance(model, torch.nn.DataParallel):
-                raise ValueError('torch.nn.DataParallel is not supported by ONNX exporter.')
-
-            torch_onnx = import_module('torch.onnx')
-            operator_export_types = getattr(torch_onnx, 'OperatorExportTypes')
-            utils = import_module('torch.onnx.utils')
-            model_to_graph = getattr(utils, '_model_to_graph')
-
-            symbolic_helper = import_module('torch.onnx.symbolic_helper')
-            default_onnx_opset_version = getattr(symbolic_helper, '_default_onnx_opset_version')
-            set_opset_version = getattr(symbolic_helper, '_set_opset_version')
-            set_operator_export_type = getattr(symbolic_helper, '_set_operator_export_type')
-            if not opset_version:
-                opset_version = default_onnx_opset_version
-
-            operator_export_type = operator_export_types.ONNX
-            set_opset_version(opset_version)
-            set_operator_export_type(operator_export_type)
-
-            graph, params_dict, _ = model_to_graph(model, args=tuple(dump_inputs.values()),
-                                                   input_names=list(dump_inputs.keys()), _retain_param_name=True)
-            export_onnx = getattr(graph, '_export_onnx')
-            proto, _ = export_onnx(
-                params_dict, opset_version, dict(), False,
-                operator_export_type, True, False, dict(),
-                True, False)
-
-            output_queue.put(proto)
+            proto = PyTorchGraphParser._pytorch_graph_to_proto(model_path, input_nodes, opset_version)
+            with open(proto_path, "wb") as f:
+                f.write(proto)
+            output_queue.put(None)
         except ModelLoadingError.raise_from() as e:
             output_queue.put(e)
+
+    @staticmethod
+    def _pytorch_graph_to_proto(model_path, input_nodes, opset_version):
+        """
+        Convert pytorch graph to pytorch proto.
+
+        Args:
+            model_path (str): Path to the Pytorch model.
+            input_nodes (dict): Input nodes to generate onnx model.
+            opset_version (int): Op set version of onnx.
+
+        Returns:
+            bytes, serialized onnx proto.
+        """
+        torch = import_module('torch')
+        has_cuda = torch.cuda.is_available()
+        dump_inputs = dict()
+        if has_cuda:
+            model = torch.load(f=model_path).cuda()
+            for node_name, node_shape in input_nodes.items():
+                dump_inputs[node_name] = torch.randn(*node_shape, device='cuda')
+        else:
+            model = torch.load(f=model_path, map_location="cpu")
+            for node_name, node_shape in input_nodes.items():
+                dump_inputs[node_name] = torch.randn(*node_shape, device='cpu')
+
+        if isinstance(model, torch.nn.DataParallel):
+            raise ValueError('torch.nn.DataParallel is not supported by ONNX exporter.')
+
+        torch_onnx = import_module('torch.onnx')
+        operator_export_types = getattr(torch_onnx, 'OperatorExportTypes')
+        utils = import_module('torch.onnx.utils')
+        model_to_graph = getattr(utils, '_model_to_graph')
+
+        symbolic_helper = import_module('torch.onnx.symbolic_helper')
+        default_onnx_opset_version = getattr(symbolic_helper, '_default_onnx_opset_version')
+        set_opset_version = getattr(symbolic_helper, '_set_opset_version')
+        set_operator_export_type = getattr(symbolic_helper, '_set_operator_export_type')
+        if not opset_version:
+            opset_version = default_onnx_opset_version
+
+        operator_export_type = operator_export_types.ONNX
+        set_opset_version(opset_version)
+        set_operator_export_type(operator_export_type)
+
+        graph, params_dict, _ = model_to_graph(model, args=tuple(dump_inputs.values()),
+                                               input_names=list(dump_inputs.keys()), _retain_param_name=True)
+        export_onnx = getattr(graph, '_export_onnx')
+        proto, _ = export_onnx(
+            params_dict, opset_version, dict(), False,
+            operator_export_type, True, False, dict(),
+            True, False)
+
+        return proto
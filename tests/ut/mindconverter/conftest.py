@@ -0,0 +1,42 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmarks of mindconverter, which are skipped in unit tests.
+
+Usage:
+    MINDCONVERTER_BENCHMARK=1 pytest -m benchmark --log-cli-level=INFO tests/ut/mindconverter
+
+Results are logged at INFO level, rather than printed.
+"""
+import os
+
+import pytest
+
+BENCHMARK_ENV = "MINDCONVERTER_BENCHMARK"
+
+
+def pytest_configure(config):
+    """Register the benchmark marker."""
+    config.addinivalue_line("markers", f"benchmark: performance comparison, run when {BENCHMARK_ENV}=1.")
+
+
+def pytest_collection_modifyitems(items):
+    """Skip benchmarks unless they are enabled by environment variable."""
+    if os.environ.get(BENCHMARK_ENV) == "1":
+        return
+    skip_benchmark = pytest.mark.skip(reason=f"benchmark, set {BENCHMARK_ENV}=1 to run.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,112 @@
+# Copyright 2020-2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test streaming checkpoint writer."""
+import os
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pytest
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from mindinsight.mindconverter.graph_based_converter.common.checkpoint import save_checkpoint
+
+
+def _checkpoint_proto():
+    """Build the checkpoint proto of MindSpore."""
+    file_proto = descriptor_pb2.FileDescriptorProto(name="checkpoint.proto", package="ms", syntax="proto2")
+    tensor = file_proto.message_type.add(name="TensorProto")
+    field = descriptor_pb2.FieldDescriptorProto
+    tensor.field.add(name="dims", number=1, type=field.TYPE_INT64, label=field.LABEL_REPEATED)
+    tensor.field.add(name="tensor_type", number=2, type=field.TYPE_STRING, label=field.LABEL_REQUIRED)
+    tensor.field.add(name="tensor_content", number=3, type=field.TYPE_BYTES, label=field.LABEL_REQUIRED)
+    checkpoint = file_proto.message_type.add(name="Checkpoint")
+    value = checkpoint.nested_type.add(name="Value")
+    value.field.add(name="tag", number=1, type=field.TYPE_STRING, label=field.LABEL_REQUIRED)
+    value.field.add(name="tensor", number=2, type=field.TYPE_MESSAGE, label=field.LABEL_REQUIRED,
+                    type_name=".ms.TensorProto")
+    checkpoint.field.add(name="value", number=1, type=field.TYPE_MESSAGE, label=field.LABEL_REPEATED,
+                         type_name=".ms.Checkpoint.Value")
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    return message_factory.GetMessageClass(pool.FindMessageTypeByName("ms.Checkpoint"))
+
+
+def _save_checkpoint_at_once(parameters):
+    """Serialize checkpoint as a whole, the way of MindSpore."""
+    checkpoint = _checkpoint_proto()()
+    for parameter in parameters:
+        value = checkpoint.value.add()
+        value.tag = parameter["name"]
+        data = parameter["data"]
+        value.tensor.dims.extend(data.shape or (0,))
+        value.tensor.tensor_type = {"float32": "Float32", "int64": "Int64", "float16": "Float16"}[data.dtype.name]
+        value.tensor.tensor_content = data.tobytes()
+    return checkpoint.SerializeToString()
+
+
+class TestCheckpoint:
+    """Test saving checkpoint."""
+
+    def setup_method(self):
+        """Prepare output folder."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.ckpt_path = os.path.join(self.tmp_dir.name, "model.ckpt")
+
+    def teardown_method(self):
+        """Clean up output folder."""
+        self.tmp_dir.cleanup()
+
+    def test_save_checkpoint(self):
+        """Test checkpoint is the same as serializing at once."""
+        rand = np.random.RandomState(0)
+        parameters = [
+            {"name": "conv.weight", "data": rand.rand(64, 3, 7, 7).astype(np.float32)},
+            {"name": "bn.num_batches_tracked", "data": np.array(3, dtype=np.int64)},
+            {"name": "fc.bias", "data": rand.rand(1000).astype(np.float16)},
+            {"name": "embedding.weight", "data": rand.rand(300, 20).astype(np.float32).T},
+        ]
+        save_checkpoint(parameters, self.ckpt_path)
+        with open(self.ckpt_path, "rb") as f:
+            content = f.read()
+        assert content == _save_checkpoint_at_once(parameters)
+
+        checkpoint = _checkpoint_proto()()
+        checkpoint.ParseFromString(content)
+        assert [value.tag for value in checkpoint.value] == [parameter["name"] for parameter in parameters]
+        assert list(checkpoint.value[1].tensor.dims) == [0]
+        data = np.frombuffer(checkpoint.value[3].tensor.tensor_content, dtype=np.float32)
+        assert np.array_equal(data.reshape(checkpoint.value[3].tensor.dims), parameters[3]["data"])
+
+    def test_save_checkpoint_memory(self):
+        """Test peak memory of saving checkpoint is close to the largest parameter."""
+        parameters = [{"name": f"layer_{idx}.weight", "data": np.ones((256, 1024), dtype=np.float32)}
+                      for idx in range(16)]
+        tracemalloc.start()
+        try:
+            save_checkpoint(parameters, self.ckpt_path)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert os.path.getsize(self.ckpt_path) > 16 * parameters[0]["data"].nbytes
+        assert peak_memory < 2 * parameters[0]["data"].nbytes
+
+    def test_save_unsupported_data_type(self):
+        """Test incomplete checkpoint is removed."""
+        parameters = [{"name": "weight", "data": np.ones(2, dtype=np.float32)},
+                      {"name": "name", "data": np.array(["a"])}]
+        with pytest.raises(TypeError):
+            save_checkpoint(parameters, self.ckpt_path)
+        assert not os.path.exists(self.ckpt_path)
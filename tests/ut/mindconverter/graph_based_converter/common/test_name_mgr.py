@@ -14,8 +14,8 @@
 # ==============================================================================
 """Test name manager module."""
 from unittest import TestCase
-from mindinsight.mindconverter.graph_based_converter.common.name_mgr import NameMgr, GlobalVarNameMgr, \
-    global_op_namespace
+from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
+from mindinsight.mindconverter.graph_based_converter.common.name_mgr import NameMgr, GlobalVarNameMgr
 
 
 class TestNameMgr(TestCase):
@@ -28,7 +28,7 @@ class TestNameMgr(TestCase):
 
     def test_global_get_name_in_record(self):
         """Test global name mgr."""
-        global_op_namespace['abc'] = 0
+        GlobalContext().global_op_namespace['abc'] = 0
         name_mgr = GlobalVarNameMgr()
         name = name_mgr.get_name('abc')
         assert isinstance(name, str)
@@ -0,0 +1,171 @@
+# Copyright 2020-2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test common utils of graph based converter."""
+import json
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from mindinsight.mindconverter.common.exceptions import CheckPointGenerationError, ScriptGenerationError
+from mindinsight.mindconverter.graph_based_converter.common import utils
+from mindinsight.mindconverter.graph_based_converter.common.utils import fetch_output_from_onnx_model, \
+    InferenceSessionCache, save_code_file_and_report
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+
+def _build_model():
+    """Build an onnx model, y = relu(x + 1) * 2."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Add", ["x", "one"], ["add_out"], name="add"),
+        helper.make_node("Relu", ["add_out"], ["relu_out"], name="relu"),
+        helper.make_node("Mul", ["relu_out", "two"], ["y"], name="mul"),
+    ]
+    initializers = [
+        onnx.numpy_helper.from_array(np.array(1., dtype=np.float32), name="one"),
+        onnx.numpy_helper.from_array(np.array(2., dtype=np.float32), name="two"),
+    ]
+    graph = helper.make_graph(
+        nodes, "test_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 4])],
+        [helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 4])],
+        initializer=initializers
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+
+
+class TestFetchOutput:
+    """Test fetching intermediate outputs from onnx model."""
+
+    def setup_method(self):
+        """Prepare model and inputs."""
+        self.model = _build_model()
+        self.feed_dict = {"x": np.array([[-2., -1., 0., 1.]], dtype=np.float32)}
+
+    def test_fetch_without_editing_model(self):
+        """Test fetching outputs does not edit the model."""
+        res = fetch_output_from_onnx_model(self.model, self.feed_dict, ["add_out", "relu_out"])
+        assert np.allclose(res["add_out"], [[-1., 0., 1., 2.]])
+        assert np.allclose(res["relu_out"], [[0., 0., 1., 2.]])
+        assert [opt.name for opt in self.model.graph.output] == ["y"]
+
+    def test_session_cache(self):
+        """Test sessions are reused when fetching subset of outputs."""
+        cache = InferenceSessionCache()
+        fetch_output_from_onnx_model(self.model, self.feed_dict, ["add_out", "relu_out"], session_cache=cache)
+        res = fetch_output_from_onnx_model(self.model, self.feed_dict, ["relu_out"], session_cache=cache)
+        assert np.allclose(res["relu_out"], [[0., 0., 1., 2.]])
+        assert cache.built_count == 1
+
+        res = fetch_output_from_onnx_model(self.model, self.feed_dict, ["y"], session_cache=cache)
+        assert np.allclose(res["y"], [[0., 0., 2., 4.]])
+        assert cache.built_count == 2
+
+        # Sessions of another model are not reused.
+        fetch_output_from_onnx_model(_build_model(), self.feed_dict, ["relu_out"], session_cache=cache)
+        assert cache.built_count == 3
+
+    def test_session_cache_with_edited_model(self):
+        """Test sessions are rebuilt once released after the model is edited in place."""
+        cache = InferenceSessionCache()
+        fetch_output_from_onnx_model(self.model, self.feed_dict, ["y"], session_cache=cache)
+
+        self.model.graph.initializer[1].CopyFrom(
+            onnx.numpy_helper.from_array(np.array(3., dtype=np.float32), name="two"))
+        cache.release()
+        res = fetch_output_from_onnx_model(self.model, self.feed_dict, ["y"], session_cache=cache)
+        assert np.allclose(res["y"], [[0., 0., 3., 6.]])
+        assert cache.built_count == 2
+
+    def test_session_cache_with_reserved_outputs(self):
+        """Test session built with reserved outputs serves the later request."""
+        cache = InferenceSessionCache()
+        cache.reserve_outputs(["add_out"])
+        fetch_output_from_onnx_model(self.model, self.feed_dict, ["relu_out"], session_cache=cache)
+        res = fetch_output_from_onnx_model(self.model, self.feed_dict, ["add_out"], session_cache=cache)
+        assert np.allclose(res["add_out"], [[-1., 0., 1., 2.]])
+        assert cache.built_count == 1
+        assert [opt.name for opt in self.model.graph.output] == ["y"]
+
+
+class TestSaveCodeFileAndReport:
+    """Test saving output artifacts."""
+
+    def setup_method(self):
+        """Prepare output folder and artifacts."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.weight = np.ones((2, 3), dtype=np.float32)
+        self.weight_map = [{"converted_weight": {"name": "fc.weight", "shape": (2, 3), "data_type": "Float32"}}]
+        self.code_lines = {"model": ("class Model:\n    pass\n", "report", [{"name": "fc.weight", "data": self.weight}],
+                                     self.weight_map)}
+
+    def teardown_method(self):
+        """Clean up output folder."""
+        self.tmp_dir.cleanup()
+
+    def test_save(self):
+        """Test all artifacts are saved and write time is logged."""
+        with mock.patch.object(utils.log, "info") as log_info:
+            save_code_file_and_report("lenet", self.code_lines, self.tmp_dir.name, None)
+        assert sorted(os.listdir(self.tmp_dir.name)) == ["lenet.ckpt", "lenet.py", "report_of_lenet.txt",
+                                                         "weight_map_of_lenet.json"]
+        with open(os.path.join(self.tmp_dir.name, "lenet.py")) as f:
+            assert f.read() == self.code_lines["model"][0]
+        with open(os.path.join(self.tmp_dir.name, "weight_map_of_lenet.json")) as f:
+            assert json.load(f) == {"lenet": [{"converted_weight": {"name": "fc.weight", "shape": [2, 3],
+                                                                    "data_type": "Float32"}}]}
+        assert os.path.getsize(os.path.join(self.tmp_dir.name, "lenet.ckpt")) > self.weight.nbytes
+        assert [call[0][1] for call in log_info.call_args_list] == ["Code file", "Report file", "Checkpoint file",
+                                                                    "Weight map file"]
+
+    def test_save_existed_file(self):
+        """Test existed artifact is not overwritten."""
+        code_file_path = os.path.join(self.tmp_dir.name, "lenet.py")
+        with open(code_file_path, "w") as f:
+            f.write("existed")
+        with pytest.raises(ScriptGenerationError):
+            save_code_file_and_report("lenet", self.code_lines, self.tmp_dir.name, None)
+        with open(code_file_path) as f:
+            assert f.read() == "existed"
+        assert os.listdir(self.tmp_dir.name) == ["lenet.py"]
+
+    def test_save_file_created_meanwhile(self):
+        """Test artifact created while writing is not overwritten."""
+        code_file_path = os.path.join(self.tmp_dir.name, "lenet.py")
+
+        def _write(file_path):
+            with open(file_path, "w") as f:
+                f.write("converted")
+            with open(code_file_path, "w") as f:
+                f.write("existed")
+
+        with pytest.raises(ScriptGenerationError, match="already exists"):
+            utils._write_artifact(code_file_path, _write, ScriptGenerationError, "Code file")
+        with open(code_file_path) as f:
+            assert f.read() == "existed"
+        assert os.listdir(self.tmp_dir.name) == ["lenet.py"]
+
+    def test_save_failed_checkpoint(self):
+        """Test failed artifact leaves no temporary file."""
+        self.code_lines["model"][2].append({"name": "names", "data": np.array(["a"])})
+        with pytest.raises(CheckPointGenerationError):
+            save_code_file_and_report("lenet", self.code_lines, self.tmp_dir.name, None)
+        assert "lenet.ckpt" not in os.listdir(self.tmp_dir.name)
+        assert not [name for name in os.listdir(self.tmp_dir.name) if name.endswith(".tmp")]
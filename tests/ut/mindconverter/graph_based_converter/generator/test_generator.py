@@ -0,0 +1,241 @@
+# Copyright 2020-2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test generating code and checkpoint from onnx graph."""
+import logging
+import os
+import time
+from unittest import mock
+
+import numpy as np
+import onnx
+import pytest
+from onnx import helper, numpy_helper
+from yapf.yapflib.yapf_api import FormatCode
+
+from collections import OrderedDict
+
+from mindinsight.mindconverter.graph_based_converter import generator
+from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
+from mindinsight.mindconverter.graph_based_converter.common.yapf_config import mindspore_yapf_config
+from mindinsight.mindconverter.graph_based_converter.generator.generator import Generator
+from mindinsight.mindconverter.graph_based_converter.generator.scope_utils import Scope
+from mindinsight.mindconverter.graph_based_converter.mapper.base import ONNXToMindSporeMapper
+from mindinsight.mindconverter.graph_based_converter.third_party_graph import onnx_graph
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_graph import OnnxGraph
+
+logger = logging.getLogger(__name__)
+
+EXPECTED_RESULTS = os.path.join(os.path.dirname(__file__), "expected_results")
+
+
+def _build_model(blocks=3, channels=16):
+    """Build conv net with weights."""
+    rand = np.random.RandomState(0)
+    nodes, initializers = [], []
+    tensor = "x"
+    for idx in range(blocks):
+        weight = numpy_helper.from_array(
+            rand.rand(channels, 3 if idx == 0 else channels, 3, 3).astype(np.float32), f"conv_{idx}.weight")
+        initializers.append(weight)
+        nodes.append(helper.make_node("Conv", [tensor, weight.name], [f"conv_{idx}"], name=f"Conv_{idx}",
+                                      kernel_shape=[3, 3], pads=[1, 1, 1, 1]))
+        nodes.append(helper.make_node("Relu", [f"conv_{idx}"], [f"relu_{idx}"], name=f"Relu_{idx}"))
+        tensor = f"relu_{idx}"
+    nodes.append(helper.make_node("GlobalAveragePool", [tensor], ["pool"], name="GlobalAveragePool_0"))
+    nodes.append(helper.make_node("Flatten", ["pool"], ["flatten"], name="Flatten_0"))
+    initializers.append(numpy_helper.from_array(rand.rand(10, channels).astype(np.float32), "fc.weight"))
+    initializers.append(numpy_helper.from_array(rand.rand(10).astype(np.float32), "fc.bias"))
+    nodes.append(helper.make_node("Gemm", ["flatten", "fc.weight", "fc.bias"], ["y"], name="Gemm_0", transB=1))
+    graph = helper.make_graph(nodes, "model",
+                              [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 3, 32, 32])],
+                              [helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 10])],
+                              initializer=initializers)
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+
+
+def _build_nested_model(depth=10, fanout=2, leaf_size=5):
+    """Build model and scope names of a nested module tree."""
+    op_types = ["Relu", "Sigmoid", "Tanh"]
+    nodes, scope_names = [], []
+    module_uid = dict()
+
+    def _add_module(level, scope):
+        if level == depth:
+            for idx in range(leaf_size):
+                op_type = op_types[idx % len(op_types)]
+                name = f"{op_type}_{len(nodes)}"
+                nodes.append(helper.make_node(op_type, [nodes[-1].output[0] if nodes else "x"], [name], name=name))
+                scope_names.append(f"{scope}/{op_type}")
+            return
+        for _ in range(fanout):
+            uid = module_uid.get(level, 0)
+            module_uid[level] = uid + 1
+            _add_module(level + 1, f"{scope}/Module{level}_{uid}")
+
+    _add_module(0, "Model")
+    output = nodes[-1].output[0]
+    graph = helper.make_graph(nodes, "model", [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 4])],
+                              [helper.make_tensor_value_info(output, onnx.TensorProto.FLOAT, [1, 4])])
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+    return model, scope_names, output
+
+
+def _form_nested_modules(model, scope_names, output):
+    """Form modules of nested model, return module tree, time cost of forming and aggregating modules."""
+    try:
+        with mock.patch.object(onnx_graph, "generate_scope_name", return_value=scope_names):
+            graph = OnnxGraph(model, input_nodes={"x": (1, 4)}, output_nodes=[output])
+        generator_inst = generator.batch_add_nodes(graph, ONNXToMindSporeMapper)
+        aggregate = generator_inst._add_submodule_to_parent
+        aggregate_costs = []
+
+        def _timed_aggregate():
+            start = time.perf_counter()
+            aggregate()
+            aggregate_costs.append(time.perf_counter() - start)
+
+        generator_inst._add_submodule_to_parent = _timed_aggregate
+        start = time.perf_counter()
+        generator_inst._form_bottom_submodule()
+        generator_inst._recursive_form_module()
+        cost = time.perf_counter() - start
+
+        def _tree(md_struct):
+            return md_struct.identifier, [_tree(sub) for sub in md_struct._module_structs], \
+                   [nd_struct.identifier for _, nd_struct in md_struct._node_structs]
+
+        pattern_ids = {pattern_id: [md.identifier for md in md_list] for pattern_id, md_list in
+                       GlobalContext().module_structs.items()}
+        return (_tree(generator_inst.module_structs['[]']), pattern_ids), cost, sum(aggregate_costs)
+    finally:
+        GlobalContext.release()
+
+
+def test_form_nested_modules():
+    """Test forming nested modules gets the module tree of scope names."""
+    model, scope_names, output = _build_nested_model(depth=2, fanout=2, leaf_size=2)
+    tree, pattern_ids = _form_nested_modules(model, scope_names, output)[0]
+    assert tree == ([], [
+        ([(0, 0)], [
+            ([(0, 0), (1, 0)], [], ["Model/Module0_0/Module1_0/$Relu_0$", "Model/Module0_0/Module1_0/$Sigmoid_1$"]),
+            ([(0, 0), (1, 1)], [], ["Model/Module0_0/Module1_1/$Relu_2$", "Model/Module0_0/Module1_1/$Sigmoid_3$"])
+        ], []),
+        ([(0, 1)], [
+            ([(0, 1), (1, 2)], [], ["Model/Module0_1/Module1_2/$Relu_4$", "Model/Module0_1/Module1_2/$Sigmoid_5$"]),
+            ([(0, 1), (1, 3)], [], ["Model/Module0_1/Module1_3/$Relu_6$", "Model/Module0_1/Module1_3/$Sigmoid_7$"])
+        ], [])
+    ], [])
+    assert pattern_ids == {0: [[(0, 0)], [(0, 1)]],
+                           1: [[(0, 0), (1, 0)], [(0, 0), (1, 1)], [(0, 1), (1, 2)], [(0, 1), (1, 3)]]}
+
+
+def test_form_deeply_nested_modules():
+    """Test forming deeply nested modules keeps every module of every depth."""
+    model, scope_names, output = _build_nested_model(depth=4)
+    tree, pattern_ids = _form_nested_modules(model, scope_names, output)[0]
+
+    def _leaves(sub_tree):
+        identifier, sub_trees, nodes = sub_tree
+        if not sub_trees:
+            return [(identifier, len(nodes))]
+        return [leaf for sub in sub_trees for leaf in _leaves(sub)]
+
+    assert [len(identifier) for identifier, _ in _leaves(tree)] == [4] * 16
+    assert {node_num for _, node_num in _leaves(tree)} == {5}
+    assert {depth: len(identifiers) for depth, identifiers in pattern_ids.items()} == {0: 2, 1: 4, 2: 8, 3: 16}
+
+
+@pytest.mark.benchmark
+def test_form_nested_modules_benchmark():
+    """Measure forming deeply nested modules."""
+    model, scope_names, output = _build_nested_model()
+    (_, pattern_ids), cost, aggregate_cost = _form_nested_modules(model, scope_names, output)
+    logger.info("Forming modules of %d nodes costs %.2fs with %.3fs aggregating",
+                len(scope_names), cost, aggregate_cost)
+    assert len(pattern_ids) == 10
+
+
+def _generate(model, format_code=True):
+    """Generate code and checkpoint of model."""
+    try:
+        graph = OnnxGraph(model, input_nodes={"x": (1, 3, 32, 32)}, output_nodes=["y"])
+        generator_inst = generator.batch_add_nodes(graph, ONNXToMindSporeMapper)
+        code, _, ckpt_data_list, weight_map = generator_inst.generate(format_code=format_code)["model"]
+    finally:
+        GlobalContext.release()
+    return code, [(item["name"], np.asarray(item["data"])) for item in ckpt_data_list], weight_map
+
+
+def test_copy_params():
+    """Test params are copied on write and weights are shared."""
+    params = {"pads": [1, 1, [2, 2]], "attr": {"axes": [0]}, "value": np.zeros((2, 2))}
+    copied = generator._copy_params(params)
+    assert copied == {"pads": [1, 1, [2, 2]], "attr": {"axes": [0]}, "value": params["value"]}
+    assert copied["value"] is params["value"]
+    assert copied["pads"][2] is not params["pads"][2]
+    assert copied["attr"]["axes"] is not params["attr"]["axes"]
+
+
+def test_generate_code_and_checkpoint():
+    """Test generated code, and checkpoint holds weights of the model."""
+    model = _build_model()
+    code, ckpt, weight_map = _generate(model)
+
+    with open(os.path.join(EXPECTED_RESULTS, "conv_net.txt")) as f:
+        assert code == f.read()
+    initializers = {tensor.name: numpy_helper.to_array(tensor) for tensor in model.graph.initializer}
+    assert [(item["converted_weight"]["name"], item["source_weight"]["name"]) for item in weight_map] == [
+        ("conv2d_0.weight", "conv_0.weight"), ("conv2d_2.weight", "conv_1.weight"),
+        ("conv2d_4.weight", "conv_2.weight"), ("dense_8.weight", "fc.weight"), ("dense_8.bias", "fc.bias")]
+    assert [name for name, _ in ckpt] == [item["converted_weight"]["name"] for item in weight_map]
+    for (_, data), item in zip(ckpt, weight_map):
+        assert np.array_equal(data, initializers[item["source_weight"]["name"]])
+
+
+def test_generate_formatting():
+    """Test formatting each class is the same as formatting the whole code."""
+    model = _build_model()
+    code, _, _ = _generate(model)
+    unformatted_code, _, _ = _generate(model, format_code=False)
+    compile(unformatted_code, "model.py", "exec")
+    assert unformatted_code != code
+    assert code == FormatCode(unformatted_code, style_config=mindspore_yapf_config())[0]
+
+
+def test_path_str_to_list():
+    """Test parsed scope paths are not shared between callers."""
+    path = Scope.path_str_to_list("[(5, 0), (3, 1)]")
+    assert path == [(5, 0), (3, 1)]
+    path.pop()
+    assert Scope.path_str_to_list("[(5, 0), (3, 1)]") == [(5, 0), (3, 1)]
+    assert Scope.path_str_to_list("[]") == []
+
+
+def test_module_map_filter():
+    """Test filtering module map with indexed scope paths."""
+    paths = [[], [(0, 0)], [(0, 1)], [(1, 0), (0, 2)], [(1, 0), (2, 0)], [(1, 1), (0, 3)]]
+    try:
+        generator_inst = Generator()
+        generator_inst._module_depth_max = 2
+        generator_inst._module_map = OrderedDict((str(path), [str(path)]) for path in paths)
+        generator_inst._index_module_map()
+        assert generator_inst.module_map_filter(module_num=0) == [
+            ["[(0, 0)]"], ["[(0, 1)]"], ["[(1, 0), (0, 2)]"], ["[(1, 1), (0, 3)]"]]
+        assert generator_inst.module_map_filter(depth=2, module_num=0) == [["[(1, 0), (0, 2)]"], ["[(1, 1), (0, 3)]"]]
+        assert generator_inst.module_map_filter(module_num=0, uid=1) == [["[(0, 1)]"]]
+        assert generator_inst.module_map_filter(module_num=3) == []
+        assert generator_inst._list_repeated_submodules() == OrderedDict([(2, {0, 2}), (1, {0, 1})])
+    finally:
+        GlobalContext.release()
@@ -13,9 +13,12 @@
 # limitations under the License.
 # ==============================================================================
 """Test all operator mappers on transformation from pytorch to mindspore."""
+from unittest import mock
+
 import numpy as np
 import pytest
 
+from mindinsight.mindconverter.graph_based_converter.mapper import base
 from mindinsight.mindconverter.graph_based_converter.mapper.base import ONNXToMindSporeMapper
 
 
@@ -156,3 +159,17 @@ class TestMappers:
         _, _, _, _ = ONNXToMindSporeMapper.convert(params['input']['op_name'],
                                                    params['input']['params'],
                                                    params['input']['weights'])
+
+    def test_converter_resolved_once(self):
+        """Test mapper module is imported only once for repeated conversions."""
+        params = {'dilations': [1, 1], 'group': 1, 'pads': [1, 1, 1, 1], 'strides': [1, 1]}
+        weights = {'weight': np.zeros((64, 3, 3, 3), dtype=np.float32)}
+        base.CONVERTER_CACHE.clear()
+        with mock.patch.object(base.importlib, 'import_module',
+                               side_effect=base.importlib.import_module) as import_module:
+            outputs = [ONNXToMindSporeMapper.convert('onnx::Conv', params, weights) for _ in range(3)]
+        assert import_module.call_count == 1
+        template, exchange_msg, _, _ = outputs[0]
+        for output in outputs[1:]:
+            assert output[0] == template
+            assert output[1].keys() == exchange_msg.keys()
@@ -0,0 +1,49 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test built-in pattern lookup."""
+import copy
+
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.built_in_pattern import BUILT_IN_PATTERN, \
+    find_built_in_pattern_occurrences, is_built_in_pattern
+
+
+def _scan_occurrences(op_types):
+    """Find occurrences by scanning the sequence for each pattern."""
+    occurrences = dict()
+    for ptn_name, ptn in BUILT_IN_PATTERN.items():
+        for idx in range(len(op_types) - ptn.ptn_length + 1):
+            if op_types[idx:idx + ptn.ptn_length] == ptn.ptn_items:
+                occurrences.setdefault(ptn_name, []).append(idx)
+    return occurrences
+
+
+def test_find_built_in_pattern_occurrences():
+    """Test occurrences found in one pass are the same as scanning for each pattern."""
+    op_types = ["Reshape", "Unknown"]
+    for ptn in BUILT_IN_PATTERN.values():
+        op_types += ptn.ptn_items + ["Relu"] + ptn.ptn_items[:-1] + ptn.ptn_items
+    occurrences = find_built_in_pattern_occurrences(op_types)
+    assert occurrences == _scan_occurrences(op_types)
+    assert len(occurrences) == len(BUILT_IN_PATTERN)
+    assert find_built_in_pattern_occurrences([]) == dict()
+
+
+def test_is_built_in_pattern():
+    """Test whether a pattern is built-in."""
+    for ptn in BUILT_IN_PATTERN.values():
+        assert is_built_in_pattern(ptn)
+        other_degree = copy.deepcopy(ptn)
+        other_degree.in_degree += 1
+        assert not is_built_in_pattern(other_degree)
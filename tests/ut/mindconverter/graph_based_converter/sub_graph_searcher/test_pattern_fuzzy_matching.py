@@ -0,0 +1,74 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test pattern fuzzy matching."""
+import pytest
+
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern_fuzzy_matching import \
+    pattern_fuzzy_matching
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher import pattern_fuzzy_matching as matching
+
+DISTANCE_CASES = [
+    ([], [], 0),
+    (["Conv"], [], 1),
+    ([], ["Conv", "Relu"], 2),
+    (["Conv", "Relu"], ["Conv", "Relu"], 0),
+    (["Conv", "BatchNormalization", "Relu"], ["Conv", "Relu"], 1),
+    (["Conv", "Relu"], ["Conv", "Add", "Relu"], 1),
+    (["Conv", "Relu", "Add"], ["Conv", "Sigmoid", "Add"], 1),
+    (["Conv", "Relu"], ["Relu", "Conv"], 2),
+    (["Add", "Mul"], ["Mul", "Add", "Mul"], 1),
+    (["conv", "bn", "relu", "norm", "add"], ["conv", "bn", "tanh", "add"], 2),
+    (["k", "i", "t", "t", "e", "n"], ["s", "i", "t", "t", "i", "n", "g"], 3),
+    (["Conv", "Relu", "Add", "Mul"], ["Gemm", "Tanh", "Sub", "Div"], 4),
+]
+
+
+@pytest.mark.parametrize("pattern_a, pattern_b, expected", DISTANCE_CASES)
+def test_levenshtein_distance(pattern_a, pattern_b, expected):
+    """Test distance of patterns with known edit count."""
+    distance = getattr(matching, "_levenshtein_distance")
+    assert distance(pattern_a, pattern_b) == expected
+    assert distance(pattern_b, pattern_a) == expected
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 3])
+@pytest.mark.parametrize("pattern_a, pattern_b, expected", DISTANCE_CASES)
+def test_levenshtein_distance_early_exit(pattern_a, pattern_b, expected, threshold):
+    """Test distance with threshold is exact when accepted, and exceeds threshold when rejected."""
+    result = getattr(matching, "_levenshtein_distance")(pattern_a, pattern_b, threshold)
+    if expected <= threshold:
+        assert result == expected
+    else:
+        assert threshold < result <= expected
+
+
+@pytest.mark.parametrize("query, target, expected_matched, max_score", [
+    (["Conv", "BatchNormalization", "Relu", "Conv", "Add"],
+     ["Conv", "BatchNormalization", "Relu", "Conv", "Add"], True, 1.),
+    (["Conv", "BatchNormalization", "Tanh", "Conv", "Add"],
+     ["Conv", "BatchNormalization", "Relu", "Conv", "Add"], True, .8),
+    (["Conv", "Tanh", "Conv", "Add"],
+     ["Conv", "BatchNormalization", "Relu", "Conv", "Add"], False, .6),
+    (["Conv", "BatchNormalization", "Relu"], ["Conv", "BatchNormalization", "Relu"], True, 1.),
+    (["Conv", "Relu"], ["Conv", "BatchNormalization", "Relu"], False, 2 / 3),
+])
+def test_pattern_fuzzy_matching(query, target, expected_matched, max_score):
+    """Test matching of patterns with known edit count, the score of a rejected one may be lower than exact."""
+    is_matched, score = pattern_fuzzy_matching(query, target)
+    assert is_matched == expected_matched
+    if expected_matched:
+        assert score == pytest.approx(max_score)
+    else:
+        assert score <= max_score + 1e-6
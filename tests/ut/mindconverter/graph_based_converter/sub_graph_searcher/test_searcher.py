@@ -0,0 +1,328 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test sub-graph searcher."""
+import copy
+import json
+import logging
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher import generate_scope_name, SearchBudget
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher import search_path, searcher
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.common import CopyOnWriteDict, DagGraph, \
+    AlgorithmContext
+from mindinsight.mindconverter.graph_based_converter.sub_graph_searcher.pattern import Pattern
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import OnnxDataLoader
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.optimizer import OnnxSimplify
+
+onnx = pytest.importorskip("onnx")
+logger = logging.getLogger(__name__)
+
+EXPECTED_RESULTS = os.path.join(os.path.dirname(__file__), "expected_results")
+
+
+class _GraphBuilder:
+    """Build nodes of onnx graph in topological order."""
+
+    def __init__(self):
+        self.nodes = []
+
+    def add(self, op_type, inputs):
+        """Add a node and return its output name."""
+        output = f"{op_type.lower()}_{len(self.nodes)}"
+        self.nodes.append(onnx.helper.make_node(op_type, inputs, [output], name=output))
+        return output
+
+    def conv_bn(self, ipt, relu=True):
+        """Add conv-bn(-relu) nodes."""
+        opt = self.add("BatchNormalization", [self.add("Conv", [ipt])])
+        return self.add("Relu", [opt]) if relu else opt
+
+
+def _resnet50_nodes(block_nums=(3, 4, 6, 3)):
+    """Build nodes of a ResNet-50 sized graph, which are bottleneck blocks in 4 stages."""
+    builder = _GraphBuilder()
+    opt = builder.add("MaxPool", [builder.conv_bn("x")])
+    for block_num in block_nums:
+        for block_idx in range(block_num):
+            identity = opt if block_idx else builder.conv_bn(opt, relu=False)
+            residual = builder.conv_bn(builder.conv_bn(builder.conv_bn(opt)), relu=False)
+            opt = builder.add("Relu", [builder.add("Add", [residual, identity])])
+    opt = builder.add("Gemm", [builder.add("Flatten", [builder.add("GlobalAveragePool", [opt])])])
+    return builder.nodes, opt
+
+
+def _transformer_nodes(layers=12):
+    """Build nodes of a transformer encoder, whose op sequence is long and repetitive."""
+    builder = _GraphBuilder()
+
+    def _layer_norm(ipt):
+        sub = builder.add("Sub", [ipt, builder.add("ReduceMean", [ipt])])
+        std = builder.add("Sqrt", [builder.add("Add", [builder.add("ReduceMean", [builder.add("Pow", [sub])])])])
+        return builder.add("Add", [builder.add("Mul", [builder.add("Div", [sub, std])])])
+
+    def _dense(ipt):
+        return builder.add("Add", [builder.add("MatMul", [ipt])])
+
+    opt = _layer_norm(builder.add("Add", [builder.add("Gather", ["x"])]))
+    for _ in range(layers):
+        query, key, value = [builder.add("Transpose", [_dense(opt)]) for _ in range(3)]
+        scores = builder.add("Softmax", [builder.add("Add", [builder.add("Div", [builder.add("MatMul",
+                                                                                             [query, key])])])])
+        attention = builder.add("Transpose", [builder.add("MatMul", [scores, value])])
+        opt = _layer_norm(builder.add("Add", [_dense(attention), opt]))
+        hidden = _dense(opt)
+        hidden = builder.add("Mul", [builder.add("Mul", [hidden, builder.add("Add", [builder.add(
+            "Erf", [builder.add("Div", [hidden])])])])])
+        opt = _layer_norm(builder.add("Add", [_dense(hidden), opt]))
+    return builder.nodes, opt
+
+
+def _build_loader(nodes_builder):
+    """Build OnnxDataLoader of synthetic graph without simplifying and shape inference."""
+    nodes, output = nodes_builder()
+    helper = onnx.helper
+    graph = helper.make_graph(
+        nodes, "synthetic_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 3, 224, 224])],
+        [helper.make_tensor_value_info(output, onnx.TensorProto.FLOAT, [1, 1000])]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+    with mock.patch.object(OnnxSimplify, "run_onnx_simplify", side_effect=lambda mdl, _: mdl):
+        loader = OnnxDataLoader(model, {"x": (1, 3, 224, 224)}, [output], infer_shape=False)
+    return loader
+
+
+def _expected_scope_names(graph_name):
+    """Load expected scope names of synthetic graph."""
+    with open(os.path.join(EXPECTED_RESULTS, f"{graph_name}_scope_names.json")) as f:
+        return json.load(f)
+
+
+def _search(loader):
+    """Search scope names."""
+    try:
+        return generate_scope_name(loader)
+    finally:
+        GlobalContext.release()
+
+
+def _measure_search(loader):
+    """Search scope names, return scope names, wall time and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        scope_names = generate_scope_name(loader)
+        cost = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        GlobalContext.release()
+    return scope_names, cost, peak_memory
+
+
+def test_copy_on_write_dict():
+    """Test copies of CopyOnWriteDict do not affect each other."""
+    base = CopyOnWriteDict({"a": [1], "b": [2]})
+    child = base.copy()
+    child["a"] = [3]
+    child["c"] = [4]
+    del child["b"]
+    assert dict(base) == {"a": [1], "b": [2]}
+    assert dict(child) == {"a": [3], "c": [4]}
+    assert list(child) == ["a", "c"] and len(child) == 2
+    assert "b" not in child and child.get("b") is None
+
+    grandchild = child.copy()
+    grandchild["b"] = [5]
+    assert dict(child) == {"a": [3], "c": [4]}
+    assert dict(grandchild) == {"a": [3], "c": [4], "b": [5]}
+
+
+def test_dag_graph_copy():
+    """Test copies of DagGraph do not affect each other."""
+    dag = DagGraph({"a": "Conv", "b": "Relu"}, {"b": ["a"]}, {"a": ["b"]})
+    new_dag = copy.copy(dag)
+    new_dag.node_collection["c"] = "Add"
+    new_dag.precursor_table["c"] = ["b"]
+    new_dag.successor_table["b"] = ["c"]
+    assert dict(dag.node_collection) == {"a": "Conv", "b": "Relu"}
+    assert dict(dag.precursor_table) == {"b": ["a"]}
+    assert dict(dag.successor_table) == {"a": ["b"]}
+    assert dict(new_dag.successor_table) == {"a": ["b"], "b": ["c"]}
+
+
+def test_search():
+    """Test search result of a ResNet-50 sized graph."""
+    scope_names = _search(_build_loader(_resnet50_nodes))
+    assert scope_names == _expected_scope_names("resnet50")
+
+
+@pytest.mark.benchmark
+def test_search_benchmark():
+    """Measure search on a ResNet-50 sized graph."""
+    scope_names, cost, peak_memory = _measure_search(_build_loader(_resnet50_nodes))
+    logger.info("Searching %d nodes costs %.2fs, peak memory %.1fMB", len(scope_names), cost, peak_memory / 1024 ** 2)
+    assert scope_names == _expected_scope_names("resnet50")
+
+
+def test_search_concurrently():
+    """Test searches of different graphs in threads do not share states."""
+    builders = [_resnet50_nodes, lambda: _resnet50_nodes(block_nums=(2, 2, 2, 2))] * 2
+    loaders = [_build_loader(builder) for builder in builders]
+    expected = [_search(loader) for loader in loaders[:2]] * 2
+
+    def _search_in_thread(loader):
+        try:
+            return generate_scope_name(loader)
+        finally:
+            GlobalContext.release()
+
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        results = list(executor.map(_search_in_thread, loaders))
+    assert results == expected
+    assert expected[0] != expected[1]
+
+
+def _pattern(items, count, additional_score=0):
+    """Build pattern of op types found `count` times."""
+    ptn = Pattern("->".join(items), len(items), in_degree=1, out_degree=1)
+    for idx in range(count):
+        ptn.insert(idx * len(items), len(items))
+    ptn.additional_score = additional_score
+    return ptn
+
+
+def test_sort_with_beam():
+    """Test patterns are sorted by count, score and length, and covered patterns are rejected."""
+    patterns = {
+        # Covered by a longer pattern with the same count.
+        "conv_relu": _pattern(["Conv", "Relu"], 3),
+        "conv_relu_add": _pattern(["Conv", "Relu", "Add"], 3),
+        "conv_bn": _pattern(["Conv", "BatchNormalization"], 4),
+        # Not frequent enough.
+        "matmul_add": _pattern(["MatMul", "Add"], 1),
+        "conv_bn_relu": _pattern(["Conv", "BatchNormalization", "Relu"], 3, additional_score=0.1),
+        # Mostly covered by a scored pattern.
+        "conv_bn_relu_add": _pattern(["Conv", "BatchNormalization", "Relu", "Add"], 2),
+        "conv_bn_relu_mul_sub_div": _pattern(["Conv", "BatchNormalization", "Relu", "Mul", "Sub", "Div"], 2),
+        # Long scored pattern is always kept.
+        "conv_relu_x3": _pattern(["Conv", "Relu"] * 3, 2, additional_score=0.1),
+    }
+    result = AlgorithmContext().sort_with_beam(patterns)
+    assert list(result) == ["conv_bn", "conv_bn_relu", "conv_relu_add", "conv_relu_x3", "conv_bn_relu_mul_sub_div"]
+
+
+def test_pattern_windows():
+    """Test windows are inherited from the previous sequence unless any node read is changed."""
+    nodes = [mock.Mock() for _ in range(4)]
+    for idx, node in enumerate(nodes):
+        node.name = f"node_{idx}"
+    prev = search_path.PatternWindows()
+    prev.windows["node_1"] = search_path.PatternWindow(nodes[:2], ("Conv->Relu", 2, 1, 1))
+    prev.windows["node_3"] = search_path.PatternWindow(nodes[2:], None)
+
+    windows = search_path.PatternWindows(prev=prev, changed_nodes={"node_2"})
+    assert windows.get("node_1") is prev.windows["node_1"]
+    assert windows.get("node_3") is None
+    window = search_path.PatternWindow(nodes[2:], ("Add->Relu", 2, 1, 1))
+    windows.windows["node_3"] = window
+    assert windows.get("node_3") is window
+    assert prev.get("node_3").matched is None
+
+
+def test_incremental_pattern():
+    """Test search result of a long transformer op sequence, with windows reused between sequences."""
+    counts = {"get": 0, "match": 0}
+    get_window = search_path.PatternWindows.get
+    match_window = search_path._match_window
+
+    def _get_window(self, name):
+        counts["get"] += 1
+        return get_window(self, name)
+
+    def _match(*args, **kwargs):
+        counts["match"] += 1
+        return match_window(*args, **kwargs)
+
+    with mock.patch.object(search_path.PatternWindows, "get", _get_window), \
+            mock.patch.object(search_path, "_match_window", _match):
+        scope_names = _search(_build_loader(_transformer_nodes))
+
+    assert scope_names == _expected_scope_names("transformer")
+    assert counts["match"] < counts["get"]
+
+
+@pytest.mark.benchmark
+def test_incremental_pattern_benchmark():
+    """Measure search on a long transformer op sequence."""
+    scope_names, cost, _ = _measure_search(_build_loader(_transformer_nodes))
+    logger.info("Searching %d nodes costs %.2fs", len(scope_names), cost)
+    assert scope_names == _expected_scope_names("transformer")
+
+
+@pytest.mark.parametrize("search_budget, max_expanded_paths", [
+    (SearchBudget(max_expanded_paths=3), 3),
+    (SearchBudget(beam_width=1, max_depth=2), None),
+])
+def test_search_budget(search_budget, max_expanded_paths):
+    """Test search returns the best path found once budget exhausted."""
+    loader = _build_loader(_resnet50_nodes)
+    with mock.patch.object(searcher.log, "info") as log_info:
+        scope_names = generate_scope_name(loader, search_budget=search_budget)
+    GlobalContext.release()
+    expanded_paths = log_info.call_args[0][1]
+    assert len(scope_names) == len(loader.nodes_dict)
+    assert any("Module" in scope_name for scope_name in scope_names)
+    if max_expanded_paths is not None:
+        assert expanded_paths == max_expanded_paths
+        assert log_info.call_args[0][-1]
+
+
+def test_search_time_limit():
+    """Test search falls back to flatten graph if no path found within time limit."""
+    loader = _build_loader(_resnet50_nodes)
+    scope_names = generate_scope_name(loader, search_budget=SearchBudget(time_limit=1e-9))
+    GlobalContext.release()
+    assert scope_names == [f"Model/{node.op_type}" for node in loader.nodes_dict.values()]
+
+
+def test_merged_node_names():
+    """Test merged nodes are named deterministically."""
+    loader = _build_loader(_resnet50_nodes)
+    names = []
+    for _ in range(2):
+        with mock.patch.object(search_path.SearchPath, "__init__", autospec=True,
+                               side_effect=search_path.SearchPath.__init__) as init:
+            generate_scope_name(loader)
+        GlobalContext.release()
+        names.append([name for call in init.call_args_list
+                      for name in call[0][0].graph.node_collection if "Module" in name])
+    assert names[0] and names[0] == names[1]
+
+
+def test_replace_path():
+    """Test greedy matching replaces whole op types only."""
+    ptn = Pattern("Conv,Relu", 2, -1, -1, ["Conv", "Relu"])
+    path = search_path.ReplacePath(ptn, ["Conv", "Relu6", "Conv", "Relu", "Conv", "Relu", "Add"])
+    assert path.replace(0) == "Module0"
+    assert path.topo_order_aft_repl == ["Conv", "Relu6", "Module0", "Module0", "Add"]
+    assert search_path.ReplacePath(ptn, ["Conv", "Relu6"]).replace(1) is None
@@ -0,0 +1,127 @@
+# Copyright 2020-2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test graph based converter workflow."""
+import json
+import os
+import tempfile
+from unittest import mock
+
+import pytest
+
+from mindinsight.mindconverter.common.exceptions import BadParamError, ParamMissingError
+from mindinsight.mindconverter.graph_based_converter import framework
+from mindinsight.mindconverter.graph_based_converter.framework import load_model_list, \
+    main_graph_base_converter, main_graph_base_converter_batch
+
+
+class TestModelList:
+    """Test loading model list of batch conversion."""
+
+    def setup_method(self):
+        """Prepare model files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.model_file = os.path.join(self.tmp_dir.name, "lenet.onnx")
+        with open(self.model_file, "wb") as f:
+            f.write(b"")
+
+    def teardown_method(self):
+        """Clean up model files."""
+        self.tmp_dir.cleanup()
+
+    def _dump(self, model_list):
+        """Dump model list into file."""
+        model_list_path = os.path.join(self.tmp_dir.name, "models.json")
+        with open(model_list_path, "w") as f:
+            json.dump(model_list, f)
+        return model_list_path
+
+    def test_load_model_list(self):
+        """Test load model list with relative path and default output."""
+        model_list_path = self._dump([
+            {"model_file": "lenet.onnx", "shape": ["1,1,32,32"],
+             "input_nodes": ["input"], "output_nodes": ["output"]},
+            {"model_file": "lenet.onnx", "shape": [[1, 1, 32, 32]],
+             "input_nodes": ["input"], "output_nodes": ["output"], "output": "lenet_output"}
+        ])
+        file_configs = load_model_list(model_list_path, "/tmp/output", "/tmp/report")
+
+        assert len(file_configs) == 2
+        assert file_configs[0]['model_file'] == os.path.realpath(self.model_file)
+        assert file_configs[0]['shape'] == [[1, 1, 32, 32]]
+        assert file_configs[0]['outfile_dir'] == "/tmp/output"
+        assert file_configs[0]['report_dir'] == "/tmp/report"
+        assert file_configs[1]['shape'] == [[1, 1, 32, 32]]
+        assert file_configs[1]['outfile_dir'] == os.path.realpath(os.path.join(self.tmp_dir.name, "lenet_output"))
+
+    @pytest.mark.parametrize('model_list', [[], {"model_file": "lenet.onnx"},
+                                            [{"model_file": "not_exist.onnx"}],
+                                            [{"model_file": "lenet.onnx", "shape": ["1,a"]}]])
+    def test_load_bad_model_list(self, model_list):
+        """Test load bad model list."""
+        with pytest.raises(BadParamError):
+            load_model_list(self._dump(model_list), "/tmp/output")
+
+    def test_load_model_list_without_model_file(self):
+        """Test load model list without model file."""
+        with pytest.raises(ParamMissingError):
+            load_model_list(self._dump([{"shape": ["1,1,32,32"]}]), "/tmp/output")
+
+
+class TestConverterEntrance:
+    """Test error handling of converter entrances."""
+
+    def setup_method(self):
+        """Prepare model files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.model_list = []
+        for name in ("lenet", "resnet"):
+            model_file = os.path.join(self.tmp_dir.name, f"{name}.onnx")
+            with open(model_file, "wb") as f:
+                f.write(b"")
+            self.model_list.append({"model_file": model_file, "shape": ["1,1,32,32"],
+                                    "input_nodes": ["input"], "output_nodes": ["output"]})
+
+    def teardown_method(self):
+        """Clean up model files."""
+        self.tmp_dir.cleanup()
+
+    def test_error_reported_by_entrance(self):
+        """Test error of model conversion is raised to and reported by the entrance only."""
+        file_config = {"model_file": self.model_list[0]["model_file"]}
+        with pytest.raises(ParamMissingError):
+            framework._convert_with_file_config(file_config)
+        with mock.patch.object(framework, "_check_protobuf_implementation"), \
+                mock.patch("mindinsight.mindconverter.common.exceptions.log") as log:
+            with pytest.raises(SystemExit):
+                main_graph_base_converter(file_config)
+        assert log.error.call_count == 1
+
+    def test_batch_with_unexpected_error(self):
+        """Test unexpected error of one model does not break batch conversion."""
+        model_list_path = os.path.join(self.tmp_dir.name, "models.json")
+        with open(model_list_path, "w") as f:
+            json.dump(self.model_list, f)
+
+        def _convert(file_config):
+            if file_config['model_file'].endswith("lenet.onnx"):
+                raise RuntimeError("Unexpected error.")
+
+        with mock.patch.object(framework, "_check_protobuf_implementation"), \
+                mock.patch.object(framework, "find_spec", return_value=None), \
+                mock.patch.object(framework, "_convert_with_file_config", side_effect=_convert):
+            results = main_graph_base_converter_batch({"model_list": model_list_path, "jobs": 1,
+                                                       "outfile_dir": self.tmp_dir.name})
+        assert [(os.path.basename(model_file), succeeded) for model_file, succeeded, _ in results] == \
+               [("lenet.onnx", False), ("resnet.onnx", True)]
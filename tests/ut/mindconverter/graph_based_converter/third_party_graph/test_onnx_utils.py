@@ -0,0 +1,140 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test OnnxDataLoader."""
+import logging
+import time
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from mindinsight.mindconverter.graph_based_converter.common.global_context import GlobalContext
+from mindinsight.mindconverter.graph_based_converter.third_party_graph import onnx_utils
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.onnx_utils import OnnxDataLoader
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.optimizer import OnnxSimplify
+
+onnx = pytest.importorskip("onnx")
+logger = logging.getLogger(__name__)
+
+NODE_NUM = 1000
+BENCHMARK_NODE_NUM = 50000
+ELIMINATED_STEP = 100
+
+
+def _build_chain_model(node_num):
+    """Build an onnx model which is a chain of Relu nodes."""
+    helper = onnx.helper
+    nodes = []
+    ipt = "x"
+    for idx in range(node_num):
+        opt = f"relu_{idx}_out"
+        nodes.append(helper.make_node("Relu", [ipt], [opt], name=f"relu_{idx}"))
+        ipt = opt
+    graph = helper.make_graph(
+        nodes, "chain_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 4])],
+        [helper.make_tensor_value_info(ipt, onnx.TensorProto.FLOAT, [1, 4])]
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+
+
+def _build_loader(node_num):
+    """Build OnnxDataLoader of a chain model without simplifying."""
+    model = _build_chain_model(node_num)
+    with mock.patch.object(OnnxSimplify, "run_onnx_simplify", side_effect=lambda mdl, _: mdl):
+        loader = OnnxDataLoader(model, {"x": (1, 4)}, [model.graph.output[0].name], infer_shape=False)
+    GlobalContext.release()
+    return loader
+
+
+class TestOnnxDataLoader:
+    """Test OnnxDataLoader on a synthetic graph."""
+
+    def setup_method(self):
+        """Build a synthetic graph."""
+        self.loader = _build_loader(NODE_NUM)
+
+    def test_nodes_dict_invalidation(self):
+        """Test nodes_dict is cached and rebuilt when eliminated nodes changed."""
+        nodes_dict = self.loader.nodes_dict
+        assert len(nodes_dict) == NODE_NUM
+        assert self.loader.nodes_dict is nodes_dict
+
+        self.loader.add_eliminated_nodes([])
+        assert self.loader.nodes_dict is nodes_dict
+
+        self.loader.add_eliminated_nodes(["relu_0", "relu_1"])
+        assert len(self.loader.nodes_dict) == NODE_NUM - 2
+        assert "relu_0" not in self.loader.nodes_dict
+        assert self.loader.eliminated_nodes == {"relu_0", "relu_1"}
+
+    def test_nodes_dict_filtering(self):
+        """Test nodes_dict keeps nodes not eliminated in topological order."""
+        self.loader.add_eliminated_nodes([f"relu_{idx}" for idx in range(0, NODE_NUM, ELIMINATED_STEP)])
+        assert list(self.loader.nodes_dict) == [f"relu_{idx}" for idx in range(NODE_NUM) if idx % ELIMINATED_STEP]
+
+    @pytest.mark.benchmark
+    def test_nodes_dict_access_benchmark(self):
+        """Measure building nodes_dict and accessing it afterwards."""
+        loader = _build_loader(BENCHMARK_NODE_NUM)
+        loader.add_eliminated_nodes([f"relu_{idx}" for idx in range(0, BENCHMARK_NODE_NUM, ELIMINATED_STEP)])
+        access_num = 3
+
+        start = time.perf_counter()
+        result = loader.nodes_dict
+        build_cost = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(access_num):
+            assert loader.nodes_dict is result
+        access_cost = time.perf_counter() - start
+
+        logger.info("nodes_dict on %d nodes: building costs %.4fs, accessing %d times costs %.4fs",
+                    BENCHMARK_NODE_NUM, build_cost, access_num, access_cost)
+        assert len(result) == BENCHMARK_NODE_NUM - BENCHMARK_NODE_NUM // ELIMINATED_STEP
+
+
+def _build_dynamic_reshape_model():
+    """Build an onnx model, y = relu(reshape(x, shape(x)))."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Shape", ["x"], ["shape_out"], name="shape"),
+        helper.make_node("Reshape", ["x", "shape_out"], ["reshape_out"], name="reshape"),
+        helper.make_node("Relu", ["reshape_out"], ["y"], name="relu"),
+    ]
+    graph = helper.make_graph(
+        nodes, "dynamic_reshape_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 4])],
+        [helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 4])]
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+
+
+def test_inference_session_built_once():
+    """Test shape inference and fetching dynamic shapes share one onnxruntime session."""
+    ort = pytest.importorskip("onnxruntime")
+    model = _build_dynamic_reshape_model()
+    with mock.patch.object(OnnxSimplify, "run_onnx_simplify", side_effect=lambda mdl, _: mdl), \
+            mock.patch.object(onnx_utils, "build_feed_dict",
+                              return_value={"x": np.ones((1, 4), dtype=np.float32)}), \
+            mock.patch.object(onnx_utils, "fetch_output_from_onnx_model",
+                              side_effect=onnx_utils.fetch_output_from_onnx_model) as fetch_output, \
+            mock.patch.object(ort, "InferenceSession", side_effect=ort.InferenceSession) as inference_session:
+        loader = OnnxDataLoader(model, {"x": (1, 4)}, ["y"])
+    GlobalContext.release()
+    assert fetch_output.call_count == 2
+    assert inference_session.call_count == 1
+    assert loader.dynamic_reshape_node == ["reshape"]
+    assert loader.tensors_dict["shape_out"].to_array().tolist() == [1, 4]
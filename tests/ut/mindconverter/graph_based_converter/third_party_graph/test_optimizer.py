@@ -0,0 +1,201 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test OnnxSimplify."""
+import logging
+import re
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from mindinsight.mindconverter.common.log import logger as log
+from mindinsight.mindconverter.graph_based_converter.common.utils import fetch_output_from_onnx_model
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.optimizer import OnnxSimplify, \
+    OPTIMIZER_PASSES
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+INPUT_SHAPE = {"x": (1, 3, 4, 4)}
+
+
+def _make_model(nodes, initializers, output_name, output_shape):
+    """Make an onnx model with input `x`."""
+    helper = onnx.helper
+    graph = helper.make_graph(
+        nodes, "test_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, list(INPUT_SHAPE["x"]))],
+        [helper.make_tensor_value_info(output_name, onnx.TensorProto.FLOAT, output_shape)],
+        initializer=[onnx.numpy_helper.from_array(value, name=name) for name, value in initializers.items()]
+    )
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+
+
+def _dynamic_reshape_model():
+    """Reshape `x` with shape calculated from its Shape node."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Shape", ["x"], ["shape"], name="shape"),
+        helper.make_node("Gather", ["shape", "zero"], ["batch"], name="gather", axis=0),
+        helper.make_node("Unsqueeze", ["batch"], ["batch_1d"], name="unsqueeze", axes=[0]),
+        helper.make_node("Concat", ["batch_1d", "minus_one"], ["to_shape"], name="concat", axis=0),
+        helper.make_node("Reshape", ["x", "to_shape"], ["flatten"], name="reshape"),
+        helper.make_node("Relu", ["flatten"], ["y"], name="relu"),
+    ]
+    initializers = {"zero": np.array(0, dtype=np.int64), "minus_one": np.array([-1], dtype=np.int64)}
+    return _make_model(nodes, initializers, "y", [1, 48])
+
+
+def _multi_outputs_model():
+    """Split a constant into several outputs, mixed with Constant nodes."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Constant", [], ["bias"], name="bias",
+                         value=onnx.numpy_helper.from_array(np.ones((1, 3, 4, 4), dtype=np.float32))),
+        helper.make_node("Split", ["weight"], ["w0", "w1", "w2"], name="split", axis=1),
+        helper.make_node("Add", ["w0", "w1"], ["w01"], name="add_weight"),
+        helper.make_node("Mul", ["x", "w01"], ["mul_out"], name="mul"),
+        helper.make_node("Add", ["mul_out", "w2"], ["add_out"], name="add"),
+        helper.make_node("Add", ["add_out", "bias"], ["y"], name="add_bias"),
+    ]
+    initializers = {"weight": np.arange(12, dtype=np.float32).reshape((1, 3, 1, 4))}
+    return _make_model(nodes, initializers, "y", [1, 3, 4, 4])
+
+
+def _nop_nodes_model():
+    """Model with nodes to be eliminated by optimizer, and no constant nodes."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Identity", ["x"], ["identity_out"], name="identity"),
+        helper.make_node("Dropout", ["identity_out"], ["dropout_out"], name="dropout", ratio=0.),
+        helper.make_node("Relu", ["dropout_out"], ["y"], name="relu"),
+    ]
+    return _make_model(nodes, dict(), "y", list(INPUT_SHAPE["x"]))
+
+
+def _transposes_model():
+    """Model with transposes which become nop only after being fused."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Transpose", ["x"], ["transpose_0"], name="transpose_0", perm=[0, 2, 1, 3]),
+        helper.make_node("Transpose", ["transpose_0"], ["transpose_1"], name="transpose_1", perm=[0, 2, 1, 3]),
+        helper.make_node("Relu", ["transpose_1"], ["y"], name="relu"),
+    ]
+    return _make_model(nodes, dict(), "y", list(INPUT_SHAPE["x"]))
+
+
+def _fusible_model():
+    """Model with nodes to be fused or eliminated by each kind of passes."""
+    helper = onnx.helper
+    nodes = [
+        helper.make_node("Identity", ["x"], ["identity_out"], name="identity"),
+        helper.make_node("Pad", ["identity_out", "pads"], ["pad_out"], name="pad", mode="constant"),
+        helper.make_node("Conv", ["pad_out", "conv.weight"], ["conv_out"], name="conv"),
+        helper.make_node("Add", ["conv_out", "conv.bias"], ["add_out"], name="add"),
+        helper.make_node("Unsqueeze", ["add_out"], ["unsqueeze_out"], name="unsqueeze", axes=[0]),
+        helper.make_node("Squeeze", ["unsqueeze_out"], ["squeeze_out"], name="squeeze", axes=[0]),
+        helper.make_node("Flatten", ["squeeze_out"], ["flatten_out"], name="flatten"),
+        helper.make_node("Transpose", ["fc.weight"], ["fc.weight_t"], name="transpose", perm=[1, 0]),
+        helper.make_node("MatMul", ["flatten_out", "fc.weight_t"], ["matmul_out"], name="matmul"),
+        helper.make_node("Add", ["matmul_out", "fc.bias"], ["y"], name="add_bias"),
+        helper.make_node("Relu", ["x"], ["deadend_out"], name="deadend"),
+    ]
+    initializers = {"pads": np.array([0, 0, 1, 1, 0, 0, 1, 1], dtype=np.int64),
+                    "conv.weight": np.ones((3, 3, 3, 3), dtype=np.float32),
+                    "conv.bias": np.ones((1, 3, 1, 1), dtype=np.float32),
+                    "fc.weight": np.ones((10, 48), dtype=np.float32),
+                    "fc.bias": np.ones(10, dtype=np.float32)}
+    return _make_model(nodes, initializers, "y", [1, 10])
+
+
+def _canonical_names(model):
+    """Text of the model, in which names of tensors created by optimizer passes are numbered by appearance."""
+    names = dict()
+    return re.sub(r"_v_\d+", lambda match: names.setdefault(match.group(), f"_v_{len(names)}"), str(model))
+
+
+@pytest.mark.parametrize("model_builder, expected_nodes, expected_constants", [
+    (_dynamic_reshape_model,
+     [("Constant", "node_shape", [], ["shape"]),
+      ("Constant", "node_batch", [], ["batch"]),
+      ("Constant", "node_batch_1d", [], ["batch_1d"]),
+      ("Constant", "node_to_shape", [], ["to_shape"]),
+      ("Reshape", "reshape", ["x", "to_shape"], ["flatten"]),
+      ("Relu", "relu", ["flatten"], ["y"])],
+     {"shape": [1, 3, 4, 4], "batch": 1, "batch_1d": [1], "to_shape": [1, -1]}),
+    (_multi_outputs_model,
+     [("Constant", "node_bias", [], ["bias"]),
+      ("Constant", "node_w2", [], ["w2"]),
+      ("Constant", "node_w1", [], ["w1"]),
+      ("Constant", "node_w0", [], ["w0"]),
+      ("Constant", "node_w01", [], ["w01"]),
+      ("Mul", "mul", ["x", "w01"], ["mul_out"]),
+      ("Add", "add", ["mul_out", "w2"], ["add_out"]),
+      ("Add", "add_bias", ["add_out", "bias"], ["y"])],
+     {"bias": np.ones((1, 3, 4, 4)).tolist(), "w0": [[[[0, 1, 2, 3]]]], "w1": [[[[4, 5, 6, 7]]]],
+      "w2": [[[[8, 9, 10, 11]]]], "w01": [[[[4, 6, 8, 10]]]]}),
+])
+def test_replace_constant_nodes(model_builder, expected_nodes, expected_constants):
+    """Test constant nodes are replaced in place by Constant nodes of their inferred outputs."""
+    model = model_builder()
+
+    simplify = OnnxSimplify()
+    setattr(simplify, "_onnx_model", model)
+    getattr(simplify, "_get_constant_nodes")()
+    output_nodes = [opt for outputs in getattr(simplify, "_constant_nodes").values() for opt in outputs]
+    feed_dict = {"x": np.random.rand(*INPUT_SHAPE["x"]).astype(np.float32)}
+    setattr(simplify, "_outputs_infer", fetch_output_from_onnx_model(model, feed_dict, output_nodes))
+    getattr(simplify, "_replace_constant_nodes")()
+
+    nodes = getattr(simplify, "_onnx_model").graph.node
+    assert [(node.op_type, node.name, list(node.input), list(node.output)) for node in nodes] == expected_nodes
+    constants = {node.output[0]: onnx.numpy_helper.to_array(node.attribute[0].t).tolist()
+                 for node in nodes if node.op_type == "Constant"}
+    assert constants == expected_constants
+
+
+class TestOptimizerPipeline:
+    """Test optimizer pipeline of OnnxSimplify."""
+
+    def setup_method(self):
+        """Skip if onnxoptimizer is not installed."""
+        pytest.importorskip("onnxoptimizer")
+
+    def test_skip_second_optimization(self):
+        """Test optimizer runs once when no constant node is found."""
+        simplify = OnnxSimplify()
+        with mock.patch.object(OnnxSimplify, "_optimizer", autospec=True,
+                               side_effect=getattr(OnnxSimplify, "_optimizer")) as optimizer:
+            model = simplify.run_onnx_simplify(_nop_nodes_model(), INPUT_SHAPE)
+        assert optimizer.call_count == 1
+        assert [node.op_type for node in model.graph.node] == ["Relu"]
+
+    @pytest.mark.parametrize("model_builder", [_dynamic_reshape_model, _multi_outputs_model, _nop_nodes_model,
+                                               _transposes_model, _fusible_model])
+    def test_pass_timing(self, model_builder, caplog):
+        """Test optimizing pass by pass in debug mode gives the same model as the fixed point optimization."""
+        results = []
+        for level in (logging.INFO, logging.DEBUG):
+            simplify = OnnxSimplify()
+            setattr(simplify, "_onnx_model", model_builder())
+            with caplog.at_level(level, logger=log.name):
+                getattr(simplify, "_optimizer")()
+            results.append(_canonical_names(getattr(simplify, "_onnx_model")))
+        assert results[1] == results[0]
+        for opt_pass in OPTIMIZER_PASSES:
+            assert f"Optimizer pass {opt_pass} costs" in caplog.text
+        if model_builder is _fusible_model:
+            assert [node.op_type for node in getattr(simplify, "_onnx_model").graph.node] == \
+                   ["Squeeze", "Conv", "Unsqueeze", "Squeeze", "Flatten", "Transpose", "MatMul", "Add"]
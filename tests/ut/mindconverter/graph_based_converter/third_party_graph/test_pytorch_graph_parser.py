@@ -0,0 +1,76 @@
+# Copyright 2021 Huawei Technologies Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test PyTorchGraphParser."""
+import multiprocessing as mp
+from unittest import mock
+
+import pytest
+
+from mindinsight.mindconverter.common.exceptions import ModelLoadingError
+from mindinsight.mindconverter.graph_based_converter.third_party_graph.pytorch_graph_parser import \
+    PyTorchGraphParser
+
+onnx = pytest.importorskip("onnx")
+
+
+def _serialized_model():
+    """Return a serialized onnx model, y = relu(x)."""
+    helper = onnx.helper
+    graph = helper.make_graph(
+        [helper.make_node("Relu", ["x"], ["y"], name="relu")], "test_graph",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 4])],
+        [helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 4])]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 11)], ir_version=6)
+    return model.SerializeToString()
+
+
+def _raise_error(*_):
+    """Raise error when exporting."""
+    raise ValueError("torch.nn.DataParallel is not supported by ONNX exporter.")
+
+
+@pytest.mark.skipif(mp.get_start_method() != "fork", reason="Patched exporter is only inherited by forked process.")
+class TestPyTorchGraphParser:
+    """Test exporting onnx model in and out of current process."""
+
+    @pytest.mark.parametrize("in_process", [True, False])
+    def test_convert_pytorch_graph_to_onnx(self, in_process):
+        """Test exported model is the same whether the export is isolated or not."""
+        proto = _serialized_model()
+        with mock.patch.object(PyTorchGraphParser, "_pytorch_graph_to_proto", side_effect=lambda *_: proto):
+            onnx_model = getattr(PyTorchGraphParser, "_convert_pytorch_graph_to_onnx")(
+                "model.pth", {"x": (1, 4)}, opset_version=11, in_process=in_process)
+        assert onnx_model.SerializeToString() == proto
+
+    @pytest.mark.parametrize("in_process", [True, False])
+    def test_export_error(self, in_process):
+        """Test error raised in exporting is propagated as the same type."""
+        with mock.patch.object(PyTorchGraphParser, "_pytorch_graph_to_proto", side_effect=_raise_error):
+            with pytest.raises(ModelLoadingError) as error:
+                getattr(PyTorchGraphParser, "_convert_pytorch_graph_to_onnx")(
+                    "model.pth", {"x": (1, 4)}, opset_version=11, in_process=in_process)
+        assert type(error.value) is ModelLoadingError
+        assert isinstance(error.value.__cause__, ValueError)
+        assert "DataParallel" in str(error.value)
+
+    @pytest.mark.parametrize("in_process", [True, False])
+    def test_export_module_not_found(self, in_process):
+        """Test missing model scripts are propagated for the hint of `--project_path`."""
+        with mock.patch.object(PyTorchGraphParser, "_pytorch_graph_to_proto",
+                               side_effect=ModuleNotFoundError("No module named 'resnet'")):
+            with pytest.raises(ModuleNotFoundError):
+                getattr(PyTorchGraphParser, "_convert_pytorch_graph_to_onnx")(
+                    "model.pth", {"x": (1, 4)}, opset_version=11, in_process=in_process)
@@ -13,10 +13,17 @@
 # limitations under the License.
 # ============================================================================
 """Test config module."""
+import os
+import subprocess
+import sys
+import textwrap
 from collections import OrderedDict
 
+import pasta
 import pytest
 
+from mindinsight.mindconverter import config
+from mindinsight.mindconverter.common.exceptions import NodeTypeNotSupport
 from mindinsight.mindconverter.config import APIPt, REQUIRED
 
 
@@ -50,3 +57,104 @@ class TestAPIBase:
 
         assert parsed_args['in_channels'] == '1'
         assert parsed_args['out_channels'] == '2'
+
+    @pytest.mark.parametrize('source, expected_kernel_size', [
+        ('nn.Conv2d(3, 6,\n          kernel_size=5)', '5'),
+        ('nn.Conv2d(in_channels=3, out_channels=6, kernel_size=(3,\n 3))', '(3, 3)'),
+    ])
+    def test_parse_call_node(self, source, expected_kernel_size):
+        """Test parse arguments from call node, arguments over several lines are formatted into one line."""
+        parameters_spec = OrderedDict(in_channels=REQUIRED, out_channels=REQUIRED, kernel_size=REQUIRED)
+        api_parser = APIPt(self.function_name, parameters_spec)
+        call_node = pasta.parse(source).body[0].value
+
+        assert api_parser.parse_call_node(api_parser.name, call_node) == OrderedDict(
+            [('in_channels', '3'), ('out_channels', '6'), ('kernel_size', expected_kernel_size),
+             ('call_name', api_parser.name)])
+
+    def test_parse_call_node_star_args(self):
+        """Test parse all arguments from call node as one argument."""
+        api_parser = APIPt('.view', OrderedDict([('*shape', REQUIRED)]))
+        call_node = pasta.parse('out.view(out.size(0), -1)').body[0].value
+        parsed_args = api_parser.parse_call_node('out.view', call_node)
+
+        assert parsed_args['*shape'] == 'out.size(0), -1'
+        with pytest.raises(NodeTypeNotSupport):
+            api_parser.parse_call_node('out.view', call_node.func)
+
+
+class TestMappingTables:
+    """Test the lazy loaded mapping tables."""
+
+    def test_import_without_loading(self):
+        """Test importing mindconverter does not read any json file of api mappings."""
+        script = textwrap.dedent("""
+            import os
+            import sys
+
+            opened = []
+            config_files = {'mappings', 'ops'}
+
+            def _audit(event, args):
+                if event == 'open' and isinstance(args[0], str) and args[0].endswith('.json') \\
+                        and os.path.basename(os.path.dirname(args[0])) in config_files:
+                    opened.append(args[0])
+
+            sys.addaudithook(_audit)
+            import mindinsight.mindconverter
+            import mindinsight.mindconverter.cli
+            import mindinsight.mindconverter.ast_edits
+            print(opened)
+            """)
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        output = subprocess.run([sys.executable, "-c", script], cwd=root, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        assert output.strip() == "[]"
+
+    def test_lazy_attributes(self):
+        """Test tables are loaded once and exposed as frozensets."""
+        assert config.ALL_MAPPING is config.get_all_mapping()
+        assert isinstance(config.NN_SUPPORTED, frozenset)
+        assert "nn.Conv2d" in config.NN_SUPPORTED
+        assert "torch.nn.Conv2d" in config.NN_LIST
+        assert "F.relu" in config.ALL_2P_LIST
+        assert config.ALL_SUPPORTED.isdisjoint(config.ALL_UNSUPPORTED)
+        assert config.ALL_SUPPORTED | config.ALL_UNSUPPORTED == config.ALL_TORCH_APIS
+        with pytest.raises(AttributeError):
+            _ = config.NOT_EXISTED_TABLE
+
+
+class TestMappingHelper:
+    """Test the class of MappingHelper."""
+
+    @pytest.mark.parametrize('code, expected', [
+        ('nn.Conv2d(3, 6, 5, stride=1, padding=(1, 1))',
+         "nn.Conv2d(in_channels=3, out_channels=6, kernel_size=5, stride=1, pad_mode='pad', padding=(1, 1), "
+         "has_bias=True)"),
+        ('nn.Conv2d(6, 16, kernel_size=5, bias=False)',
+         "nn.Conv2d(in_channels=6, out_channels=16, kernel_size=5, pad_mode='pad', has_bias=False)"),
+        ('nn.Conv2d(3,\n          6, 5)',
+         "nn.Conv2d(in_channels=3, out_channels=6, kernel_size=5, pad_mode='pad', has_bias=True)"),
+        ('nn.Linear(16 * 5 * 5, 120)', 'nn.Dense(in_channels=16 * 5 * 5, out_channels=120)'),
+        ('nn.Dropout(p=0.5)', 'nn.Dropout(keep_prob=0.5)'),
+        ('F.relu(self.conv1(x))', 'P.ReLU()(self.conv1(x))'),
+        ('F.max_pool2d(out, kernel_size=2)', "P.MaxPool(2, 2, 'valid')(out)"),
+        ('torch.cat((out, out), 1)', 'P.Concat(1)((out, out))'),
+        ('torch.flatten(x, 1)', 'P.Flatten()(x)'),
+    ])
+    def test_convert_call_node(self, code, expected):
+        """Test converting call node to mindspore api."""
+        call_node = pasta.parse(code).body[0].value
+        call_name = pasta.dump(call_node.func)
+        assert config.ALL_MAPPING[call_name].convert_call_node(call_name, call_node) == expected
+
+    @pytest.mark.parametrize('code, expected', [
+        ('nn.BatchNorm2d(16, eps=1e-5, momentum=0.1)', 'nn.BatchNorm2d(num_features=16, eps=1e-5, momentum=0.9)'),
+        ('nn.Conv2d(3, 6, 5, padding=(1,1))',
+         "nn.Conv2d(in_channels=3, out_channels=6, kernel_size=5, pad_mode='pad', padding=(1,1), has_bias=True)"),
+    ])
+    def test_convert_call_node_keep_spelling(self, code, expected):
+        """Test converting call node keeps the source spelling of arguments."""
+        call_node = pasta.parse(code).body[0].value
+        call_name = pasta.dump(call_node.func)
+        assert config.ALL_MAPPING[call_name].convert_call_node(call_name, call_node) == expected
@@ -13,9 +13,19 @@
 # limitations under the License.
 # ============================================================================
 """Test Converter"""
-from mindinsight.mindconverter.converter import Converter
+import json
+import logging
+import os
+import textwrap
+import time
+
+import pytest
+
+from mindinsight.mindconverter.converter import Converter, main, MANIFEST_FILE, MERGED_REPORT_FILE
 from mindinsight.mindconverter.config import NN_MAPPING
 
+logger = logging.getLogger(__name__)
+
 
 class TestConverter:
     """Test Converter"""
@@ -255,3 +265,156 @@ class TestConverter:
         replaced_code = self.converter_ins.convert_api(code)
         assert replaced_code == code.replace('x.permute(2, 0, 1)',
                                              '{}()(x, (2, 0, 1,))'.format(expected_ms_api_name))
+
+
+class TestMain:
+    """Test converting multiple script files."""
+
+    script = textwrap.dedent("""
+        import torch.nn as nn
+        import torch.nn.functional as F
+
+
+        class Net{idx}(nn.Module):
+            def __init__(self):
+                super(Net{idx}, self).__init__()
+                self.conv = nn.Conv2d(3, {idx}, 5)
+                self.fc = nn.Linear({idx}, 10)
+
+            def forward(self, x):
+                out = F.relu(self.conv(x))
+                out = out.view(out.size(0), -1)
+                return self.fc(out)
+        """)
+
+    def _prepare(self, tmp_path, num=4):
+        """Write script files and return files config."""
+        in_dir = tmp_path / "scripts"
+        in_dir.mkdir(parents=True)
+        in_files = []
+        for idx in range(1, num + 1):
+            in_file = in_dir / f"net_{idx}.py"
+            in_file.write_text(self.script.format(idx=idx))
+            in_files.append(str(in_file))
+        out_dir = tmp_path / "output"
+        out_dir.mkdir()
+        return {'in_files': in_files, 'outfile_dir': str(out_dir), 'report_dir': str(out_dir)}
+
+    @staticmethod
+    def _read_outputs(out_dir):
+        """Read converted scripts and reports."""
+        outputs = dict()
+        for name in sorted(os.listdir(out_dir)):
+            with open(os.path.join(out_dir, name)) as file:
+                outputs[name] = file.read()
+        return outputs
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_convert_files(self, tmp_path, jobs):
+        """Test files are converted in order of input and unchanged files are skipped."""
+        serial_config = self._prepare(tmp_path / "serial")
+        main(serial_config)
+
+        files_config = self._prepare(tmp_path / "parallel")
+        files_config['jobs'] = jobs
+        results = main(files_config)
+        assert [result[0] for result in results] == files_config['in_files']
+        assert all(result[1] == "SUCCESS" for result in results)
+        assert self._read_outputs(files_config['outfile_dir']).keys() == \
+               self._read_outputs(serial_config['outfile_dir']).keys()
+        converted = self._read_outputs(files_config['outfile_dir'])
+        for name, content in self._read_outputs(serial_config['outfile_dir']).items():
+            if name.endswith('.py'):
+                assert converted[name] == content
+
+        with open(files_config['in_files'][1], 'a') as file:
+            file.write("\n\nclass Empty:\n    pass\n")
+        results = main(files_config)
+        assert [result[1] for result in results] == ["SKIPPED", "SUCCESS", "SKIPPED", "SKIPPED"]
+        converted = self._read_outputs(files_config['outfile_dir'])
+        assert "class Empty" in converted["net_2.py"]
+        assert converted["net_1.py"] == self._read_outputs(serial_config['outfile_dir'])["net_1.py"]
+
+    def test_convert_files_with_same_name(self, tmp_path):
+        """Test files in sub directories keep relative paths in outputs, reports and manifest."""
+        in_dir = tmp_path / "scripts"
+        in_files = []
+        for idx, sub_dir in enumerate(["b", "a", "a/c"], start=1):
+            (in_dir / sub_dir).mkdir(parents=True)
+            in_file = in_dir / sub_dir / "net.py"
+            in_file.write_text(self.script.format(idx=idx))
+            in_files.append(str(in_file))
+        out_dir = tmp_path / "output"
+        report_dir = tmp_path / "report"
+        files_config = {'root_path': str(in_dir), 'in_files': in_files, 'outfile_dir': str(out_dir),
+                        'report_dir': str(report_dir), 'jobs': 2}
+        rel_paths = [os.path.join(sub_dir, "net.py") for sub_dir in ["b", "a", os.path.join("a", "c")]]
+
+        results = main(files_config)
+        assert [result[1] for result in results] == ["SUCCESS"] * 3
+        for idx, rel_path in enumerate(rel_paths, start=1):
+            assert f"class Net{idx}" in (out_dir / rel_path).read_text()
+            assert (report_dir / os.path.dirname(rel_path) / "report_of_net.txt").is_file()
+        with open(out_dir / MANIFEST_FILE) as file:
+            assert sorted(json.load(file)) == sorted(rel_paths)
+        merged_report = (report_dir / MERGED_REPORT_FILE).read_text()
+        headers = [line for line in merged_report.splitlines() if line.startswith("[SUCCESS] ")]
+        assert headers == [f"[SUCCESS] {rel_path}" for rel_path in rel_paths]
+
+        results = main(files_config)
+        assert [result[1] for result in results] == ["SKIPPED"] * 3
+        headers = [line for line in (report_dir / MERGED_REPORT_FILE).read_text().splitlines()
+                   if line.startswith("[SKIPPED] ")]
+        assert headers == [f"[SKIPPED] {rel_path}" for rel_path in rel_paths]
+
+    def test_report_phase_time(self, tmp_path):
+        """Test elapsed time of each phase is written in conversion report."""
+        files_config = self._prepare(tmp_path, num=1)
+        main(files_config)
+
+        with open(os.path.join(files_config['outfile_dir'], "report_of_net_1.txt")) as file:
+            report = file.read().splitlines()
+        assert report[-1] == '[Convert Over]'
+        assert report[-2].startswith('[Timing] parse: ')
+        for phase in ('analyze', 'convert', 'dump', 'total'):
+            assert f' {phase}: ' in report[-2]
+
+
+@pytest.mark.benchmark
+def test_convert_benchmark(tmp_path):
+    """Measure throughput of converting a 5k-line script."""
+    block = textwrap.dedent("""
+        class Net{idx}(nn.Module):
+            def __init__(self):
+                super(Net{idx}, self).__init__()
+                self.conv1 = nn.Conv2d(3, 6, 5, stride=1, padding=(1, 1))
+                self.bn = nn.BatchNorm2d(6, eps=1e-05, momentum=0.1)
+                self.fc1 = nn.Linear(16 * 5 * 5, 120)
+                self.drop = nn.Dropout(p=0.5)
+
+            def forward(self, x):
+                out = F.max_pool2d(F.relu(self.bn(self.conv1(x))), kernel_size=2)
+                out = out.view(out.size(0), -1)
+                out = torch.cat((out, out), 1)
+                return self.drop(F.relu(self.fc1(out)))
+
+        """)
+    script = ["import torch\nimport torch.nn as nn\nimport torch.nn.functional as F\n\n"]
+    while sum(code.count("\n") for code in script) < 5000:
+        script.append(block.format(idx=len(script)))
+    block_num = len(script) - 1
+    script = "".join(script)
+    lines = script.count("\n")
+    in_file = tmp_path / "net.py"
+    in_file.write_text(script)
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    start = time.perf_counter()
+    Converter().convert(str(in_file), str(output_dir), str(output_dir))
+    cost = time.perf_counter() - start
+    logger.info("Converting %d lines costs %.2fs, %.0f lines/s", lines, cost, lines / cost)
+
+    converted = (output_dir / "net.py").read_text()
+    assert converted.count("nn.Dense(in_channels=16 * 5 * 5, out_channels=120)") == block_num
+    assert converted.count("nn.BatchNorm2d(num_features=6, eps=1e-05, momentum=0.9)") == block_num
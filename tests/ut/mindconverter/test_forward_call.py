@@ -16,6 +16,9 @@
 import ast
 import textwrap
 
+import pasta
+
+from mindinsight.mindconverter.code_analysis import CodeAnalyzer
 from mindinsight.mindconverter.forward_call import ForwardCall
 
 
@@ -70,3 +73,91 @@ class TestForwardCall:
         real_calls = list(forward_call.calls.keys())
         real_calls.sort()
         assert real_calls == expect_calls
+
+    def test_collect_in_code_analyzer(self):
+        """Test forward calls collected along with code analysis are the same as visiting alone."""
+        source = textwrap.dedent("""\
+            import torch.nn as nn
+            import torch.nn.functional as F
+
+
+            def helper(x):
+                return F.relu(x)
+
+
+            class TestNet(nn.Module):
+                def forward(self, x):
+                    out = self.sub(self.conv(x), scale=self.factor(2))
+                    return helper(out) + str(out)
+
+                def sub(self, x, scale=None):
+                    def local(t):
+                        return F.relu(t)
+                    return local(x).view(x.size(0), -1)
+
+                def factor(self, k):
+                    return k * 2
+
+                def unused(self, x):
+                    return F.sigmoid(x)
+        """)
+        ast_tree = pasta.parse(source)
+        expect_calls = ForwardCall(ast_tree).calls
+
+        forward_call = ForwardCall()
+        CodeAnalyzer().process(ast_tree, forward_call)
+
+        assert list(forward_call.calls.items()) == list(expect_calls.items())
+        assert 'TestNet.unused' not in forward_call.calls
+        assert forward_call.calls['TestNet.sub'].name == 'sub'
+
+    def test_code_analysis_unchanged(self):
+        """Test collecting forward calls does not change what code analyzer visits and finds."""
+        source = textwrap.dedent("""\
+            import torch
+            import torch.nn as nn
+            import torch.nn.functional as F
+
+
+            def scale(x):
+                return x * 2
+
+
+            class TestNet(nn.Module):
+                def __init__(self):
+                    super(TestNet, self).__init__()
+                    self.conv = nn.Conv2d(3, 6, 5)
+
+                def forward(self, x):
+                    out = F.relu(self.conv(scale(torch.abs(x))), inplace=self.inplace(x))
+                    return torch.cat((out, F.relu(out)), 1)
+
+                def inplace(self, x):
+                    return False
+        """)
+        ast_tree = pasta.parse(source)
+        results = []
+        for forward_call in (None, ForwardCall()):
+            visited_nodes = []
+            code_analyzer = CodeAnalyzer()
+            visit = code_analyzer.visit
+
+            def _visit(node, visit=visit, visited_nodes=visited_nodes):
+                visited_nodes.append(node)
+                visit(node)
+
+            code_analyzer.visit = _visit
+            code_analyzer.process(ast_tree, forward_call)
+            definitions = code_analyzer.network_definitions()
+            results.append((visited_nodes,
+                            [code_analyzer.get_name(func) for func in definitions['functions']],
+                            {code_analyzer.get_name(cell): [code_analyzer.get_name(func) for func in funcs]
+                             for cell, funcs in definitions['cell'].items()},
+                            sorted(code_analyzer.external_references)))
+
+        assert results[1] == results[0]
+        assert results[0][1:] == ([], {'TestNet': ['TestNet.__init__', 'TestNet.forward']}, ['F', 'nn', 'torch'])
+        # Calls nested in torch calls are not visited by code analyzer, but collected as forward calls.
+        assert not [node for node in results[0][0] if isinstance(node, ast.Call) and pasta.dump(node) == 'torch.abs(x)']
+        assert list(forward_call.calls) == ['TestNet.forward', 'torch.abs', 'scale', 'TestNet.conv',
+                                            'TestNet.inplace', 'F.relu', 'torch.cat']
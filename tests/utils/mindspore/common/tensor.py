@@ -22,6 +22,16 @@ class Tensor:
     def __init__(self, value=0):
         self._value = value
 
+    @property
+    def shape(self):
+        """Get shape of tensor."""
+        return self.asnumpy().shape
+
+    @property
+    def dtype(self):
+        """Get data type of tensor."""
+        return self.asnumpy().dtype
+
     def asnumpy(self):
         """Get value in numpy format."""
         return np.array(self._value)